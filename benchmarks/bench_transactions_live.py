@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
-"""Live benchmark: three approaches to fetching all transactions.
+"""Live benchmark: four approaches to fetching all transactions.
 
 Requires valid .env credentials. Run directly:
 
-    uv run python benchmarks/bench_transactions_live.py
+    uv run python benchmarks/bench_transactions_live.py [--workers N] [--concurrency N]
+
+Per-client approaches fan out one request per client across a thread pool
+of ``--workers`` threads (default 16); ``--workers 1`` fetches serially.
+The async approach gathers every per-client request on one
+AsyncBlestaRequest, with at most ``--concurrency`` (default 20) in flight.
+All per-client approaches share one ``clients/getList`` fetch, reported on
+its own line, so each approach's timing covers only its transaction fetches.
 """
 
+import argparse
+import asyncio
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
 from dotenv import load_dotenv
 
@@ -16,11 +27,35 @@ from blesta_sdk import BlestaRequest
 load_dotenv()
 
 
-def get_api() -> BlestaRequest:
+DEFAULT_WORKERS = 16
+DEFAULT_CONCURRENCY = 20
+
+
+def get_api(workers: int = DEFAULT_WORKERS) -> BlestaRequest:
     url = os.environ["BLESTA_API_URL"]
     user = os.environ["BLESTA_API_USER"]
     key = os.environ["BLESTA_API_KEY"]
-    return BlestaRequest(url, user, key)
+    # Size the connection pool to the worker count so concurrent threads
+    # reuse keep-alive connections instead of discarding overflow ones.
+    return BlestaRequest(url, user, key, pool_maxsize=max(workers, 10))
+
+
+def _client_ids(clients: list[dict]) -> list:
+    return [cid for c in clients if (cid := c.get("id") or c.get("client_id"))]
+
+
+def _fetch_per_client(
+    api: BlestaRequest, method: str, client_ids: list, workers: int
+) -> list:
+    """Fetch ``transactions/<method>`` for every client, *workers* at a time."""
+
+    def fetch(client_id):
+        return api.get_all("transactions", method, {"client_id": client_id})
+
+    if workers <= 1:
+        return list(chain.from_iterable(map(fetch, client_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(chain.from_iterable(executor.map(fetch, client_ids)))
 
 
 def bench_global_getlist(api: BlestaRequest) -> dict:
@@ -31,76 +66,121 @@ def bench_global_getlist(api: BlestaRequest) -> dict:
     return {"method": "global getList", "count": len(txns), "seconds": elapsed}
 
 
-def bench_per_client_getlist(api: BlestaRequest) -> dict:
-    """Approach 2: get all client IDs, then getList per client (20/page)."""
+def fetch_clients(api: BlestaRequest) -> tuple[list[dict], float]:
+    """Fetch ``clients/getList`` once; return ``(clients, seconds)``.
+
+    The client list doesn't change between approaches, so it is fetched
+    once in :func:`main` and shared instead of re-paginated per approach.
+    """
     t0 = time.perf_counter()
     clients = api.get_all("clients", "getList")
-    client_time = time.perf_counter() - t0
-
-    t1 = time.perf_counter()
-    all_txns = []
-    for client in clients:
-        client_id = client.get("id") or client.get("client_id")
-        if not client_id:
-            continue
-        txns = api.get_all("transactions", "getList", {"client_id": client_id})
-        all_txns.extend(txns)
-    txn_time = time.perf_counter() - t1
-
-    total = time.perf_counter() - t0
+    return clients, time.perf_counter() - t0
+
+
+def bench_per_client_getlist(
+    api: BlestaRequest, workers: int, client_ids: list
+) -> dict:
+    """Approach 2: getList per client (20/page) over the shared client list."""
+    t0 = time.perf_counter()
+    all_txns = _fetch_per_client(api, "getList", client_ids, workers)
+    txn_time = time.perf_counter() - t0
     return {
         "method": "per-client getList",
-        "clients": len(clients),
+        "clients": len(client_ids),
         "count": len(all_txns),
-        "client_fetch_seconds": client_time,
         "txn_fetch_seconds": txn_time,
-        "total_seconds": total,
     }
 
 
-def bench_per_client_simplelist(api: BlestaRequest) -> dict:
-    """Approach 3: get all client IDs, then getSimpleList per client.
+def bench_per_client_simplelist(
+    api: BlestaRequest, workers: int, client_ids: list
+) -> dict:
+    """Approach 3: getSimpleList per client over the shared client list.
 
     getSimpleList returns ALL transactions for a client in one request
     (no pagination), with a lighter payload (14 vs 24 fields), and
     includes all statuses (not just approved).
     """
     t0 = time.perf_counter()
-    clients = api.get_all("clients", "getList")
-    client_time = time.perf_counter() - t0
-
-    t1 = time.perf_counter()
-    all_txns = []
-    for client in clients:
-        client_id = client.get("id") or client.get("client_id")
-        if not client_id:
-            continue
-        txns = api.get_all("transactions", "getSimpleList", {"client_id": client_id})
-        all_txns.extend(txns)
-    txn_time = time.perf_counter() - t1
-
-    total = time.perf_counter() - t0
+    all_txns = _fetch_per_client(api, "getSimpleList", client_ids, workers)
+    txn_time = time.perf_counter() - t0
     return {
         "method": "per-client getSimpleList",
-        "clients": len(clients),
+        "clients": len(client_ids),
+        "count": len(all_txns),
+        "txn_fetch_seconds": txn_time,
+    }
+
+
+async def _per_client_simplelist_async(client_ids: list, concurrency: int) -> dict:
+    from blesta_sdk import AsyncBlestaRequest
+
+    url = os.environ["BLESTA_API_URL"]
+    user = os.environ["BLESTA_API_USER"]
+    key = os.environ["BLESTA_API_KEY"]
+    # One shared client so every request reuses the same keep-alive pool.
+    async with AsyncBlestaRequest(
+        url,
+        user,
+        key,
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+    ) as api:
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(client_id):
+            async with sem:
+                return await api.get_all(
+                    "transactions", "getSimpleList", {"client_id": client_id}
+                )
+
+        t0 = time.perf_counter()
+        results = await asyncio.gather(*(one(c) for c in client_ids))
+        all_txns = list(chain.from_iterable(results))
+        txn_time = time.perf_counter() - t0
+
+    return {
+        "method": "async per-client getSimpleList",
+        "clients": len(client_ids),
         "count": len(all_txns),
-        "client_fetch_seconds": client_time,
         "txn_fetch_seconds": txn_time,
-        "total_seconds": total,
     }
 
 
+def bench_per_client_simplelist_async(client_ids: list, concurrency: int) -> dict:
+    """Approach 4: Approach 3 on AsyncBlestaRequest with bounded gather.
+
+    Turns N sequential round-trips into roughly ``ceil(N / concurrency)``
+    rounds of parallel requests.
+    """
+    return asyncio.run(_per_client_simplelist_async(client_ids, concurrency))
+
+
 def print_per_client_result(label: str, r: dict) -> None:
     print(f"  Clients:      {r['clients']}")
     print(f"  Transactions: {r['count']}")
-    print(f"  Client fetch: {r['client_fetch_seconds']:.2f}s")
     print(f"  Txn fetch:    {r['txn_fetch_seconds']:.2f}s")
-    print(f"  Total:        {r['total_seconds']:.2f}s")
 
 
 def main():
-    api = get_api()
-    print(f"API: {api.base_url}\n")
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="threads for per-client fetches (1 = serial, default %(default)s)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="in-flight requests for the async approach (default %(default)s)",
+    )
+    args = parser.parse_args()
+
+    api = get_api(args.workers)
+    print(f"API: {api.base_url}")
+    print(f"Per-client workers: {args.workers}\n")
 
     # --- Approach 1: global getList ---
     print("=" * 60)
@@ -110,12 +190,22 @@ def main():
     print(f"  Transactions: {r1['count']}")
     print(f"  Time:         {r1['seconds']:.2f}s")
 
+    # --- Shared client list for approaches 2-4 ---
+    print()
+    print("=" * 60)
+    print("Shared client fetch: clients/getList (used by approaches 2-4)")
+    print("=" * 60)
+    clients, client_time = fetch_clients(api)
+    client_ids = _client_ids(clients)
+    print(f"  Clients:      {len(clients)}")
+    print(f"  Time:         {client_time:.2f}s")
+
     # --- Approach 2: per-client getList ---
     print()
     print("=" * 60)
     print("Approach 2: per-client getList (status=approved, 20/page)")
     print("=" * 60)
-    r2 = bench_per_client_getlist(api)
+    r2 = bench_per_client_getlist(api, args.workers, client_ids)
     print_per_client_result("per-client getList", r2)
 
     # --- Approach 3: per-client getSimpleList ---
@@ -123,24 +213,31 @@ def main():
     print("=" * 60)
     print("Approach 3: per-client getSimpleList (all statuses, no paging)")
     print("=" * 60)
-    r3 = bench_per_client_simplelist(api)
+    r3 = bench_per_client_simplelist(api, args.workers, client_ids)
     print_per_client_result("per-client getSimpleList", r3)
 
+    # --- Approach 4: async per-client getSimpleList ---
+    print()
+    print("=" * 60)
+    print(f"Approach 4: async per-client getSimpleList ({args.concurrency} in flight)")
+    print("=" * 60)
+    r4 = bench_per_client_simplelist_async(client_ids, args.concurrency)
+    print_per_client_result("async per-client getSimpleList", r4)
+
     # --- Comparison ---
     print()
     print("=" * 60)
-    print("Comparison")
+    print("Comparison (per-client totals include the shared client fetch)")
     print("=" * 60)
-    results = [
-        ("global getList", r1["seconds"], r1["count"]),
-        ("per-client getList", r2["total_seconds"], r2["count"]),
-        ("per-client getSimpleList", r3["total_seconds"], r3["count"]),
+    results = [("global getList", r1["seconds"], r1["count"])] + [
+        (r["method"], client_time + r["txn_fetch_seconds"], r["count"])
+        for r in (r2, r3, r4)
     ]
     fastest = min(results, key=lambda x: x[1])
     for name, secs, count in results:
         ratio = secs / fastest[1] if fastest[1] > 0 else 0
         marker = " <-- fastest" if name == fastest[0] else ""
-        print(f"  {name:30s} {secs:7.2f}s  ({count:,} txns)  {ratio:.1f}x{marker}")
+        print(f"  {name:32s} {secs:7.2f}s  ({count:,} txns)  {ratio:.1f}x{marker}")
 
     # Note about count differences
     counts = {r[2] for r in results}
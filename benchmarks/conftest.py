@@ -1,12 +1,60 @@
-"""Shared fixtures for benchmarks — synthetic payloads at realistic sizes."""
+"""Shared fixtures for benchmarks — synthetic payloads at realistic sizes.
 
-import json
+The session also raises the open-file soft limit (``RLIMIT_NOFILE``)
+towards the hard limit. The mocked suites open no sockets, but latency
+runs pointed at a real server with a large ``max_concurrency`` or
+``max_connections`` otherwise hit the common 1024-descriptor default,
+and the kernel starts refusing connections long before the SDK
+saturates.
+"""
+
+import asyncio
+import contextlib
+from functools import cache
+from typing import Any
 
 import pytest
 
+from blesta_sdk.core.jsonutil import dumps
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows, or not installed
+    uvloop = None  # type: ignore[assignment]
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+HAS_EAGER_TASKS = hasattr(asyncio, "eager_task_factory")  # Python 3.12+
+
+
+def new_event_loop(eager: bool = False) -> asyncio.AbstractEventLoop:
+    """Create the event loop async benchmarks run on.
+
+    Uses uvloop's libuv-backed loop when it is installed, so scheduling
+    overhead in the latency benchmarks reflects a production-grade loop;
+    falls back to the stdlib loop otherwise.
 
+    :param eager: Install :func:`asyncio.eager_task_factory` so tasks run
+        synchronously until their first real suspension. Callers should
+        skip when :data:`HAS_EAGER_TASKS` is false.
+    """
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    if eager:
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+@cache
 def make_json_payload(n_items: int) -> str:
-    """Simulate a paginated JSON response with n_items."""
+    """Simulate a paginated JSON response with n_items.
+
+    Memoized per size so parametrized fixtures and module-level constants
+    share one serialized payload instead of rebuilding it per test.
+    """
     items = [
         {
             "id": i,
@@ -23,11 +71,12 @@ def make_json_payload(n_items: int) -> str:
         }
         for i in range(n_items)
     ]
-    return json.dumps({"response": items})
+    return dumps({"response": items})
 
 
+@cache
 def make_csv_payload(n_rows: int) -> str:
-    """Simulate a CSV report with n_rows."""
+    """Simulate a CSV report with n_rows (memoized per size)."""
     header = "Package,Revenue,Tax,Total,Date,Client,Status"
     rows = [
         f"Package_{i},{i * 10.5},{i * 1.2},{i * 11.7},"
@@ -37,6 +86,51 @@ def make_csv_payload(n_rows: int) -> str:
     return header + "\n" + "\n".join(rows)
 
 
+class StubResponse:
+    """Minimal stand-in for ``requests.Response`` — only what the SDK reads."""
+
+    __slots__ = ("text", "status_code", "headers")
+
+    def __init__(self, text: str, status_code: int) -> None:
+        self.text = text
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+
+
+class CyclingResponder:
+    """Callable that returns the next response from a fixed cycle.
+
+    A plain replacement for ``Mock(side_effect=cycle(...))``: no call
+    recording or spec checks, so mock bookkeeping doesn't end up being
+    what the benchmark measures. Responses are served from a tuple by
+    index (wrapping at the end) rather than a ``cycle`` iterator, so the
+    response for a given call number is deterministic.
+    """
+
+    __slots__ = ("_responses", "_n", "_i")
+
+    def __init__(self, responses: list[Any]) -> None:
+        self._responses = tuple(responses)
+        self._n = len(self._responses)
+        self._i = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        i = self._i
+        self._i = i + 1 if i + 1 < self._n else 0
+        return self._responses[i]
+
+
+class AsyncCyclingResponder(CyclingResponder):
+    """Async variant of :class:`CyclingResponder` for ``httpx.AsyncClient``."""
+
+    __slots__ = ()
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        i = self._i
+        self._i = i + 1 if i + 1 < self._n else 0
+        return self._responses[i]
+
+
 @pytest.fixture(params=[10, 100, 1000], ids=["10items", "100items", "1000items"])
 def json_payload(request):
     """Parametrized JSON payload fixture."""
@@ -47,3 +141,35 @@ def json_payload(request):
 def csv_payload(request):
     """Parametrized CSV payload fixture."""
     return make_csv_payload(request.param)
+
+
+@pytest.fixture(scope="session")
+def run_async():
+    """Run coroutines on one event loop shared by the whole benchmark session.
+
+    ``asyncio.run()`` creates and tears down a loop per call, which dwarfs
+    the SDK work being measured. Benchmarks call ``run_async(coro)``
+    instead so loop setup is paid once per session. This is a plain
+    fixture rather than pytest-asyncio's loop: pytest-benchmark calls its
+    target synchronously, so the loop must not already be running.
+    """
+    loop = new_event_loop()
+    yield loop.run_until_complete
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _raise_fd_limit():
+    """Raise the open-file soft limit to ``min(hard, 65536)`` for the session."""
+    if resource is None:
+        yield
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = 65536 if hard == resource.RLIM_INFINITY else min(hard, 65536)
+    if soft != resource.RLIM_INFINITY and soft < target:
+        # macOS may reject values below the reported hard limit.
+        with contextlib.suppress(ValueError, OSError):
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+    yield
+    resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
@@ -1,46 +1,93 @@
 """Benchmarks for AsyncBlestaRequest — mocked network, measures SDK overhead.
 
-Mirrors test_bench_client.py for the async client. Uses asyncio.run()
-inside benchmark calls since pytest-benchmark doesn't natively support
-async functions.
+Mirrors test_bench_client.py for the async client. pytest-benchmark
+doesn't natively support async functions, so each benchmark drives its
+coroutine through the session-scoped ``run_async`` fixture, which reuses
+one event loop instead of paying for ``asyncio.run()`` loop setup every
+round. The client is shared by the whole module, and each test installs
+its mocked transport and pre-built httpx.Response objects outside the
+measured callable, so only the SDK call itself is timed.
 
 Run:
     uv run pytest benchmarks/test_bench_async_client.py -v --benchmark-sort=mean
 """
 
-import asyncio
-import json
-from itertools import cycle
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import httpx
 import pytest
 
-from benchmarks.conftest import make_json_payload
+from benchmarks.conftest import AsyncCyclingResponder, make_json_payload
 from blesta_sdk import AsyncBlestaRequest
+from blesta_sdk.core.jsonutil import dumps
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-_PAGE_25 = make_json_payload(25)
-_PAGE_200 = make_json_payload(200)
-_PAGE_1 = make_json_payload(1)
-_EMPTY = json.dumps({"response": []})
-_PAGE_EMPTY_500 = json.dumps({"response": []})
-_CSV_REPORT = "Package,Revenue\nPkg1,100\nPkg2,200"
+# Payloads are encoded to bytes once at import so building an httpx.Response
+# stores them as-is instead of re-encoding a str for every response.
+_PAGE_25 = make_json_payload(25).encode()
+_PAGE_200 = make_json_payload(200).encode()
+_PAGE_1 = make_json_payload(1).encode()
+_EMPTY = dumps({"response": []}).encode()
+_PAGE_EMPTY_500 = dumps({"response": []}).encode()
+_COUNT = dumps({"response": 22376}).encode()
+_CSV_REPORT = b"Package,Revenue\nPkg1,100\nPkg2,200"
 
+_JSON_HEADERS = {"content-type": "application/json; charset=utf-8"}
 
-def _make_httpx_response(text: str, status_code: int) -> httpx.Response:
-    """Build a real httpx.Response with the given text and status."""
-    resp = httpx.Response(status_code, text=text)
-    return resp
 
+def _make_httpx_response(body: bytes, status_code: int) -> httpx.Response:
+    """Build a real httpx.Response from a pre-encoded body."""
+    return httpx.Response(status_code, content=body, headers=_JSON_HEADERS)
 
-def _cycling_async_mock(pattern: list[tuple[str, int]]) -> AsyncMock:
-    """Return an AsyncMock whose side_effect cycles through (text, status) pairs."""
-    responses = [_make_httpx_response(t, s) for t, s in pattern]
-    return AsyncMock(side_effect=cycle(responses))
+
+def _cycling_async_mock(pattern: list[tuple[bytes, int]]) -> AsyncCyclingResponder:
+    """Return an async callable that cycles through (body, status) responses."""
+    return AsyncCyclingResponder([_make_httpx_response(t, s) for t, s in pattern])
+
+
+async def _no_sleep(_delay: float) -> None:
+    """Stand-in for ``asyncio.sleep`` that records nothing."""
+
+
+class _ModelDispatcher:
+    """Async transport that routes each GET to a per-model responder.
+
+    A single shared cycle hands responses out in call order, so under
+    ``asyncio.gather`` one target can receive another target's empty
+    sentinel page and stop early. Routing by the model segment of the URL
+    (``.../<model>/<method>.json``) gives every target its own page
+    sequence, so extract() fan-out is measured as it would really run.
+    """
+
+    def __init__(self, responders: dict[str, AsyncCyclingResponder]) -> None:
+        self._responders = responders
+
+    async def __call__(self, url: str, *args, **kwargs) -> httpx.Response:
+        model = url.rsplit("/", 2)[-2]
+        return await self._responders[model](url, *args, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def api(run_async):
+    """One client shared by every benchmark in this module.
+
+    Tests install their own transport on ``api.client`` before timing, so
+    the ``httpx.AsyncClient`` setup is paid once per module.
+    """
+    client = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
+    yield client
+    run_async(client.close())
+
+
+@pytest.fixture(scope="module")
+def retry_api(run_async):
+    """Shared client with ``max_retries=3`` for the retry benchmarks."""
+    client = AsyncBlestaRequest("https://test.example.com/api", "u", "k", max_retries=3)
+    yield client
+    run_async(client.close())
 
 
 # ---------------------------------------------------------------------------
@@ -51,25 +98,15 @@ def _cycling_async_mock(pattern: list[tuple[str, int]]) -> AsyncMock:
 class TestAsyncSubmitOverhead:
     """Measure per-request SDK overhead (URL build + response wrap)."""
 
-    def test_get_overhead(self, benchmark):
-        def run():
-            api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
-            mock = AsyncMock(return_value=_make_httpx_response(_PAGE_25, 200))
-            with patch.object(api.client, "get", mock):
-                return asyncio.run(api.get("transactions", "getList"))
+    def test_get_overhead(self, benchmark, run_async, api):
+        api.client.get = _cycling_async_mock([(_PAGE_25, 200)])
+        benchmark(lambda: run_async(api.get("transactions", "getList")))
 
-        benchmark(run)
-
-    def test_post_overhead(self, benchmark):
-        def run():
-            api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
-            mock = AsyncMock(return_value=_make_httpx_response(_PAGE_1, 200))
-            with patch.object(api.client, "post", mock):
-                return asyncio.run(
-                    api.post("transactions", "create", {"amount": "100.00"})
-                )
-
-        benchmark(run)
+    def test_post_overhead(self, benchmark, run_async, api):
+        api.client.post = _cycling_async_mock([(_PAGE_1, 200)])
+        benchmark(
+            lambda: run_async(api.post("transactions", "create", {"amount": "100.00"}))
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -81,46 +118,26 @@ class TestAsyncPagination:
     """Measure async pagination loop overhead with mocked pages."""
 
     @pytest.mark.parametrize("pages", [5, 20, 50], ids=["5pg", "20pg", "50pg"])
-    def test_get_all(self, benchmark, pages):
+    def test_get_all(self, benchmark, run_async, api, pages):
         pattern = [(_PAGE_25, 200)] * pages + [(_EMPTY, 200)]
+        api.client.get = _cycling_async_mock(pattern)
+        benchmark(lambda: run_async(api.get_all("transactions", "getList")))
 
-        def run():
-            api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
-            mock = _cycling_async_mock(pattern)
-            with patch.object(api.client, "get", mock):
-                return asyncio.run(api.get_all("transactions", "getList"))
-
-        benchmark(run)
-
-    def test_iter_all_consumed(self, benchmark):
+    def test_iter_all_consumed(self, benchmark, run_async, api):
         """iter_all consumed into list — should match get_all overhead."""
         pattern = [(_PAGE_25, 200)] * 10 + [(_EMPTY, 200)]
+        api.client.get = _cycling_async_mock(pattern)
 
-        def run():
-            api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
-            mock = _cycling_async_mock(pattern)
+        async def consume():
+            return [item async for item in api.iter_all("transactions", "getList")]
 
-            async def consume():
-                with patch.object(api.client, "get", mock):
-                    return [
-                        item async for item in api.iter_all("transactions", "getList")
-                    ]
+        benchmark(lambda: run_async(consume()))
 
-            return asyncio.run(consume())
-
-        benchmark(run)
-
-    def test_pagination_large_pages(self, benchmark):
+    def test_pagination_large_pages(self, benchmark, run_async, api):
         """Fewer pages with more items — tests list extension overhead."""
         pattern = [(_PAGE_200, 200)] * 5 + [(_EMPTY, 200)]
-
-        def run():
-            api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
-            mock = _cycling_async_mock(pattern)
-            with patch.object(api.client, "get", mock):
-                return asyncio.run(api.get_all("transactions", "getList"))
-
-        benchmark(run)
+        api.client.get = _cycling_async_mock(pattern)
+        benchmark(lambda: run_async(api.get_all("transactions", "getList")))
 
 
 # ---------------------------------------------------------------------------
@@ -132,19 +149,14 @@ class TestAsyncExtract:
     """Measure async extract() with varying target counts."""
 
     @pytest.mark.parametrize("targets", [1, 3, 5, 10], ids=["1t", "3t", "5t", "10t"])
-    def test_extract_targets(self, benchmark, targets):
+    def test_extract_targets(self, benchmark, run_async, api, targets):
         # Each target: 3 data pages + 1 empty sentinel = 4 responses
         single = [(_PAGE_25, 200)] * 3 + [(_EMPTY, 200)]
-        pattern = single * targets
-
-        def run():
-            api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
-            mock = _cycling_async_mock(pattern)
-            target_list = [(f"model{i}", "getList") for i in range(targets)]
-            with patch.object(api.client, "get", mock):
-                return asyncio.run(api.extract(target_list))
-
-        benchmark(run)
+        target_list = [(f"model{i}", "getList") for i in range(targets)]
+        api.client.get = _ModelDispatcher(
+            {model: _cycling_async_mock(single) for model, _ in target_list}
+        )
+        benchmark(lambda: run_async(api.extract(target_list)))
 
 
 # ---------------------------------------------------------------------------
@@ -155,16 +167,9 @@ class TestAsyncExtract:
 class TestAsyncCount:
     """Measure async count() overhead."""
 
-    def test_count_overhead(self, benchmark):
-        resp = _make_httpx_response(json.dumps({"response": 22376}), 200)
-
-        def run():
-            api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
-            mock = AsyncMock(return_value=resp)
-            with patch.object(api.client, "get", mock):
-                return asyncio.run(api.count("transactions"))
-
-        benchmark(run)
+    def test_count_overhead(self, benchmark, run_async, api):
+        api.client.get = _cycling_async_mock([(_COUNT, 200)])
+        benchmark(lambda: run_async(api.count("transactions")))
 
 
 # ---------------------------------------------------------------------------
@@ -175,46 +180,21 @@ class TestAsyncCount:
 class TestAsyncRetry:
     """Measure async retry loop overhead (asyncio.sleep is mocked out)."""
 
-    def test_retry_success_after_2(self, benchmark):
+    def test_retry_success_after_2(self, benchmark, run_async, retry_api):
         pattern = [(_PAGE_EMPTY_500, 500), (_PAGE_EMPTY_500, 502), (_PAGE_25, 200)]
+        retry_api.client.get = _cycling_async_mock(pattern)
+        with patch("blesta_sdk._async_client.asyncio.sleep", new=_no_sleep):
+            benchmark(lambda: run_async(retry_api.get("transactions", "getList")))
 
-        def run():
-            api = AsyncBlestaRequest(
-                "https://test.example.com/api", "u", "k", max_retries=3
-            )
-            mock = _cycling_async_mock(pattern)
-            with (
-                patch.object(api.client, "get", mock),
-                patch("blesta_sdk._async_client.asyncio.sleep", new_callable=AsyncMock),
-            ):
-                return asyncio.run(api.get("transactions", "getList"))
-
-        benchmark(run)
-
-    def test_retry_all_fail(self, benchmark):
-        def run():
-            api = AsyncBlestaRequest(
-                "https://test.example.com/api", "u", "k", max_retries=3
-            )
-            mock = AsyncMock(return_value=_make_httpx_response(_PAGE_EMPTY_500, 500))
-            with (
-                patch.object(api.client, "get", mock),
-                patch("blesta_sdk._async_client.asyncio.sleep", new_callable=AsyncMock),
-            ):
-                return asyncio.run(api.get("transactions", "getList"))
+    def test_retry_all_fail(self, benchmark, run_async, retry_api):
+        retry_api.client.get = _cycling_async_mock([(_PAGE_EMPTY_500, 500)])
+        with patch("blesta_sdk._async_client.asyncio.sleep", new=_no_sleep):
+            benchmark(lambda: run_async(retry_api.get("transactions", "getList")))
 
-        benchmark(run)
-
-    def test_no_retry_baseline(self, benchmark):
+    def test_no_retry_baseline(self, benchmark, run_async, api):
         """Baseline: max_retries=0, no retry overhead."""
-
-        def run():
-            api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
-            mock = AsyncMock(return_value=_make_httpx_response(_PAGE_25, 200))
-            with patch.object(api.client, "get", mock):
-                return asyncio.run(api.get("transactions", "getList"))
-
-        benchmark(run)
+        api.client.get = _cycling_async_mock([(_PAGE_25, 200)])
+        benchmark(lambda: run_async(api.get("transactions", "getList")))
 
 
 # ---------------------------------------------------------------------------
@@ -226,15 +206,11 @@ class TestAsyncReportSeries:
     """Measure async get_report_series with mocked monthly reports."""
 
     @pytest.mark.parametrize("months", [3, 6, 12], ids=["3mo", "6mo", "12mo"])
-    def test_report_series(self, benchmark, months):
+    def test_report_series(self, benchmark, run_async, api, months):
         end_map = {3: "2025-03", 6: "2025-06", 12: "2025-12"}
-
-        def run():
-            api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
-            mock = AsyncMock(return_value=_make_httpx_response(_CSV_REPORT, 200))
-            with patch.object(api.client, "get", mock):
-                return asyncio.run(
-                    api.get_report_series("package_revenue", "2025-01", end_map[months])
-                )
-
-        benchmark(run)
+        api.client.get = _cycling_async_mock([(_CSV_REPORT, 200)])
+        benchmark(
+            lambda: run_async(
+                api.get_report_series("package_revenue", "2025-01", end_map[months])
+            )
+        )
@@ -10,16 +10,21 @@ Run:
 """
 
 import asyncio
-import json
 import time
-from itertools import cycle
-from unittest.mock import AsyncMock, Mock, patch
+from typing import Any
 
 import httpx
 import pytest
 
-from benchmarks.conftest import make_json_payload
+from benchmarks.conftest import (
+    HAS_EAGER_TASKS,
+    CyclingResponder,
+    StubResponse,
+    make_json_payload,
+    new_event_loop,
+)
 from blesta_sdk import AsyncBlestaRequest, BlestaRequest
+from blesta_sdk.core.jsonutil import dumps
 
 # ---------------------------------------------------------------------------
 # Latency injection helpers
@@ -27,51 +32,112 @@ from blesta_sdk import AsyncBlestaRequest, BlestaRequest
 
 _CSV_REPORT = "Package,Revenue\nPkg1,100\nPkg2,200"
 _PAGE_25 = make_json_payload(25)
-_EMPTY = json.dumps({"response": []})
+_EMPTY = dumps({"response": []})
 
 
-def _sync_delayed_response(text: str, status_code: int, delay: float) -> Mock:
-    """Return a Mock whose call triggers time.sleep(delay) then returns a response."""
-    resp = Mock(text=text, status_code=status_code)
+class _Delayed(CyclingResponder):
+    """Sleep *delay* with ``time.sleep``, then return the next response.
+
+    A plain callable rather than ``Mock(side_effect=...)``, so call
+    recording doesn't add to the latency being measured.
+    """
+
+    __slots__ = ("_delay",)
+
+    def __init__(self, responses: list[Any], delay: float) -> None:
+        super().__init__(responses)
+        self._delay = delay
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        time.sleep(self._delay)
+        i = self._i
+        self._i = i + 1 if i + 1 < self._n else 0
+        return self._responses[i]
+
+
+class _AsyncDelayed(_Delayed):
+    """Async variant of :class:`_Delayed` using ``asyncio.sleep``."""
+
+    __slots__ = ()
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        await asyncio.sleep(self._delay)
+        i = self._i
+        self._i = i + 1 if i + 1 < self._n else 0
+        return self._responses[i]
 
-    def side_effect(*args, **kwargs):
-        time.sleep(delay)
-        return resp
 
-    return Mock(side_effect=side_effect)
+def _model(url: str) -> str:
+    """Return the model segment of ``.../api/<model>/<method>.json``."""
+    return url.rsplit("/", 2)[1]
 
 
-def _sync_cycling_delayed(pattern: list[tuple[str, int]], delay: float) -> Mock:
-    """Return a Mock that cycles through (text, status) with delay per call."""
-    responses = cycle([Mock(text=t, status_code=s) for t, s in pattern])
+class _ByModel:
+    """Dispatch each request to a per-model responder.
+
+    Concurrent targets interleave their calls, so one shared cycle would
+    hand one target's end-of-data page to another. Routing by model keeps
+    each target's page sequence intact.
+    """
+
+    __slots__ = ("_routes",)
+
+    def __init__(self, routes: dict[str, Any]) -> None:
+        self._routes = routes
+
+    def __call__(self, url: str, *args: Any, **kwargs: Any) -> Any:
+        return self._routes[_model(url)](url, *args, **kwargs)
 
-    def side_effect(*args, **kwargs):
-        time.sleep(delay)
-        return next(responses)
 
-    return Mock(side_effect=side_effect)
+def _sync_delayed(pattern: list[tuple[str, int]], delay: float) -> _Delayed:
+    """Cycle through (text, status) with a blocking delay per call."""
+    return _Delayed([StubResponse(t, s) for t, s in pattern], delay)
 
 
-def _async_delayed_response(text: str, status_code: int, delay: float) -> AsyncMock:
-    """Return an AsyncMock with asyncio.sleep(delay) before returning."""
-    resp = httpx.Response(status_code, text=text)
+def _async_delayed(pattern: list[tuple[str, int]], delay: float) -> _AsyncDelayed:
+    """Cycle through (text, status) with an ``asyncio.sleep`` per call."""
+    return _AsyncDelayed([httpx.Response(s, text=t) for t, s in pattern], delay)
 
-    async def side_effect(*args, **kwargs):
-        await asyncio.sleep(delay)
-        return resp
 
-    return AsyncMock(side_effect=side_effect)
+# Gather-heavy tests run with eager task scheduling by default and also
+# lazily, so the delta is visible side by side.
+_TASK_FACTORY = pytest.mark.parametrize("eager", [True, False], ids=["eager", "lazy"])
 
 
-def _async_cycling_delayed(pattern: list[tuple[str, int]], delay: float) -> AsyncMock:
-    """Return an AsyncMock that cycles through (text, status) with delay."""
-    responses = cycle([httpx.Response(s, text=t) for t, s in pattern])
+@pytest.fixture(scope="module")
+def api():
+    """Sync client shared by every benchmark in this module."""
+    with BlestaRequest("https://test.example.com/api", "u", "k") as client:
+        yield client
 
-    async def side_effect(*args, **kwargs):
-        await asyncio.sleep(delay)
-        return next(responses)
 
-    return AsyncMock(side_effect=side_effect)
+@pytest.fixture(scope="module")
+def async_env():
+    """Return ``(run_async, api)`` for a task-factory mode, built once per module.
+
+    Each mode gets its own event loop and its own AsyncBlestaRequest (the
+    client's semaphore binds to the loop it first waits on), both reused
+    by every test in the module and closed at teardown. Eager mode skips
+    before Python 3.12.
+    """
+    envs: dict[bool, tuple[asyncio.AbstractEventLoop, AsyncBlestaRequest]] = {}
+
+    def get(eager: bool = False):
+        if eager and not HAS_EAGER_TASKS:
+            pytest.skip("asyncio.eager_task_factory requires Python 3.12+")
+        if eager not in envs:
+            envs[eager] = (
+                new_event_loop(eager=eager),
+                AsyncBlestaRequest("https://test.example.com/api", "u", "k"),
+            )
+        loop, client = envs[eager]
+        return loop.run_until_complete, client
+
+    yield get
+    for loop, client in envs.values():
+        loop.run_until_complete(client.close())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
 
 
 # ---------------------------------------------------------------------------
@@ -82,53 +148,51 @@ def _async_cycling_delayed(pattern: list[tuple[str, int]], delay: float) -> Asyn
 class TestReportSeriesLatency:
     """Compare sequential vs concurrent report fetching over 12 months.
 
-    Expected: sync ~= 12*delay, async sequential ~= 12*delay,
-    async concurrent ~= 1*delay.
+    Expected: sync ~= 12*delay, sync thread pool ~= 2*delay (10 workers),
+    async sequential ~= 12*delay, async concurrent ~= 1*delay.
     """
 
     @pytest.mark.parametrize("delay", [0.05, 0.1, 0.2], ids=["50ms", "100ms", "200ms"])
-    def test_sync_sequential(self, benchmark, delay):
+    def test_sync_sequential(self, benchmark, api, delay):
         """Baseline: sync get_report_series — 12 sequential requests."""
-        api = BlestaRequest("https://test.example.com/api", "u", "k")
-        mock = _sync_delayed_response(_CSV_REPORT, 200, delay)
-        with patch.object(api.session, "get", mock):
-            benchmark(api.get_report_series, "package_revenue", "2025-01", "2025-12")
+        api.session.get = _sync_delayed([(_CSV_REPORT, 200)], delay)
+        benchmark(api.get_report_series, "package_revenue", "2025-01", "2025-12")
+
+    @pytest.mark.parametrize("delay", [0.05, 0.1, 0.2], ids=["50ms", "100ms", "200ms"])
+    def test_sync_thread_pool(self, benchmark, api, delay):
+        """Sync get_report_series_concurrent — 12 months across 10 threads."""
+        api.session.get = _sync_delayed([(_CSV_REPORT, 200)], delay)
+        benchmark(
+            api.get_report_series_concurrent,
+            "package_revenue",
+            "2025-01",
+            "2025-12",
+        )
 
     @pytest.mark.parametrize("delay", [0.05, 0.1, 0.2], ids=["50ms", "100ms", "200ms"])
-    def test_async_sequential(self, benchmark, delay):
+    def test_async_sequential(self, benchmark, async_env, delay):
         """Async get_report_series — still sequential (12 serial awaits)."""
-        loop = asyncio.new_event_loop()
-        api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
-        mock = _async_delayed_response(_CSV_REPORT, 200, delay)
-
-        with patch.object(api.client, "get", mock):
-            benchmark(
-                lambda: loop.run_until_complete(
-                    api.get_report_series("package_revenue", "2025-01", "2025-12")
-                )
+        run_async, api = async_env()
+        api.client.get = _async_delayed([(_CSV_REPORT, 200)], delay)
+        benchmark(
+            lambda: run_async(
+                api.get_report_series("package_revenue", "2025-01", "2025-12")
             )
-
-        loop.run_until_complete(api.close())
-        loop.close()
+        )
 
     @pytest.mark.parametrize("delay", [0.05, 0.1, 0.2], ids=["50ms", "100ms", "200ms"])
-    def test_async_concurrent(self, benchmark, delay):
+    @_TASK_FACTORY
+    def test_async_concurrent(self, benchmark, async_env, delay, eager):
         """Async get_report_series_concurrent — all 12 months in parallel."""
-        loop = asyncio.new_event_loop()
-        api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
-        mock = _async_delayed_response(_CSV_REPORT, 200, delay)
-
-        with patch.object(api.client, "get", mock):
-            benchmark(
-                lambda: loop.run_until_complete(
-                    api.get_report_series_concurrent(
-                        "package_revenue", "2025-01", "2025-12"
-                    )
+        run_async, api = async_env(eager)
+        api.client.get = _async_delayed([(_CSV_REPORT, 200)], delay)
+        benchmark(
+            lambda: run_async(
+                api.get_report_series_concurrent(
+                    "package_revenue", "2025-01", "2025-12"
                 )
             )
-
-        loop.run_until_complete(api.close())
-        loop.close()
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -152,27 +216,22 @@ class TestExtractLatency:
     ]
 
     @pytest.mark.parametrize("delay", [0.05, 0.1], ids=["50ms", "100ms"])
-    def test_sync_5_targets(self, benchmark, delay):
+    def test_sync_5_targets(self, benchmark, api, delay):
         """Sync extract — 5 targets x (3 data pages + 1 empty) = 20 requests."""
-        api = BlestaRequest("https://test.example.com/api", "u", "k")
         pattern = [(_PAGE_25, 200)] * 3 + [(_EMPTY, 200)]
-        mock = _sync_cycling_delayed(pattern * 5, delay)
-        with patch.object(api.session, "get", mock):
-            benchmark(api.extract, self.TARGETS)
+        api.session.get = _sync_delayed(pattern, delay)
+        benchmark(api.extract, self.TARGETS)
 
     @pytest.mark.parametrize("delay", [0.05, 0.1], ids=["50ms", "100ms"])
-    def test_async_5_targets(self, benchmark, delay):
+    @_TASK_FACTORY
+    def test_async_5_targets(self, benchmark, async_env, delay, eager):
         """Async extract — 5 targets gathered, each paginating 4 requests."""
-        loop = asyncio.new_event_loop()
-        api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
+        run_async, api = async_env(eager)
         pattern = [(_PAGE_25, 200)] * 3 + [(_EMPTY, 200)]
-        mock = _async_cycling_delayed(pattern * 5, delay)
-
-        with patch.object(api.client, "get", mock):
-            benchmark(lambda: loop.run_until_complete(api.extract(self.TARGETS)))
-
-        loop.run_until_complete(api.close())
-        loop.close()
+        api.client.get = _ByModel(
+            {model: _async_delayed(pattern, delay) for model, _ in self.TARGETS}
+        )
+        benchmark(lambda: run_async(api.extract(self.TARGETS)))
 
 
 # ---------------------------------------------------------------------------
@@ -189,56 +248,43 @@ class TestPaginationBatchLatency:
     """
 
     @pytest.mark.parametrize("delay", [0.05, 0.1], ids=["50ms", "100ms"])
-    def test_sync_sequential_50_pages(self, benchmark, delay):
+    def test_sync_sequential_50_pages(self, benchmark, api, delay):
         """Sync get_all — 51 sequential requests."""
-        api = BlestaRequest("https://test.example.com/api", "u", "k")
         pattern = [(_PAGE_25, 200)] * 50 + [(_EMPTY, 200)]
-        mock = _sync_cycling_delayed(pattern, delay)
-        with patch.object(api.session, "get", mock):
-            benchmark(api.get_all, "transactions", "getList")
+        api.session.get = _sync_delayed(pattern, delay)
+        benchmark(api.get_all, "transactions", "getList")
 
     @pytest.mark.parametrize("delay", [0.05, 0.1], ids=["50ms", "100ms"])
-    def test_async_sequential_50_pages(self, benchmark, delay):
+    def test_async_sequential_50_pages(self, benchmark, async_env, delay):
         """Async get_all — 51 sequential awaits."""
-        loop = asyncio.new_event_loop()
-        api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
+        run_async, api = async_env()
         pattern = [(_PAGE_25, 200)] * 50 + [(_EMPTY, 200)]
-        mock = _async_cycling_delayed(pattern, delay)
-
-        with patch.object(api.client, "get", mock):
-            benchmark(
-                lambda: loop.run_until_complete(api.get_all("transactions", "getList"))
-            )
-
-        loop.run_until_complete(api.close())
-        loop.close()
+        api.client.get = _async_delayed(pattern, delay)
+        benchmark(lambda: run_async(api.get_all("transactions", "getList")))
 
     @pytest.mark.parametrize("delay", [0.05, 0.1], ids=["50ms", "100ms"])
-    def test_async_count_first_50_pages(self, benchmark, delay):
+    @_TASK_FACTORY
+    def test_async_count_first_50_pages(self, benchmark, async_env, delay, eager):
         """Async get_all_fast — 1 count + 50 pages in batches of 10."""
-        loop = asyncio.new_event_loop()
-        api = AsyncBlestaRequest("https://test.example.com/api", "u", "k")
+        run_async, api = async_env(eager)
 
-        count_resp = httpx.Response(200, text=json.dumps({"response": 1250}))
+        count_resp = httpx.Response(200, text=dumps({"response": 1250}))
         data_resp = httpx.Response(200, text=_PAGE_25)
 
         async def delayed_get(url, *args, **kwargs):
             await asyncio.sleep(delay)
-            if "getListCount" in str(url):
+            if url.endswith("/getListCount.json"):
                 return count_resp
             return data_resp
 
-        with patch.object(api.client, "get", AsyncMock(side_effect=delayed_get)):
-            benchmark(
-                lambda: loop.run_until_complete(
-                    api.get_all_fast(
-                        "transactions",
-                        "getList",
-                        page_size=25,
-                        batch_size=10,
-                    )
+        api.client.get = delayed_get
+        benchmark(
+            lambda: run_async(
+                api.get_all_fast(
+                    "transactions",
+                    "getList",
+                    page_size=25,
+                    batch_size=10,
                 )
             )
-
-        loop.run_until_complete(api.close())
-        loop.close()
+        )
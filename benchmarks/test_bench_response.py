@@ -8,9 +8,35 @@ Run:
     uv run pytest benchmarks/test_bench_response.py -v --benchmark-sort=mean
 """
 
+from operator import itemgetter
+
 from benchmarks.conftest import make_csv_payload, make_json_payload
 from blesta_sdk import BlestaResponse
 
+_JSON_10 = make_json_payload(10)
+_JSON_100 = make_json_payload(100)
+_JSON_1000 = make_json_payload(1000)
+_CSV_50 = make_csv_payload(50)
+_CSV_100 = make_csv_payload(100)
+_CSV_500 = make_csv_payload(500)
+_CSV_5000 = make_csv_payload(5000)
+
+_PARSE_ROUNDS = 200
+
+
+def _bench_first_access(benchmark, payload: str, attr: str) -> None:
+    """Time the first (uncached) access of *attr* on a fresh response.
+
+    A new BlestaResponse is built in pedantic ``setup`` for every round, so
+    construction is excluded and each round measures a cold parse.
+    """
+    benchmark.pedantic(
+        lambda resp: getattr(resp, attr),
+        setup=lambda: ((BlestaResponse(payload, 200),), {}),
+        rounds=_PARSE_ROUNDS,
+    )
+
+
 # ---------------------------------------------------------------------------
 # JSON parsing
 # ---------------------------------------------------------------------------
@@ -20,30 +46,25 @@ class TestJsonParsing:
     """Benchmark .data property — json.loads + dict key lookup."""
 
     def test_data_access_10(self, benchmark):
-        payload = make_json_payload(10)
-        benchmark(lambda: BlestaResponse(payload, 200).data)
+        _bench_first_access(benchmark, _JSON_10, "data")
 
     def test_data_access_100(self, benchmark):
-        payload = make_json_payload(100)
-        benchmark(lambda: BlestaResponse(payload, 200).data)
+        _bench_first_access(benchmark, _JSON_100, "data")
 
     def test_data_access_1000(self, benchmark):
-        payload = make_json_payload(1000)
-        benchmark(lambda: BlestaResponse(payload, 200).data)
+        _bench_first_access(benchmark, _JSON_1000, "data")
 
     def test_data_cached_access(self, benchmark):
         """Second .data access uses cached _parsed — should be near-zero."""
-        resp = BlestaResponse(make_json_payload(1000), 200)
+        resp = BlestaResponse(_JSON_1000, 200)
         _ = resp.data  # prime the cache
         benchmark(lambda: resp.data)
 
     def test_is_json_true(self, benchmark):
-        payload = make_json_payload(100)
-        benchmark(lambda: BlestaResponse(payload, 200).is_json)
+        _bench_first_access(benchmark, _JSON_100, "is_json")
 
     def test_is_json_false(self, benchmark):
-        csv = make_csv_payload(100)
-        benchmark(lambda: BlestaResponse(csv, 200).is_json)
+        _bench_first_access(benchmark, _CSV_100, "is_json")
 
 
 # ---------------------------------------------------------------------------
@@ -55,34 +76,72 @@ class TestCsvParsing:
     """Benchmark .csv_data — csv.DictReader parse of raw text."""
 
     def test_csv_data_50(self, benchmark):
-        payload = make_csv_payload(50)
-        benchmark(lambda: BlestaResponse(payload, 200).csv_data)
+        _bench_first_access(benchmark, _CSV_50, "csv_data")
 
     def test_csv_data_500(self, benchmark):
-        payload = make_csv_payload(500)
-        benchmark(lambda: BlestaResponse(payload, 200).csv_data)
+        _bench_first_access(benchmark, _CSV_500, "csv_data")
 
     def test_csv_data_5000(self, benchmark):
-        payload = make_csv_payload(5000)
-        benchmark(lambda: BlestaResponse(payload, 200).csv_data)
+        _bench_first_access(benchmark, _CSV_5000, "csv_data")
 
     def test_is_csv_on_csv(self, benchmark):
-        """is_csv calls is_json internally — measures redundant json.loads."""
-        csv = make_csv_payload(100)
-        benchmark(lambda: BlestaResponse(csv, 200).is_csv)
+        """is_csv on CSV: line-break scan only, no JSON decode."""
+        _bench_first_access(benchmark, _CSV_100, "is_csv")
 
     def test_is_csv_on_json(self, benchmark):
-        """is_csv on JSON should short-circuit at is_json check."""
-        payload = make_json_payload(100)
-        benchmark(lambda: BlestaResponse(payload, 200).is_csv)
+        """is_csv on JSON: falls through to the (cached) is_json parse."""
+        _bench_first_access(benchmark, _JSON_100, "is_csv")
 
     def test_csv_data_cached_access(self, benchmark):
         """Second .csv_data access uses cache — should be near-zero."""
-        resp = BlestaResponse(make_csv_payload(500), 200)
+        resp = BlestaResponse(_CSV_500, 200)
         _ = resp.csv_data  # prime the cache
         benchmark(lambda: resp.csv_data)
 
 
+# ---------------------------------------------------------------------------
+# Field projection
+# ---------------------------------------------------------------------------
+
+_FIELDS = ("id", "email", "status")
+
+
+def _codegen_extractor(fields: tuple[str, ...]):
+    """Build a specialized ``rows -> [tuple]`` function via ``exec``."""
+    getters = ", ".join(f"x[{k!r}]" for k in fields)
+    ns: dict = {}
+    exec(f"def extract(rows): return [({getters},) for x in rows]", ns)
+    return ns["extract"]
+
+
+class TestFieldProjection:
+    """Pulling a few fields out of decoded rows — generic vs specialized.
+
+    Compares a generic per-key loop, ``operator.itemgetter``, and an
+    ``exec``-generated extractor, alongside the parse they follow, to show
+    how much of a fetch projection can save.
+    """
+
+    def test_project_generic(self, benchmark):
+        rows = BlestaResponse(_JSON_1000, 200).data
+        benchmark(lambda: [tuple(x[k] for k in _FIELDS) for x in rows])
+
+    def test_project_itemgetter(self, benchmark):
+        rows = BlestaResponse(_JSON_1000, 200).data
+        getter = itemgetter(*_FIELDS)
+        benchmark(lambda: list(map(getter, rows)))
+
+    def test_project_codegen(self, benchmark):
+        rows = BlestaResponse(_JSON_1000, 200).data
+        extract = _codegen_extractor(_FIELDS)
+        benchmark(extract, rows)
+
+    def test_parse_then_itemgetter(self, benchmark):
+        payload = _JSON_1000
+        getter = itemgetter(*_FIELDS)
+        benchmark(lambda: list(map(getter, BlestaResponse(payload, 200).data)))
+
+
 # ---------------------------------------------------------------------------
 # DataFrame conversion
 # ---------------------------------------------------------------------------
@@ -92,19 +151,19 @@ class TestDataFrame:
     """Benchmark .to_dataframe() for CSV and JSON responses."""
 
     def test_to_dataframe_csv_50(self, benchmark):
-        resp = BlestaResponse(make_csv_payload(50), 200)
+        resp = BlestaResponse(_CSV_50, 200)
         benchmark(resp.to_dataframe)
 
     def test_to_dataframe_csv_500(self, benchmark):
-        resp = BlestaResponse(make_csv_payload(500), 200)
+        resp = BlestaResponse(_CSV_500, 200)
         benchmark(resp.to_dataframe)
 
     def test_to_dataframe_json_10(self, benchmark):
-        resp = BlestaResponse(make_json_payload(10), 200)
+        resp = BlestaResponse(_JSON_10, 200)
         benchmark(resp.to_dataframe)
 
     def test_to_dataframe_json_100(self, benchmark):
-        resp = BlestaResponse(make_json_payload(100), 200)
+        resp = BlestaResponse(_JSON_100, 200)
         benchmark(resp.to_dataframe)
 
 
@@ -117,7 +176,7 @@ class TestErrors:
     """Benchmark .errors() on success and failure responses."""
 
     def test_errors_on_success(self, benchmark):
-        resp = BlestaResponse(make_json_payload(100), 200)
+        resp = BlestaResponse(_JSON_100, 200)
         benchmark(resp.errors)
 
     def test_errors_on_failure(self, benchmark):
@@ -125,5 +184,5 @@ class TestErrors:
         benchmark(resp.errors)
 
     def test_errors_on_csv(self, benchmark):
-        resp = BlestaResponse(make_csv_payload(100), 200)
+        resp = BlestaResponse(_CSV_100, 200)
         benchmark(resp.errors)
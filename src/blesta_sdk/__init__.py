@@ -1,6 +1,7 @@
 """Python SDK and CLI for the Blesta billing platform REST API."""
 
-from blesta_sdk.core.client import BlestaRequest
+from typing import TYPE_CHECKING
+
 from blesta_sdk.core.config import BlestaEnvConfig
 from blesta_sdk.core.errors import (
     BlestaAPIError,
@@ -11,9 +12,13 @@ from blesta_sdk.core.errors import (
     BlestaServerError,
     PaginationError,
 )
-from blesta_sdk.core.response import BlestaResponse
 from blesta_sdk.discovery.registry import BlestaDiscovery, MethodSpec
 
+if TYPE_CHECKING:
+    from blesta_sdk.core.async_client import AsyncBlestaRequest
+    from blesta_sdk.core.client import BlestaRequest
+    from blesta_sdk.core.response import BlestaResponse
+
 __all__ = [
     "AsyncBlestaRequest",
     "BlestaAPIError",
@@ -32,7 +37,22 @@ __all__ = [
 ]
 
 
+# Resolved on first access so ``import blesta_sdk`` (and ``blesta --help``)
+# does not pay for importing requests/urllib3.
+_LAZY_IMPORTS = {
+    "BlestaRequest": "blesta_sdk.core.client",
+    "BlestaResponse": "blesta_sdk.core.response",
+}
+
+
 def __getattr__(name: str) -> object:
+    module = _LAZY_IMPORTS.get(name)
+    if module is not None:
+        from importlib import import_module
+
+        value = getattr(import_module(module), name)
+        globals()[name] = value
+        return value
     if name == "AsyncBlestaRequest":
         try:
             from blesta_sdk.core.async_client import AsyncBlestaRequest
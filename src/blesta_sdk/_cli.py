@@ -46,13 +46,6 @@ def cli():
     Set ``BLESTA_ALLOW_HTTP=1`` to permit ``http://`` base URLs (local/dev
     only). HTTPS is enforced by default.
     """
-    try:
-        from dotenv import load_dotenv
-
-        load_dotenv()
-    except ImportError:
-        pass
-
     parser = argparse.ArgumentParser(description="Blesta API Command Line Interface")
     parser.add_argument(
         "--model", required=True, help="Blesta API model (e.g., clients)"
@@ -78,6 +71,14 @@ def cli():
 
     args = parser.parse_args()
 
+    # Loaded after parsing so ``--help`` and usage errors skip dotenv.
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    except ImportError:
+        pass
+
     try:
         url = os.getenv("BLESTA_API_URL")
         user = os.getenv("BLESTA_API_USER")
@@ -100,9 +101,9 @@ def cli():
 
         params: dict[str, str] = {}
         for raw in args.params or []:
-            if not raw or "=" not in raw:
+            k, sep, v = raw.partition("=")
+            if not sep:
                 _json_error(f"Invalid param '{raw}': expected key=value format")
-            k, v = raw.split("=", 1)
             if not k:
                 _json_error(f"Invalid param '{raw}': key cannot be empty")
             if k in params:
@@ -3,6 +3,9 @@
 # ruff: noqa: F401
 from __future__ import annotations
 
-import json  # exposed for test patches: patch("blesta_sdk._response.json.loads")
+# Kept for backward compatibility. Response bodies are decoded through
+# blesta_sdk.core.jsonutil (orjson when installed), so patching json.loads
+# no longer intercepts parsing; patch "blesta_sdk.core.response.jsonutil.loads".
+import json
 
 from blesta_sdk.core.response import _UNSET, BlestaResponse
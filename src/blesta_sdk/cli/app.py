@@ -12,6 +12,7 @@ and the new subcommand syntax::
     blesta discover models
     blesta discover methods Clients
     blesta discover spec Clients getList
+    blesta batch < requests.jsonl
 """
 
 from __future__ import annotations
@@ -63,6 +64,7 @@ def _build_parser() -> argparse.ArgumentParser:
     # ---- Subcommands ----------------------------------------------------
     subparsers = parser.add_subparsers(dest="subcommand", metavar="COMMAND")
 
+    from blesta_sdk.cli.commands.batch import add_parser as add_batch
     from blesta_sdk.cli.commands.call import add_parser as add_call
     from blesta_sdk.cli.commands.discover import add_parser as add_discover
     from blesta_sdk.cli.commands.extract import add_parser as add_extract
@@ -72,6 +74,7 @@ def _build_parser() -> argparse.ArgumentParser:
     add_extract(subparsers)
     add_report(subparsers)
     add_discover(subparsers)
+    add_batch(subparsers)
 
     return parser
 
@@ -86,6 +89,10 @@ def main() -> None:
     Set ``BLESTA_AUTH_METHOD`` to ``"header"`` to use header-based auth.
     Set ``BLESTA_ALLOW_HTTP=1`` to permit ``http://`` base URLs.
     """
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    # Loaded after parsing so ``--help`` and usage errors skip dotenv.
     try:
         from dotenv import load_dotenv
 
@@ -93,9 +100,6 @@ def main() -> None:
     except ImportError:
         pass
 
-    parser = _build_parser()
-    args = parser.parse_args()
-
     # ---- Route to subcommand -------------------------------------------
     if args.subcommand is not None:
         # Dispatch to registered subcommand handler.
@@ -132,9 +136,9 @@ def _run_legacy(args: argparse.Namespace) -> None:
     log = logging.getLogger(__name__)
     params: dict[str, str] = {}
     for raw in args.params or []:
-        if not raw or "=" not in raw:
+        k, sep, v = raw.partition("=")
+        if not sep:
             print_error(f"Invalid param '{raw}': expected key=value format")
-        k, v = raw.split("=", 1)
         if not k:
             print_error(f"Invalid param '{raw}': key cannot be empty")
         if k in params:
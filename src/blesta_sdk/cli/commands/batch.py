@@ -0,0 +1,138 @@
+"""``blesta batch`` subcommand — run many API calls over one connection pool."""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import TYPE_CHECKING, Any
+
+from blesta_sdk.cli.formatters import _build_cli_async_client
+
+if TYPE_CHECKING:
+    import argparse
+
+    from blesta_sdk.core.async_client import AsyncBlestaRequest
+
+_ACTIONS = ("GET", "POST", "PUT", "DELETE")
+
+
+def add_parser(subparsers: argparse.Action) -> None:
+    """Register the ``batch`` subcommand on *subparsers*.
+
+    :param subparsers: Subparser action from the parent parser.
+    """
+    p = subparsers.add_parser(
+        "batch",
+        help="Run JSON-lines requests from stdin concurrently",
+        description=(
+            "Read one JSON request per line from stdin, e.g."
+            ' {"model": "clients", "method": "get", "params": {"client_id": 1}}'
+            ' (optional "action": GET/POST/PUT/DELETE, inferred from the schema'
+            " if omitted), send them concurrently over a single client, and"
+            " print one JSON result per line in input order."
+        ),
+    )
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Maximum requests in flight (default 10).",
+    )
+    p.set_defaults(func=run)
+
+
+def _parse_line(line: str) -> tuple[str, str, dict[str, Any], str | None]:
+    """Validate one batch request line.
+
+    :param line: A JSON object with ``model``, ``method``, and optional
+        ``params`` and ``action`` keys.
+    :return: ``(model, method, params, action)``.
+    :raises ValueError: If the line is not a valid request object.
+    """
+    request = json.loads(line)
+    if not isinstance(request, dict):
+        raise ValueError("expected a JSON object")
+    model = request.get("model")
+    method = request.get("method")
+    if not isinstance(model, str) or not isinstance(method, str):
+        raise ValueError("'model' and 'method' must be strings")
+    params = request.get("params") or {}
+    if not isinstance(params, dict):
+        raise ValueError("'params' must be an object")
+    action = request.get("action")
+    if action is not None:
+        action = str(action).upper()
+        if action not in _ACTIONS:
+            raise ValueError(f"'action' must be one of {', '.join(_ACTIONS)}")
+    return model, method, params, action
+
+
+async def _dispatch(
+    api: AsyncBlestaRequest, lines: list[str], concurrency: int
+) -> list[dict[str, Any]]:
+    """Send every request in *lines* and return one result per line.
+
+    At most *concurrency* requests are in flight at once; the rest wait
+    here rather than queueing inside the connection pool, where they
+    would count against the request timeout.
+    """
+    import asyncio
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(line: str) -> dict[str, Any]:
+        try:
+            model, method, params, action = _parse_line(line)
+        except ValueError as e:
+            return {"error": f"Invalid request: {e}"}
+        try:
+            async with sem:
+                response = await api.call(model, method, params, action)
+        except ValueError as e:
+            return {"model": model, "method": method, "error": str(e)}
+        result: dict[str, Any] = {
+            "model": model,
+            "method": method,
+            "status_code": response.status_code,
+        }
+        if response.status_code == 200:
+            result["response"] = response.data
+        else:
+            result["errors"] = response.errors()
+        return result
+
+    async with api:
+        return await asyncio.gather(*[_one(line) for line in lines])
+
+
+def run(args: argparse.Namespace) -> None:
+    """Execute the ``batch`` subcommand.
+
+    Exits with status ``1`` if any request was invalid or did not
+    return HTTP 200.
+
+    :param args: Parsed CLI arguments.
+    """
+    import asyncio
+
+    from blesta_sdk.cli.formatters import print_error, print_jsonl
+
+    if args.concurrency < 1:
+        print_error("--concurrency must be at least 1")
+    lines = [line for line in sys.stdin.read().splitlines() if line.strip()]
+    try:
+        api = _build_cli_async_client(
+            max_concurrency=args.concurrency,
+            max_connections=args.concurrency,
+            max_keepalive_connections=args.concurrency,
+        )
+    except ImportError:
+        print_error(
+            "blesta batch requires httpx. "
+            "Install it with: pip install blesta_sdk[async]"
+        )
+    results = asyncio.run(_dispatch(api, lines, args.concurrency))
+    print_jsonl(results)
+    if any(result.get("status_code") != 200 for result in results):
+        sys.exit(1)
@@ -9,6 +9,7 @@ import sys
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from blesta_sdk.core.async_client import AsyncBlestaRequest
     from blesta_sdk.core.client import BlestaRequest
 
 logger = logging.getLogger(__name__)
@@ -46,9 +47,9 @@ def parse_params(raw_params: list[str] | None) -> dict[str, Any]:
     """
     params: dict[str, Any] = {}
     for raw in raw_params or []:
-        if not raw or "=" not in raw:
+        k, sep, v = raw.partition("=")
+        if not sep:
             print_error(f"Invalid param {raw!r}: expected key=value format")
-        k, v = raw.split("=", 1)
         if not k:
             print_error(f"Invalid param {raw!r}: key cannot be empty")
         if k in params:
@@ -57,20 +58,17 @@ def parse_params(raw_params: list[str] | None) -> dict[str, Any]:
     return params
 
 
-def _build_cli_client() -> BlestaRequest:
-    """Create a :class:`~blesta_sdk.core.client.BlestaRequest` from CLI env vars.
+def _cli_client_options() -> dict[str, Any]:
+    """Resolve client constructor arguments from CLI env vars.
 
     Reads ``BLESTA_API_URL``, ``BLESTA_API_USER``, ``BLESTA_API_KEY``,
-    ``BLESTA_AUTH_METHOD`` (default ``"basic"``), and ``BLESTA_ALLOW_HTTP``
-    from the environment and returns a configured client.
+    ``BLESTA_AUTH_METHOD`` (default ``"basic"``), and ``BLESTA_ALLOW_HTTP``.
 
     Calls :func:`print_error` (which exits) if any required credential is
     missing or if ``BLESTA_AUTH_METHOD`` is not ``"basic"`` or ``"header"``.
 
-    :return: Configured :class:`~blesta_sdk.core.client.BlestaRequest`.
+    :return: Keyword arguments for either client class.
     """
-    from blesta_sdk.core.client import BlestaRequest
-
     url = os.getenv("BLESTA_API_URL")
     user = os.getenv("BLESTA_API_USER")
     key = os.getenv("BLESTA_API_KEY")
@@ -86,13 +84,39 @@ def _build_cli_client() -> BlestaRequest:
             " must be 'basic' or 'header'."
         )
     allow_http = os.getenv("BLESTA_ALLOW_HTTP", "").strip().lower() in _TRUTHY_ENV
-    return BlestaRequest(  # type: ignore[arg-type]
-        url,
-        user,
-        key,
-        auth_method=auth_method,  # type: ignore[arg-type]
-        allow_http=allow_http,
-    )
+    return {
+        "url": url,
+        "user": user,
+        "key": key,
+        "auth_method": auth_method,
+        "allow_http": allow_http,
+    }
+
+
+def _build_cli_client() -> BlestaRequest:
+    """Create a :class:`~blesta_sdk.core.client.BlestaRequest` from CLI env vars.
+
+    See :func:`_cli_client_options` for the variables read; exits via
+    :func:`print_error` on missing or invalid settings.
+
+    :return: Configured :class:`~blesta_sdk.core.client.BlestaRequest`.
+    """
+    from blesta_sdk.core.client import BlestaRequest
+
+    return BlestaRequest(**_cli_client_options())
+
+
+def _build_cli_async_client(**kwargs: Any) -> AsyncBlestaRequest:
+    """Create an :class:`~blesta_sdk.core.async_client.AsyncBlestaRequest`.
+
+    Same environment variables as :func:`_build_cli_client`.
+
+    :param kwargs: Extra constructor arguments (e.g. ``max_concurrency``).
+    :return: Configured :class:`~blesta_sdk.core.async_client.AsyncBlestaRequest`.
+    """
+    from blesta_sdk.core.async_client import AsyncBlestaRequest
+
+    return AsyncBlestaRequest(**_cli_client_options(), **kwargs)
 
 
 def print_json(data: Any, *, indent: int = 4) -> None:
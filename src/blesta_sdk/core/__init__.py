@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from blesta_sdk.core.client import BlestaRequest
+from typing import TYPE_CHECKING
+
 from blesta_sdk.core.config import BlestaEnvConfig
 from blesta_sdk.core.errors import (
     BlestaAPIError,
@@ -13,7 +14,10 @@ from blesta_sdk.core.errors import (
     BlestaServerError,
     PaginationError,
 )
-from blesta_sdk.core.response import BlestaResponse
+
+if TYPE_CHECKING:
+    from blesta_sdk.core.client import BlestaRequest
+    from blesta_sdk.core.response import BlestaResponse
 
 __all__ = [
     "BlestaAPIError",
@@ -27,3 +31,21 @@ __all__ = [
     "BlestaServerError",
     "PaginationError",
 ]
+
+
+# See blesta_sdk.__init__: keep requests off the import path until needed.
+_LAZY_IMPORTS = {
+    "BlestaRequest": "blesta_sdk.core.client",
+    "BlestaResponse": "blesta_sdk.core.response",
+}
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
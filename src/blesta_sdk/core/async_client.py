@@ -11,17 +11,23 @@ from __future__ import annotations
 import asyncio
 import contextvars
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator, Iterable, Mapping
 from typing import Any, Literal
 
 import httpx
 
+from blesta_sdk.core.cache import ResponseCache, cache_key
 from blesta_sdk.core.dateutil import _month_boundaries
-from blesta_sdk.core.pagination import PaginationState
+from blesta_sdk.core.pagination import PaginationState, page_args
 from blesta_sdk.core.redaction import redact_args
-from blesta_sdk.core.response import BlestaResponse
-from blesta_sdk.core.retry import jitter_delay
-from blesta_sdk.core.validation import validate_segment
+from blesta_sdk.core.response import BlestaResponse, _int_response_fast
+from blesta_sdk.core.retry import (
+    RetryJitter,
+    backoff_delay,
+    retry_after_seconds,
+    validate_retry_options,
+)
+from blesta_sdk.core.validation import endpoint_path, validate_segment
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,15 @@ DEFAULT_TIMEOUT = 30
 
 _IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
 
+# HTTP action -> (session method name, keyword the args are sent under).
+# GET sends args as a query string; the others send a JSON body.
+_ACTIONS: dict[str, tuple[str, str]] = {
+    "GET": ("get", "params"),
+    "POST": ("post", "json"),
+    "PUT": ("put", "json"),
+    "DELETE": ("delete", "json"),
+}
+
 _last_request_var: contextvars.ContextVar[dict[str, Any] | None] = (
     contextvars.ContextVar("_last_request_var", default=None)
 )
@@ -46,6 +61,13 @@ class AsyncBlestaRequest:
         async with AsyncBlestaRequest(url, user, key) as api:
             response = await api.get("clients", "getList")
 
+    The fan-out methods (:meth:`extract`, :meth:`get_all_fast`,
+    :meth:`get_report_series_concurrent`) create one task per request.
+    On Python 3.12+, applications can cut that scheduling overhead by
+    running the client on a loop with eager tasks enabled::
+
+        loop.set_task_factory(asyncio.eager_task_factory)
+
     :param url: Base URL of the Blesta API (e.g., ``"https://example.com/api"``).
     :param user: API username.
     :param key: API key.
@@ -57,7 +79,10 @@ class AsyncBlestaRequest:
         POST and PUT retry **only on 429** (rate-limit) — never on 5xx,
         because a server error does not guarantee the write failed and
         retrying risks duplicate billing records.
-        Uses exponential backoff with jitter. Defaults to ``0`` (no retries).
+        Network errors are retried only when transient (connection
+        failures and timeouts). Waits honour an integer ``Retry-After``
+        header on 429/5xx responses, otherwise back off per
+        *retry_jitter*. Defaults to ``0`` (no retries).
     :param retry_mutations: Include POST and PUT in the retry loop.
         When ``True``, POST/PUT will retry on 429 but still never on 5xx.
         Defaults to ``False``.
@@ -68,7 +93,9 @@ class AsyncBlestaRequest:
     :param max_concurrency: Maximum number of concurrent requests the
         client will issue (shared semaphore). Applies to
         :meth:`extract`, :meth:`get_all_fast`, and
-        :meth:`get_report_series_concurrent`. Defaults to ``10``.
+        :meth:`get_report_series_concurrent`. Over HTTP/1.1, keep it at or
+        below *max_connections*; extra requests only queue for a pooled
+        connection. Defaults to ``10``.
     :param auth_method: Authentication method. ``"basic"`` uses HTTP Basic
         Auth. ``"header"`` sends credentials via ``BLESTA-API-USER`` and
         ``BLESTA-API-KEY`` headers (recommended by Blesta, requires no
@@ -84,6 +111,46 @@ class AsyncBlestaRequest:
     :param discovery: Optional :class:`~blesta_sdk.BlestaDiscovery` instance
         to use instead of the module-level singleton. Useful when loading
         schemas from a custom path or when injecting a mock in tests.
+    :param transport: Optional :class:`httpx.AsyncBaseTransport` to send
+        requests through instead of httpx's default connection pool, e.g.
+        ``httpx_aiohttp.AiohttpTransport()`` for lower tail latency at high
+        concurrency. When set, *max_connections* and
+        *max_keepalive_connections* are not applied (configure the
+        transport directly).
+    :param http2: Negotiate HTTP/2 so concurrent requests (:meth:`extract`,
+        :meth:`get_all_fast`, :meth:`get_report_series_concurrent`) are
+        multiplexed over one connection instead of opening one per
+        request. Requires the ``h2`` package
+        (``pip install blesta_sdk[http2]``). Defaults to ``False``.
+    :param keepalive_expiry: Seconds an idle pooled connection is kept
+        open. Raise it for clients that issue bursts of requests minutes
+        apart, so each burst reuses a warm TLS connection. ``None`` keeps
+        idle connections indefinitely. Defaults to ``5.0`` (httpx's
+        default).
+    :param retry_base: Base backoff delay in seconds. Defaults to ``1.0``.
+    :param retry_cap: Maximum backoff delay in seconds (``Retry-After``
+        values are not capped). ``None`` disables the cap. Defaults to
+        ``30.0``.
+    :param retry_jitter: Backoff strategy. ``"exponential"`` sleeps
+        ``retry_base * 2 ** attempt`` scaled by a random 50-100%.
+        ``"decorrelated"`` draws each delay from
+        ``[retry_base, 3 * previous delay]``, which spreads out retries
+        from many clients that failed at the same moment. Defaults to
+        ``"exponential"``.
+    :param cache_ttl: Cache successful GET responses (HTTP 200 with
+        no Blesta ``errors``, including :meth:`count` results) in memory
+        for this many seconds, so repeated identical reads skip the
+        network. Cached responses are shared objects — don't mutate
+        their ``data``. ``None`` (default) disables caching.
+    :param cache_size: Maximum number of cached GET responses; the least
+        recently used is evicted first. Defaults to ``256``.
+    :param http_client: An existing :class:`httpx.AsyncClient` to send
+        requests through, so several short-lived instances (one per
+        Blesta account, per job, ...) reuse one warm connection pool.
+        Credentials and *timeout* are then sent per request, the pool
+        options (*max_connections*, *max_keepalive_connections*,
+        *keepalive_expiry*, *transport*, *http2*) are ignored, and
+        :meth:`close` leaves the client open for its owner.
     """
 
     def __init__(
@@ -101,6 +168,15 @@ class AsyncBlestaRequest:
         raise_on_error: bool = False,
         allow_http: bool = False,
         discovery: Any = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        http2: bool = False,
+        keepalive_expiry: float | None = 5.0,
+        retry_base: float = 1.0,
+        retry_cap: float | None = 30.0,
+        retry_jitter: RetryJitter = "exponential",
+        http_client: httpx.AsyncClient | None = None,
+        cache_ttl: float | None = None,
+        cache_size: int = 256,
     ):
         if url.startswith("http://") and not allow_http:
             raise ValueError(
@@ -113,11 +189,19 @@ class AsyncBlestaRequest:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_mutations = retry_mutations
+        validate_retry_options(retry_base, retry_cap, retry_jitter)
+        self.retry_base = retry_base
+        self.retry_cap = retry_cap
+        self.retry_jitter = retry_jitter
+        self._cache = (
+            ResponseCache(cache_ttl, cache_size) if cache_ttl is not None else None
+        )
         self.auth_method = auth_method
         self.raise_on_error = raise_on_error
         if max_concurrency is not None and max_concurrency < 1:
             raise ValueError("max_concurrency must be >= 1")
         self._discovery = discovery
+        self._max_concurrency = max_concurrency
         self._semaphore = asyncio.Semaphore(max_concurrency)
         auth = None if auth_method == "header" else httpx.BasicAuth(self.user, self.key)
         headers = {}
@@ -126,6 +210,18 @@ class AsyncBlestaRequest:
                 "BLESTA-API-USER": self.user,
                 "BLESTA-API-KEY": self.key,
             }
+        # Extra kwargs for every request; only needed when the httpx client
+        # is shared, since its client-level auth/headers aren't ours.
+        self._request_kwargs: dict[str, Any] = {}
+        self._owns_client = http_client is None
+        if http_client is not None:
+            self.client = http_client
+            self._request_kwargs = {
+                "auth": auth,
+                "headers": headers,
+                "timeout": httpx.Timeout(timeout),
+            }
+            return
         self.client = httpx.AsyncClient(
             auth=auth,
             headers=headers,
@@ -133,21 +229,33 @@ class AsyncBlestaRequest:
             limits=httpx.Limits(
                 max_connections=max_connections,
                 max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
             ),
+            transport=transport,
+            http2=http2,
         )
 
     async def __aenter__(self) -> AsyncBlestaRequest:
         return self
 
     async def __aexit__(self, *args: Any) -> None:
-        await self.client.aclose()
+        await self.close()
 
     def __repr__(self) -> str:
         return f"AsyncBlestaRequest(url={self.base_url!r}, user={self.user!r})"
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
-        await self.client.aclose()
+        """Close the underlying HTTP client.
+
+        A client passed in as *http_client* is left open for its owner.
+        """
+        if self._owns_client:
+            await self.client.aclose()
+
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses (no-op when caching is disabled)."""
+        if self._cache is not None:
+            self._cache.clear()
 
     @staticmethod
     def _validate_segment(segment: str, name: str) -> None:
@@ -256,31 +364,32 @@ class AsyncBlestaRequest:
         if args is None:
             args = {}
 
-        self._validate_segment(model, "model")
-        self._validate_segment(method, "method")
-        url = f"{self.base_url}{model}/{method}.json"
+        url = self.base_url + endpoint_path(model, method)
         request_info = {"url": url, "args": args.copy()}
         _last_request_var.set(request_info)
 
+        cache = self._cache if action == "GET" else None
+        key = cache_key(url, args) if cache is not None else None
+        if cache is not None and key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        try:
+            send_name, args_kwarg = _ACTIONS[action]
+        except KeyError:
+            raise ValueError("Invalid HTTP action specified.") from None
+
         can_retry = self.retry_mutations or action in _IDEMPOTENT_METHODS
         effective_retries = self.max_retries if can_retry else 0
 
-        last_response: BlestaResponse | None = None
+        delay = self.retry_base
         for attempt in range(effective_retries + 1):
             try:
-                if action == "GET":
-                    response = await self.client.get(url, params=args)
-                elif action == "POST":
-                    response = await self.client.post(url, json=args)
-                elif action == "PUT":
-                    response = await self.client.put(url, json=args)
-                elif action == "DELETE":
-                    response = await self.client.delete(url, json=args)
-                else:
-                    raise ValueError("Invalid HTTP action specified.")
-
-                last_response = BlestaResponse(
-                    response.text, response.status_code, response.headers
+                # Looked up per attempt so a patched client method is
+                # always the one called.
+                response = await getattr(self.client, send_name)(
+                    url, **{args_kwarg: args}, **self._request_kwargs
                 )
 
                 # Mutations (POST/PUT) must never be retried on 5xx — a server
@@ -296,10 +405,25 @@ class AsyncBlestaRequest:
                         response.status_code >= 500 or response.status_code == 429
                     )
                 if not is_retriable or attempt == effective_retries:
+                    result = BlestaResponse(
+                        response.text, response.status_code, response.headers
+                    )
+                    # HTTP 200 can still carry Blesta ``errors``; caching
+                    # those would replay them without raise_on_error.
+                    if (
+                        cache is not None
+                        and key is not None
+                        and result.status_code == 200
+                        and result.errors() is None
+                    ):
+                        cache.put(key, result)
                     if self.raise_on_error:
-                        last_response.raise_for_status()
-                    return last_response
+                        result.raise_for_status()
+                    return result
 
+                # The body of a response that is about to be retried is never
+                # read, so don't pay to decode it; only its headers matter.
+                retry_headers: Mapping[str, str] = response.headers
                 logger.warning(
                     "Retry %d/%d: HTTP %d from %s",
                     attempt + 1,
@@ -310,29 +434,30 @@ class AsyncBlestaRequest:
 
             except httpx.HTTPError as e:
                 logger.error("Request failed: %s", e)
-                last_response = BlestaResponse(str(e), 0)
 
-                if attempt == effective_retries:
+                # Only transport failures (connect/read errors, timeouts) are
+                # transient; e.g. TooManyRedirects or DecodingError are not.
+                transient = isinstance(e, httpx.TransportError)
+                if not transient or attempt == effective_retries:
+                    result = BlestaResponse(str(e), 0)
                     if self.raise_on_error:
-                        last_response.raise_for_status()
-                    return last_response
+                        result.raise_for_status()
+                    return result
 
                 logger.warning("Retry %d/%d: %s", attempt + 1, effective_retries, e)
+                retry_headers = {}
 
-            if last_response is not None and last_response.status_code == 429:
-                try:
-                    retry_after = int(last_response.headers.get("Retry-After", ""))
-                except (ValueError, TypeError):
-                    retry_after = 0
-                if retry_after > 0:
-                    await asyncio.sleep(retry_after)
-                    continue
+            retry_after = retry_after_seconds(retry_headers)
+            if retry_after > 0:
+                await asyncio.sleep(retry_after)
+                continue
 
-            await asyncio.sleep(jitter_delay(attempt))
+            delay = backoff_delay(
+                attempt, delay, self.retry_base, self.retry_cap, self.retry_jitter
+            )
+            await asyncio.sleep(delay)
 
-        if last_response is None:  # pragma: no cover
-            raise RuntimeError("Retry loop exited without a response")
-        return last_response
+        raise RuntimeError("Retry loop exited without a response")  # pragma: no cover
 
     async def iter_all(
         self,
@@ -342,12 +467,21 @@ class AsyncBlestaRequest:
         start_page: int = 1,
         max_pages: int | None = None,
         on_error: Literal["raise", "warn"] = "warn",
+        count_method: str | None = None,
+        page_size: int = 25,
     ) -> AsyncIterator[Any]:
         """Yield individual items across all pages.
 
         Calls the API with ``page=1``, ``page=2``, etc. until an empty
         response is returned.
 
+        With *count_method* set, the record count is fetched first and
+        the known pages are requested concurrently (as in
+        :meth:`aiter_all_fast`) while items are still yielded in page
+        order, so a long listing costs roughly one round trip per
+        ``max_concurrency`` pages instead of one per page. If the count
+        call fails or returns ``0``, the sequential probe is used.
+
         :param model: API model (e.g., ``"invoices"``).
         :param method: API method (e.g., ``"getList"``).
         :param args: Query parameters (``page`` is managed automatically).
@@ -358,15 +492,53 @@ class AsyncBlestaRequest:
             raises :class:`~blesta_sdk.PaginationError` with partial
             results attached. ``"warn"`` logs a warning and stops
             iteration (backward-compatible default).
+        :param count_method: Count method (e.g., ``"getListCount"``) used
+            to fetch pages concurrently. ``None`` (default) pages
+            sequentially.
+        :param page_size: Items per page, used with *count_method* to
+            work out the page count. Must match the API's page size.
+            Defaults to ``25``.
         :return: Async iterator of individual result items.
         :raises PaginationError: If *on_error* is ``"raise"`` and a
             non-200 response is received.
+        :raises ValueError: If *page_size* is less than ``1``.
         """
+        if page_size < 1:
+            raise ValueError(f"page_size must be >= 1, got {page_size!r}")
         base_args = args or {}
         state = PaginationState(start_page, max_pages, on_error)
 
+        total = 0
+        if count_method is not None:
+            total = await self.count(model, count_method, base_args)
+        if total > 0:
+            last_page = -(-total // page_size)  # ceil division
+            if max_pages is not None:
+                last_page = min(last_page, start_page + max_pages - 1)
+            pages = self._aiter_page_range(
+                model, method, base_args, range(start_page, last_page + 1)
+            )
+            try:
+                async for page, response in pages:
+                    state.page = page
+                    if state.check_response(response):
+                        return
+                    data = response.data
+                    if state.check_data(data):
+                        return
+                    state.collect(data)
+                    if isinstance(data, list):
+                        for item in data:
+                            yield item
+                    else:
+                        yield data
+                        return
+            finally:
+                await pages.aclose()
+            return
+
         while state.has_next_page():
-            response = await self.get(model, method, {**base_args, "page": state.page})
+            response = await self.get(model, method, page_args(base_args, state.page))
             if state.check_response(response):
                 return
             data = response.data
@@ -392,7 +564,7 @@ class AsyncBlestaRequest:
     ) -> list[Any]:
         """Fetch all pages and return results as a single list.
 
-        Convenience wrapper around :meth:`iter_all`.
+        Convenience wrapper around :meth:`iter_pages`.
 
         .. warning::
             Materializes all records into memory. For large datasets
@@ -415,10 +587,10 @@ class AsyncBlestaRequest:
             non-200 response is received.
         """
         results: list[Any] = []
-        async for item in self.iter_all(
+        async for page in self.iter_pages(
             model, method, args, start_page, max_pages, on_error
         ):
-            results.append(item)
+            results.extend(page)
         return results
 
     async def iter_pages(
@@ -453,7 +625,7 @@ class AsyncBlestaRequest:
         state = PaginationState(start_page, max_pages, on_error)
 
         while state.has_next_page():
-            response = await self.get(model, method, {**base_args, "page": state.page})
+            response = await self.get(model, method, page_args(base_args, state.page))
             if state.check_response(response):
                 return
             data = response.data
@@ -479,10 +651,15 @@ class AsyncBlestaRequest:
     ) -> list[Any]:
         """Fetch all pages concurrently using a count-first strategy.
 
-        Calls :meth:`count` to determine total records, then launches all page
-        fetches via :func:`asyncio.gather`, with concurrency bounded by the
-        client's ``max_concurrency`` semaphore. Falls back to :meth:`get_all`
-        if the count call returns ``0`` or fails.
+        Collects :meth:`aiter_all_fast` into a list. Calls :meth:`count`
+        to determine total records, then fetches pages with a pool of
+        ``max_concurrency`` worker tasks (each request also holds the
+        client's shared semaphore). Falls back to :meth:`get_all` if the
+        count call returns ``0`` or fails.
+
+        .. warning::
+            Materializes all records into memory. For large datasets,
+            prefer :meth:`aiter_all_fast`.
 
         .. note::
             The count is a snapshot; records may change between the
@@ -503,10 +680,88 @@ class AsyncBlestaRequest:
             a warning if the count changed. Defaults to ``False``.
         :return: List of all result items across all pages.
         """
+        return [
+            item
+            async for item in self.aiter_all_fast(
+                model, method, count_method, args, page_size, verify
+            )
+        ]
+
+    async def aiter_all_fast(
+        self,
+        model: str,
+        method: str,
+        count_method: str = "getListCount",
+        args: dict[str, Any] | None = None,
+        page_size: int = 25,
+        verify: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Yield items from all pages, fetching pages concurrently.
+
+        Streaming counterpart of :meth:`get_all_fast`: items are yielded
+        in page order as soon as each page (and every page before it)
+        has arrived, so the first items are available after one round
+        trip. Workers run at most ``2 * max_concurrency`` pages ahead of
+        the consumer, so memory stays proportional to that window rather
+        than to the whole result set. Falls back to :meth:`iter_all` if
+        the count call returns ``0`` or fails.
+
+        Page 1 is requested alongside the count. If it holds fewer than
+        *page_size* items it is the only page, so its items are yielded
+        without waiting for the count (unless *verify* is set).
+
+        Breaking out of the loop early cancels the outstanding requests.
+
+        :param model: API model (e.g., ``"transactions"``).
+        :param method: API method (e.g., ``"getList"``).
+        :param count_method: Count method name. Defaults to
+            ``"getListCount"``.
+        :param args: Query parameters (``page`` is managed automatically).
+        :param page_size: Expected items per page. Must match the API's
+            page size. Defaults to ``25``.
+        :param verify: If ``True``, re-count after fetching and log
+            a warning if the count changed. Defaults to ``False``.
+        :return: Async iterator of individual result items.
+        """
         if args is None:
             args = {}
 
-        total = await self.count(model, count_method, args)
+        def _items(page: int, response: BlestaResponse) -> list[Any]:
+            if response.status_code != 200:
+                logger.warning(
+                    "get_all_fast: HTTP %d on page %d",
+                    response.status_code,
+                    page,
+                )
+                return []
+            data = response.data
+            if not data:
+                return []
+            return data if isinstance(data, list) else [data]
+
+        async def _first_page() -> BlestaResponse:
+            async with self._semaphore:
+                return await self.get(model, method, page_args(args, 1))
+
+        # Page 1 is fetched alongside the count instead of after it. When it
+        # comes back short there is nothing more to fetch, so the count's
+        # round trip is abandoned rather than waited for.
+        count_task = asyncio.ensure_future(self.count(model, count_method, args))
+        try:
+            first = await _first_page()
+            if not verify and first.status_code == 200:
+                data = first.data
+                if not isinstance(data, list) or len(data) < page_size:
+                    count_task.cancel()
+                    for item in _items(1, first):
+                        yield item
+                    return
+            total = await count_task
+        finally:
+            if not count_task.done():
+                count_task.cancel()
+                await asyncio.gather(count_task, return_exceptions=True)
+
         if total <= 0:
             logger.debug(
                 "get_all_fast: count returned %d for %s/%s, " "falling back to get_all",
@@ -514,7 +769,14 @@ class AsyncBlestaRequest:
                 model,
                 method,
             )
-            return await self.get_all(model, method, args)
+            start_page = 1
+            if first.status_code == 200:
+                for item in _items(1, first):
+                    yield item
+                start_page = 2
+            async for item in self.iter_all(model, method, args, start_page):
+                yield item
+            return
 
         total_pages = -(-total // page_size)  # ceil division
         logger.debug(
@@ -525,33 +787,15 @@ class AsyncBlestaRequest:
             method,
         )
 
-        all_items: list[Any] = []
-
-        async def _fetch_page(page: int) -> list[Any]:
-            async with self._semaphore:
-                page_args = {**args, "page": page}
-                response = await self.get(model, method, page_args)
-                if response.status_code != 200:
-                    logger.warning(
-                        "get_all_fast: HTTP %d on page %d",
-                        response.status_code,
-                        page,
-                    )
-                    return []
-                data = response.data
-                if not data:
-                    return []
-                return data if isinstance(data, list) else [data]
-
-        # Launch every page at once; concurrency is bounded by the semaphore
-        # (``max_concurrency``). Unlike per-batch gathering, no page waits on the
-        # slowest page of an arbitrary window, so a slow page can't stall the
-        # rest. ``asyncio.gather`` preserves order, so results stay page-ordered.
-        pages_data = await asyncio.gather(
-            *[_fetch_page(p) for p in range(1, total_pages + 1)]
-        )
-        for page_items in pages_data:
-            all_items.extend(page_items)
+        for item in _items(1, first):
+            yield item
+        pages = self._aiter_page_range(model, method, args, range(2, total_pages + 1))
+        try:
+            async for page, response in pages:
+                for item in _items(page, response):
+                    yield item
+        finally:
+            await pages.aclose()
 
         if verify:
             new_total = await self.count(model, count_method, args)
@@ -565,7 +809,79 @@ class AsyncBlestaRequest:
                     method,
                 )
 
-        return all_items
+    async def _aiter_page_range(
+        self,
+        model: str,
+        method: str,
+        args: dict[str, Any],
+        pages: range,
+        sem: asyncio.Semaphore | None = None,
+        concurrency: int | None = None,
+    ) -> AsyncGenerator[tuple[int, BlestaResponse], None]:
+        """Fetch *pages* concurrently and yield ``(page, response)`` in order.
+
+        :param model: API model.
+        :param method: API method.
+        :param args: Query parameters (``page`` is set per request).
+        :param pages: Page numbers to fetch.
+        :param sem: Semaphore held for each request. ``None`` uses the
+            client-level ``max_concurrency`` semaphore.
+        :param concurrency: Number of worker tasks. ``None`` uses the
+            client-level ``max_concurrency``.
+        :return: Async iterator of ``(page, response)`` pairs, in *pages* order.
+        """
+        # A fixed pool of ``max_concurrency`` workers pulls page numbers from a
+        # shared iterator, so only that many tasks exist however many pages
+        # there are and no page waits on the slowest page of an arbitrary
+        # batch. Each page resolves a future the consumer awaits in page
+        # order; the ``window`` semaphore stops workers from running more
+        # than ``2 * workers`` pages ahead of the consumer.
+        if not pages:
+            return
+        if sem is None:
+            sem = self._semaphore
+        loop = asyncio.get_running_loop()
+        workers = min(concurrency or self._max_concurrency, len(pages))
+        window = asyncio.Semaphore(2 * workers)
+        pending: dict[int, asyncio.Future[BlestaResponse]] = {}
+        page_numbers = iter(pages)
+
+        def _slot(page: int) -> asyncio.Future[BlestaResponse]:
+            future = pending.get(page)
+            if future is None:
+                future = pending[page] = loop.create_future()
+            return future
+
+        async def _worker() -> None:
+            while True:
+                await window.acquire()
+                page = next(page_numbers, None)
+                if page is None:
+                    window.release()
+                    return
+                future = _slot(page)
+                try:
+                    async with sem:
+                        response = await self.get(model, method, page_args(args, page))
+                    future.set_result(response)
+                except Exception as exc:
+                    future.set_exception(exc)
+                    return
+
+        tasks = [asyncio.ensure_future(_worker()) for _ in range(workers)]
+        try:
+            for page in pages:
+                response = await _slot(page)
+                del pending[page]
+                window.release()
+                yield page, response
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for future in pending.values():
+                if future.done() and not future.cancelled():
+                    future.exception()  # consumed; don't log as unretrieved
 
     async def count(
         self,
@@ -590,6 +906,9 @@ class AsyncBlestaRequest:
                 "count() got HTTP %d for %s/%s", response.status_code, model, method
             )
             return 0
+        fast = _int_response_fast(response.raw)
+        if fast is not None:
+            return fast
         data = response.data
         if data is None:
             return 0
@@ -608,6 +927,9 @@ class AsyncBlestaRequest:
     async def extract(
         self,
         targets: list[tuple[str, str] | tuple[str, str, dict[str, Any]]],
+        max_concurrency: int | None = None,
+        count_method: str | None = None,
+        page_size: int = 25,
     ) -> dict[str, list[Any]]:
         """Fetch multiple paginated endpoints concurrently.
 
@@ -621,9 +943,33 @@ class AsyncBlestaRequest:
         holding the semaphore across its entire pagination run and
         starving other concurrently-extracted targets.
 
+        With *count_method* set, each target is counted first and its
+        pages are then fetched concurrently as well (targets × pages),
+        instead of one page at a time. Targets whose count fails or is
+        ``0`` are paged sequentially.
+
         :param targets: List of extraction targets.
+        :param max_concurrency: Maximum concurrent requests across all
+            targets. ``None`` uses the client-level ``max_concurrency``
+            semaphore.
+        :param count_method: Count method (e.g., ``"getListCount"``)
+            shared by all targets. ``None`` (default) pages each target
+            sequentially.
+        :param page_size: Items per page, used with *count_method*.
+            Defaults to ``25``.
         :return: Dict mapping ``"model.method"`` to list of results.
+        :raises ValueError: If *page_size* or *max_concurrency* is less
+            than ``1``.
         """
+        if page_size < 1:
+            raise ValueError(f"page_size must be >= 1, got {page_size!r}")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        sem = (
+            asyncio.Semaphore(max_concurrency)
+            if max_concurrency is not None
+            else self._semaphore
+        )
 
         async def _fetch(
             target: tuple[str, str] | tuple[str, str, dict[str, Any]],
@@ -634,34 +980,65 @@ class AsyncBlestaRequest:
                 model, method = target  # type: ignore[misc]
                 args = None
             key = f"{model}.{method}"
-            # Paginate manually so the semaphore gates each individual
-            # HTTP request rather than the entire multi-page loop.
             base_args = args or {}
             state = PaginationState(1, None, "warn")
             items: list[Any] = []
+
+            def _take(response: BlestaResponse) -> bool:
+                """Collect one page into *items*; return ``True`` to stop."""
+                if state.check_response(response):
+                    return True
+                data = response.data
+                if state.check_data(data):
+                    return True
+                state.collect(data)
+                if isinstance(data, list):
+                    items.extend(data)
+                    return False
+                items.append(data)
+                return True
+
+            total = 0
+            if count_method is not None:
+                async with sem:
+                    total = await self.count(model, count_method, base_args)
+            if total > 0:
+                pages = self._aiter_page_range(
+                    model,
+                    method,
+                    base_args,
+                    range(1, -(-total // page_size) + 1),
+                    sem,
+                    max_concurrency,
+                )
+                try:
+                    async for page, response in pages:
+                        state.page = page
+                        if _take(response):
+                            break
+                finally:
+                    await pages.aclose()
+                return key, items
+
+            # Paginate manually so the semaphore gates each individual
+            # HTTP request rather than the entire multi-page loop.
             while state.has_next_page():
-                async with self._semaphore:
+                async with sem:
                     response = await self.get(
-                        model, method, {**base_args, "page": state.page}
+                        model, method, page_args(base_args, state.page)
                     )
                 # Yield to the event loop after releasing the semaphore so
                 # other targets waiting on the semaphore can make progress
                 # before this target re-acquires for its next page.
                 await asyncio.sleep(0)
-                if state.check_response(response):
-                    break
-                data = response.data
-                if state.check_data(data):
-                    break
-                state.collect(data)
-                if isinstance(data, list):
-                    items.extend(data)
-                else:
-                    items.append(data)
+                if _take(response):
                     break
                 state.advance()
             return key, items
 
+        # gather rather than asyncio.TaskGroup: TaskGroup needs Python 3.11
+        # and wraps failures in ExceptionGroup, which would change the
+        # BlestaError types callers catch, for a ~2-6% saving at most.
         pairs = await asyncio.gather(*[_fetch(t) for t in targets])
         return dict(pairs)
 
@@ -748,7 +1125,35 @@ class AsyncBlestaRequest:
         :raises ValueError: If *start_month* is after *end_month* or
             the format is invalid.
         """
-        rows: list[dict[str, str]] = []
+        return [
+            row
+            async for row in self.iter_report_series(
+                report_type, start_month, end_month, extra_vars
+            )
+        ]
+
+    async def iter_report_series(
+        self,
+        report_type: str,
+        start_month: str,
+        end_month: str,
+        extra_vars: dict[str, str] | None = None,
+    ) -> AsyncIterator[dict[str, str]]:
+        """Yield report rows month by month.
+
+        Streaming form of :meth:`get_report_series`: each month is
+        fetched only when the previous month's rows have been consumed,
+        so at most one month's rows are held in memory.
+
+        :param report_type: Report type (e.g., ``"package_revenue"``).
+        :param start_month: Start month as ``"YYYY-MM"`` (inclusive).
+        :param end_month: End month as ``"YYYY-MM"`` (inclusive).
+        :param extra_vars: Additional ``vars[]`` parameters.
+        :return: Async iterator of row dicts, in period order.
+        :raises ValueError: If *start_month* is after *end_month* or
+            the format is invalid.
+        """
+        fieldnames: list[str] | None = None
         async for period, response in self.get_report_series_pages(
             report_type, start_month, end_month, extra_vars
         ):
@@ -760,17 +1165,16 @@ class AsyncBlestaRequest:
                     response.status_code,
                 )
                 continue
-            csv_rows = response.csv_data
-            if csv_rows is None:
+            if not response.is_csv:
                 logger.warning(
                     "Report %r for %s: no CSV data in response, skipping",
                     report_type,
                     period,
                 )
                 continue
-            for row in csv_rows:
-                rows.append({**row, "_period": period})
-        return rows
+            month_rows, fieldnames = response._tagged_csv_rows(period, fieldnames)
+            for row in month_rows:
+                yield row
 
     async def get_report_series_concurrent(
         self,
@@ -817,8 +1221,16 @@ class AsyncBlestaRequest:
             *[_fetch_month(fd, ld, p) for fd, ld, p in boundaries]
         )
 
+        return self._report_rows(report_type, results)
+
+    @staticmethod
+    def _report_rows(
+        report_type: str, pages: Iterable[tuple[str, BlestaResponse]]
+    ) -> list[dict[str, str]]:
+        """Flatten ``(period, response)`` pairs into rows tagged with ``_period``."""
         rows: list[dict[str, str]] = []
-        for period, response in results:
+        fieldnames: list[str] | None = None
+        for period, response in pages:
             if response.status_code != 200:
                 logger.warning(
                     "Report %r for %s: HTTP %d, skipping",
@@ -827,16 +1239,15 @@ class AsyncBlestaRequest:
                     response.status_code,
                 )
                 continue
-            csv_rows = response.csv_data
-            if csv_rows is None:
+            if not response.is_csv:
                 logger.warning(
                     "Report %r for %s: no CSV data in response, skipping",
                     report_type,
                     period,
                 )
                 continue
-            for row in csv_rows:
-                rows.append({**row, "_period": period})
+            month_rows, fieldnames = response._tagged_csv_rows(period, fieldnames)
+            rows.extend(month_rows)
         return rows
 
     async def call(
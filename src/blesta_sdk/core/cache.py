@@ -0,0 +1,100 @@
+"""In-memory TTL cache for GET responses, shared by the sync and async clients.
+
+This module is not part of the public API. Enable it with
+``cache_ttl=`` on :class:`~blesta_sdk.BlestaRequest` or
+:class:`~blesta_sdk.AsyncBlestaRequest`.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from blesta_sdk.core.response import BlestaResponse
+
+CacheKey = tuple[str, str]
+
+
+def cache_key(url: str, args: dict[str, Any]) -> CacheKey | None:
+    """Return a hashable key for a GET to *url* with *args*.
+
+    Arguments are serialized with sorted keys so that nested ``dict`` and
+    ``list`` values hash consistently regardless of insertion order.
+
+    :param url: Full request URL.
+    :param args: Query parameters.
+    :return: Cache key, or ``None`` if *args* can't be sorted (e.g. a
+        dict mixing ``int`` and ``str`` keys), in which case the call
+        should bypass the cache.
+    """
+    try:
+        return url, json.dumps(args, sort_keys=True, default=str)
+    except TypeError:
+        return None
+
+
+class ResponseCache:
+    """Least-recently-used cache of responses that expire after *ttl* seconds.
+
+    Safe to share between threads (the sync client fans out over a
+    thread pool in :meth:`~blesta_sdk.BlestaRequest.get_report_series_concurrent`).
+
+    :param ttl: Seconds a cached response stays valid. Must be positive.
+    :param maxsize: Maximum number of cached responses. Must be at
+        least ``1``.
+    :raises ValueError: If *ttl* or *maxsize* is out of range.
+    """
+
+    __slots__ = ("ttl", "maxsize", "_entries", "_lock")
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        if ttl <= 0:
+            raise ValueError(f"cache_ttl must be positive, got {ttl!r}")
+        if maxsize < 1:
+            raise ValueError(f"cache_size must be at least 1, got {maxsize!r}")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, tuple[float, BlestaResponse]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> BlestaResponse | None:
+        """Return the cached response for *key*, or ``None`` if absent or expired.
+
+        :param key: Key from :func:`cache_key`.
+        :return: Cached response or ``None``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, response = entry
+            if time.monotonic() >= expires:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: CacheKey, response: BlestaResponse) -> None:
+        """Store *response* under *key*, evicting the least recently used entry.
+
+        :param key: Key from :func:`cache_key`.
+        :param response: Response to cache.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
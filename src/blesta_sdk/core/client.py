@@ -6,21 +6,30 @@ This module is not part of the public API. Import
 
 from __future__ import annotations
 
+import base64
 import logging
 import time
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
 from typing import Any, Literal
 
 import requests
 from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
+from blesta_sdk.core.cache import ResponseCache, cache_key
 from blesta_sdk.core.dateutil import _month_boundaries
-from blesta_sdk.core.pagination import PaginationState
+from blesta_sdk.core.pagination import PaginationState, page_args
 from blesta_sdk.core.redaction import redact_args
-from blesta_sdk.core.response import BlestaResponse
-from blesta_sdk.core.retry import jitter_delay
-from blesta_sdk.core.validation import validate_segment
+from blesta_sdk.core.response import BlestaResponse, _int_response_fast
+from blesta_sdk.core.retry import (
+    RetryJitter,
+    backoff_delay,
+    retry_after_seconds,
+    validate_retry_options,
+)
+from blesta_sdk.core.validation import endpoint_path, validate_segment
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +37,95 @@ DEFAULT_TIMEOUT = 30
 
 _IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
 
+# HTTP action -> (session method name, keyword the args are sent under).
+# GET sends args as a query string; the others send a JSON body.
+_ACTIONS: dict[str, tuple[str, str]] = {
+    "GET": ("get", "params"),
+    "POST": ("post", "json"),
+    "PUT": ("put", "json"),
+    "DELETE": ("delete", "json"),
+}
+_TRANSIENT_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class _BasicAuth(HTTPBasicAuth):
+    """:class:`~requests.auth.HTTPBasicAuth` with the header built once.
+
+    The stock class base64-encodes ``user:key`` on every request; the
+    credentials never change for a client, so encode them up front.
+    Staying a ``session.auth`` object (rather than a plain session
+    header) keeps requests from looking up ``~/.netrc`` credentials for
+    each request and still lets requests drop the header on cross-host
+    redirects.
+    """
+
+    def __init__(self, username: str, password: str) -> None:
+        super().__init__(username, password)
+        token = base64.b64encode(f"{username}:{password}".encode("latin1"))
+        self._header = "Basic " + token.decode("ascii")
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        r.headers["Authorization"] = self._header
+        return r
+
+
+class _PageFetcher:
+    """Fetch successive pages for one sync pagination run.
+
+    With *prefetch*, :meth:`ahead` starts the next page's request on a
+    single background thread, so it downloads while the caller works
+    through the current page. Without it, :meth:`fetch` is a plain
+    :meth:`BlestaRequest.get`.
+    """
+
+    __slots__ = ("_client", "_model", "_method", "_args", "_pool", "_pending")
+
+    def __init__(
+        self,
+        client: BlestaRequest,
+        model: str,
+        method: str,
+        args: dict[str, Any],
+        prefetch: bool,
+    ) -> None:
+        self._client = client
+        self._model = model
+        self._method = method
+        self._args = args
+        self._pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        self._pending: tuple[int, Future[BlestaResponse]] | None = None
+
+    def fetch(self, page: int) -> BlestaResponse:
+        """Return *page*, waiting on its prefetched request if there is one."""
+        pending = self._pending
+        if pending is not None and pending[0] == page:
+            self._pending = None
+            return pending[1].result()
+        return self._client.get(self._model, self._method, page_args(self._args, page))
+
+    def ahead(self, state: PaginationState) -> None:
+        """Start fetching the page after ``state.page`` if prefetching."""
+        if self._pool is None or not state.has_following_page():
+            return
+        page = state.page + 1
+        future = self._pool.submit(
+            self._client.get, self._model, self._method, page_args(self._args, page)
+        )
+        self._pending = (page, future)
+
+    def close(self) -> None:
+        """Drop any unconsumed prefetch and release the worker thread."""
+        if self._pool is None:
+            return
+        if self._pending is not None:
+            self._pending[1].cancel()
+            self._pending = None
+        self._pool.shutdown(wait=False)
+
 
 class BlestaRequest:
     """HTTP client for the Blesta REST API.
@@ -50,7 +148,10 @@ class BlestaRequest:
         POST and PUT retry **only on 429** (rate-limit) — never on 5xx,
         because a server error does not guarantee the write failed and
         retrying risks duplicate billing records.
-        Uses exponential backoff with jitter. Defaults to ``0`` (no retries).
+        Network errors are retried only when transient (connection
+        failures and timeouts). Waits honour an integer ``Retry-After``
+        header on 429/5xx responses, otherwise back off per
+        *retry_jitter*. Defaults to ``0`` (no retries).
     :param retry_mutations: Include POST and PUT in the retry loop.
         When ``True``, POST/PUT will retry on 429 but still never on 5xx.
         Defaults to ``False``.
@@ -73,6 +174,27 @@ class BlestaRequest:
     :param discovery: Optional :class:`~blesta_sdk.BlestaDiscovery` instance
         to use instead of the module-level singleton. Useful when loading
         schemas from a custom path or when injecting a mock in tests.
+    :param trust_env: When ``False``, the session ignores proxy environment
+        variables and ``~/.netrc``. ``requests`` re-reads both on every
+        call, so disabling this trims per-request overhead for
+        high-volume pagination. Defaults to ``True``.
+    :param retry_base: Base backoff delay in seconds. Defaults to ``1.0``.
+    :param retry_cap: Maximum backoff delay in seconds (``Retry-After``
+        values are not capped). ``None`` disables the cap. Defaults to
+        ``30.0``.
+    :param retry_jitter: Backoff strategy. ``"exponential"`` sleeps
+        ``retry_base * 2 ** attempt`` scaled by a random 50-100%.
+        ``"decorrelated"`` draws each delay from
+        ``[retry_base, 3 * previous delay]``, which spreads out retries
+        from many clients that failed at the same moment. Defaults to
+        ``"exponential"``.
+    :param cache_ttl: Cache successful GET responses (HTTP 200 with
+        no Blesta ``errors``, including :meth:`count` results) in memory
+        for this many seconds, so repeated identical reads skip the
+        network. Cached responses are shared objects — don't mutate
+        their ``data``. ``None`` (default) disables caching.
+    :param cache_size: Maximum number of cached GET responses; the least
+        recently used is evicted first. Defaults to ``256``.
     """
 
     def __init__(
@@ -89,6 +211,12 @@ class BlestaRequest:
         raise_on_error: bool = False,
         allow_http: bool = False,
         discovery: Any = None,
+        trust_env: bool = True,
+        retry_base: float = 1.0,
+        retry_cap: float | None = 30.0,
+        retry_jitter: RetryJitter = "exponential",
+        cache_ttl: float | None = None,
+        cache_size: int = 256,
     ):
         if url.startswith("http://") and not allow_http:
             raise ValueError(
@@ -101,16 +229,25 @@ class BlestaRequest:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_mutations = retry_mutations
+        validate_retry_options(retry_base, retry_cap, retry_jitter)
+        self.retry_base = retry_base
+        self.retry_cap = retry_cap
+        self.retry_jitter = retry_jitter
+        self._cache = (
+            ResponseCache(cache_ttl, cache_size) if cache_ttl is not None else None
+        )
         self.auth_method = auth_method
         self.raise_on_error = raise_on_error
         self._discovery = discovery
+        self._pool_maxsize = pool_maxsize
         self._last_request: dict[str, Any] | None = None
         self.session = requests.Session()
+        self.session.trust_env = trust_env
         if auth_method == "header":
             self.session.headers["BLESTA-API-USER"] = self.user
             self.session.headers["BLESTA-API-KEY"] = self.key
         else:
-            self.session.auth = HTTPBasicAuth(self.user, self.key)
+            self.session.auth = _BasicAuth(self.user, self.key)
         adapter = HTTPAdapter(
             pool_connections=pool_connections,
             pool_maxsize=pool_maxsize,
@@ -131,6 +268,11 @@ class BlestaRequest:
         """Close the underlying HTTP session."""
         self.session.close()
 
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses (no-op when caching is disabled)."""
+        if self._cache is not None:
+            self._cache.clear()
+
     @staticmethod
     def _validate_segment(segment: str, name: str) -> None:
         validate_segment(segment, name)
@@ -225,30 +367,31 @@ class BlestaRequest:
         if args is None:
             args = {}
 
-        self._validate_segment(model, "model")
-        self._validate_segment(method, "method")
-        url = f"{self.base_url}{model}/{method}.json"
+        url = self.base_url + endpoint_path(model, method)
         self._last_request = {"url": url, "args": args.copy()}
 
+        cache = self._cache if action == "GET" else None
+        key = cache_key(url, args) if cache is not None else None
+        if cache is not None and key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        try:
+            send_name, args_kwarg = _ACTIONS[action]
+        except KeyError:
+            raise ValueError("Invalid HTTP action specified.") from None
+
         can_retry = self.retry_mutations or action in _IDEMPOTENT_METHODS
         effective_retries = self.max_retries if can_retry else 0
 
-        last_response: BlestaResponse | None = None
+        delay = self.retry_base
         for attempt in range(effective_retries + 1):
             try:
-                if action == "GET":
-                    response = self.session.get(url, params=args, timeout=self.timeout)
-                elif action == "POST":
-                    response = self.session.post(url, json=args, timeout=self.timeout)
-                elif action == "PUT":
-                    response = self.session.put(url, json=args, timeout=self.timeout)
-                elif action == "DELETE":
-                    response = self.session.delete(url, json=args, timeout=self.timeout)
-                else:
-                    raise ValueError("Invalid HTTP action specified.")
-
-                last_response = BlestaResponse(
-                    response.text, response.status_code, response.headers
+                # Looked up per attempt so a patched or remounted session
+                # method is always the one called.
+                response = getattr(self.session, send_name)(
+                    url, timeout=self.timeout, **{args_kwarg: args}
                 )
 
                 # Mutations (POST/PUT) must never be retried on 5xx — a server
@@ -264,10 +407,25 @@ class BlestaRequest:
                         response.status_code >= 500 or response.status_code == 429
                     )
                 if not is_retriable or attempt == effective_retries:
+                    result = BlestaResponse(
+                        response.text, response.status_code, response.headers
+                    )
+                    # HTTP 200 can still carry Blesta ``errors``; caching
+                    # those would replay them without raise_on_error.
+                    if (
+                        cache is not None
+                        and key is not None
+                        and result.status_code == 200
+                        and result.errors() is None
+                    ):
+                        cache.put(key, result)
                     if self.raise_on_error:
-                        last_response.raise_for_status()
-                    return last_response
+                        result.raise_for_status()
+                    return result
 
+                # The body of a response that is about to be retried is never
+                # read, so don't pay to decode it; only its headers matter.
+                retry_headers: Mapping[str, str] = response.headers
                 logger.warning(
                     "Retry %d/%d: HTTP %d from %s",
                     attempt + 1,
@@ -278,29 +436,30 @@ class BlestaRequest:
 
             except requests.RequestException as e:
                 logger.error("Request failed: %s", e)
-                last_response = BlestaResponse(str(e), 0)
 
-                if attempt == effective_retries:
+                # Only connection failures and timeouts are transient; e.g.
+                # InvalidURL or TooManyRedirects would fail the same way again.
+                transient = isinstance(e, _TRANSIENT_ERRORS)
+                if not transient or attempt == effective_retries:
+                    result = BlestaResponse(str(e), 0)
                     if self.raise_on_error:
-                        last_response.raise_for_status()
-                    return last_response
+                        result.raise_for_status()
+                    return result
 
                 logger.warning("Retry %d/%d: %s", attempt + 1, effective_retries, e)
+                retry_headers = {}
 
-            if last_response is not None and last_response.status_code == 429:
-                try:
-                    retry_after = int(last_response.headers.get("Retry-After", ""))
-                except (ValueError, TypeError):
-                    retry_after = 0
-                if retry_after > 0:
-                    time.sleep(retry_after)
-                    continue
+            retry_after = retry_after_seconds(retry_headers)
+            if retry_after > 0:
+                time.sleep(retry_after)
+                continue
 
-            time.sleep(jitter_delay(attempt))
+            delay = backoff_delay(
+                attempt, delay, self.retry_base, self.retry_cap, self.retry_jitter
+            )
+            time.sleep(delay)
 
-        if last_response is None:  # pragma: no cover
-            raise RuntimeError("Retry loop exited without a response")
-        return last_response  # pragma: no cover
+        raise RuntimeError("Retry loop exited without a response")  # pragma: no cover
 
     def iter_all(
         self,
@@ -310,12 +469,21 @@ class BlestaRequest:
         start_page: int = 1,
         max_pages: int | None = None,
         on_error: Literal["raise", "warn"] = "warn",
+        prefetch: bool = False,
+        page_size: int | None = None,
     ) -> Iterator[Any]:
         """Yield individual items across all pages.
 
         Calls the API with ``page=1``, ``page=2``, etc. until an empty
         response is returned.
 
+        With ``prefetch=True`` the next page is requested on a
+        background thread as soon as the current page is accepted, so
+        its round trip overlaps the caller's work on the current page.
+        The same pages are requested as without prefetching, except that
+        stopping early may leave one request in flight (its result is
+        discarded).
+
         :param model: API model (e.g., ``"invoices"``).
         :param method: API method (e.g., ``"getList"``).
         :param args: Query parameters (``page`` is managed automatically).
@@ -326,27 +494,42 @@ class BlestaRequest:
             raises :class:`~blesta_sdk.PaginationError` with partial
             results attached. ``"warn"`` logs a warning and stops
             iteration (backward-compatible default).
+        :param prefetch: Fetch the next page in the background while
+            the current one is consumed. Defaults to ``False``.
+        :param page_size: The API's page size (``25`` for Blesta's
+            ``getList`` methods). When set, a page with fewer items ends
+            iteration without requesting the empty page after it. Must
+            match the API's page size. ``None`` (default) always walks
+            to the empty page.
         :return: Iterator of individual result items.
         :raises PaginationError: If *on_error* is ``"raise"`` and a
             non-200 response is received.
+        :raises ValueError: If *page_size* is less than 1.
         """
-        base_args = args or {}
-        state = PaginationState(start_page, max_pages, on_error)
+        state = PaginationState(start_page, max_pages, on_error, page_size)
+        fetcher = _PageFetcher(self, model, method, args or {}, prefetch)
 
-        while state.has_next_page():
-            response = self.get(model, method, {**base_args, "page": state.page})
-            if state.check_response(response):
-                return
-            data = response.data
-            if state.check_data(data):
-                return
-            state.collect(data)
-            if isinstance(data, list):
-                yield from data
-            else:
-                yield data
-                return
-            state.advance()
+        try:
+            while state.has_next_page():
+                response = fetcher.fetch(state.page)
+                if state.check_response(response):
+                    return
+                data = response.data
+                if state.check_data(data):
+                    return
+                state.collect(data)
+                if isinstance(data, list):
+                    if state.is_short_page(data):
+                        yield from data
+                        return
+                    fetcher.ahead(state)
+                    yield from data
+                else:
+                    yield data
+                    return
+                state.advance()
+        finally:
+            fetcher.close()
 
     def get_all(
         self,
@@ -356,10 +539,13 @@ class BlestaRequest:
         start_page: int = 1,
         max_pages: int | None = None,
         on_error: Literal["raise", "warn"] = "warn",
+        prefetch: bool = False,
+        page_size: int | None = None,
     ) -> list[Any]:
         """Fetch all pages and return results as a single list.
 
-        Convenience wrapper around :meth:`iter_all`.
+        Convenience wrapper around :meth:`iter_pages`; pages are
+        flattened with :func:`itertools.chain.from_iterable`.
 
         .. warning::
             Materializes all records into memory. For large datasets
@@ -377,11 +563,19 @@ class BlestaRequest:
             raises :class:`~blesta_sdk.PaginationError` with partial
             results attached. ``"warn"`` logs a warning and stops
             iteration (backward-compatible default).
+        :param prefetch: Request each next page while the current one is
+            decoded. See :meth:`iter_all`. Defaults to ``False``.
+        :param page_size: Stop at the first short page. See
+            :meth:`iter_all`. Defaults to ``None``.
         :return: List of all result items across all pages.
         :raises PaginationError: If *on_error* is ``"raise"`` and a
             non-200 response is received.
+        :raises ValueError: If *page_size* is less than 1.
         """
-        return list(self.iter_all(model, method, args, start_page, max_pages, on_error))
+        pages = self.iter_pages(
+            model, method, args, start_page, max_pages, on_error, prefetch, page_size
+        )
+        return list(chain.from_iterable(pages))
 
     def iter_pages(
         self,
@@ -391,6 +585,8 @@ class BlestaRequest:
         start_page: int = 1,
         max_pages: int | None = None,
         on_error: Literal["raise", "warn"] = "warn",
+        prefetch: bool = False,
+        page_size: int | None = None,
     ) -> Iterator[list[Any]]:
         """Yield each page of results as a separate list.
 
@@ -407,27 +603,186 @@ class BlestaRequest:
             raises :class:`~blesta_sdk.PaginationError` with partial
             page count. ``"warn"`` logs a warning and stops
             iteration (backward-compatible default).
+        :param prefetch: Fetch the next page in the background while
+            the current one is consumed. See :meth:`iter_all`. Defaults
+            to ``False``.
+        :param page_size: Stop at the first short page. See
+            :meth:`iter_all`. Defaults to ``None``.
         :return: Iterator of page lists.
         :raises PaginationError: If *on_error* is ``"raise"`` and a
             non-200 response is received.
+        :raises ValueError: If *page_size* is less than 1.
         """
+        state = PaginationState(start_page, max_pages, on_error, page_size)
+        fetcher = _PageFetcher(self, model, method, args or {}, prefetch)
+
+        try:
+            while state.has_next_page():
+                response = fetcher.fetch(state.page)
+                if state.check_response(response):
+                    return
+                data = response.data
+                if state.check_data(data):
+                    return
+                state.collect(data)
+                if isinstance(data, list):
+                    if state.is_short_page(data):
+                        yield data
+                        return
+                    fetcher.ahead(state)
+                    yield data
+                else:
+                    yield [data]
+                    return
+                state.advance()
+        finally:
+            fetcher.close()
+
+    def iter_all_fast(
+        self,
+        model: str,
+        method: str,
+        count_method: str = "getListCount",
+        args: dict[str, Any] | None = None,
+        page_size: int = 25,
+        max_concurrency: int | None = None,
+    ) -> Iterator[Any]:
+        """Yield items from all pages, fetching pages on a thread pool.
+
+        Sync counterpart of
+        :meth:`AsyncBlestaRequest.aiter_all_fast
+        <blesta_sdk.AsyncBlestaRequest.aiter_all_fast>`. Page 1 is
+        requested alongside :meth:`count`; a short page 1 is the whole
+        result. Otherwise the remaining pages are fetched concurrently
+        over this client's session, at most ``2 * max_concurrency``
+        pages ahead of the consumer, and items are yielded in page
+        order. Falls back to :meth:`iter_all` if the count call returns
+        ``0`` or fails. Pages that return a non-200 status are skipped
+        with a warning.
+
+        Breaking out of the loop early cancels the requests that have
+        not started.
+
+        :param model: API model (e.g., ``"transactions"``).
+        :param method: API method (e.g., ``"getList"``).
+        :param count_method: Count method name. Defaults to
+            ``"getListCount"``.
+        :param args: Query parameters (``page`` is managed automatically).
+        :param page_size: Expected items per page. Must match the API's
+            page size. Defaults to ``25``.
+        :param max_concurrency: Maximum concurrent requests. ``None``
+            uses the connection pool size (``pool_maxsize``).
+        :return: Iterator of individual result items.
+        :raises ValueError: If *page_size* or *max_concurrency* is less
+            than 1.
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be >= 1, got {page_size!r}")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
         base_args = args or {}
-        state = PaginationState(start_page, max_pages, on_error)
+        workers = max_concurrency or self._pool_maxsize
 
-        while state.has_next_page():
-            response = self.get(model, method, {**base_args, "page": state.page})
-            if state.check_response(response):
-                return
+        def _items(page: int, response: BlestaResponse) -> list[Any]:
+            if response.status_code != 200:
+                logger.warning(
+                    "get_all_fast: HTTP %d on page %d", response.status_code, page
+                )
+                return []
             data = response.data
-            if state.check_data(data):
-                return
-            state.collect(data)
-            if isinstance(data, list):
-                yield data
-            else:
-                yield [data]
+            if not data:
+                return []
+            return data if isinstance(data, list) else [data]
+
+        pool = ThreadPoolExecutor(max_workers=workers)
+        count_future = pool.submit(self.count, model, count_method, base_args)
+        pending: dict[int, Future[BlestaResponse]] = {}
+        try:
+            first = self.get(model, method, page_args(base_args, 1))
+            if first.status_code == 200:
+                data = first.data
+                if not isinstance(data, list) or len(data) < page_size:
+                    yield from _items(1, first)
+                    return
+            total = count_future.result()
+
+            if total <= 0:
+                logger.debug(
+                    "get_all_fast: count returned %d for %s/%s, falling back to "
+                    "iter_all",
+                    total,
+                    model,
+                    method,
+                )
+                start_page = 1
+                if first.status_code == 200:
+                    yield from _items(1, first)
+                    start_page = 2
+                yield from self.iter_all(model, method, base_args, start_page)
                 return
-            state.advance()
+
+            total_pages = -(-total // page_size)  # ceil division
+            logger.debug(
+                "get_all_fast: %d records, %d pages for %s/%s",
+                total,
+                total_pages,
+                model,
+                method,
+            )
+            yield from _items(1, first)
+            next_page = 2
+            for page in range(2, total_pages + 1):
+                while next_page <= total_pages and len(pending) < 2 * workers:
+                    pending[next_page] = pool.submit(
+                        self.get, model, method, page_args(base_args, next_page)
+                    )
+                    next_page += 1
+                yield from _items(page, pending.pop(page).result())
+        finally:
+            count_future.cancel()
+            for future in pending.values():
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    def get_all_fast(
+        self,
+        model: str,
+        method: str,
+        count_method: str = "getListCount",
+        args: dict[str, Any] | None = None,
+        page_size: int = 25,
+        max_concurrency: int | None = None,
+    ) -> list[Any]:
+        """Fetch all pages concurrently using a count-first strategy.
+
+        Collects :meth:`iter_all_fast` into a list.
+
+        .. warning::
+            Materializes all records into memory. For large datasets,
+            prefer :meth:`iter_all_fast`.
+
+        .. note::
+            The count is a snapshot; records may change between the
+            count and fetch phases.
+
+        :param model: API model (e.g., ``"transactions"``).
+        :param method: API method (e.g., ``"getList"``).
+        :param count_method: Count method name. Defaults to
+            ``"getListCount"``.
+        :param args: Query parameters (``page`` is managed automatically).
+        :param page_size: Expected items per page. Must match the API's
+            page size. Defaults to ``25``.
+        :param max_concurrency: Maximum concurrent requests. ``None``
+            uses the connection pool size (``pool_maxsize``).
+        :return: List of all result items, in page order.
+        :raises ValueError: If *page_size* or *max_concurrency* is less
+            than 1.
+        """
+        return list(
+            self.iter_all_fast(
+                model, method, count_method, args, page_size, max_concurrency
+            )
+        )
 
     def count(
         self,
@@ -452,6 +807,9 @@ class BlestaRequest:
                 "count() got HTTP %d for %s/%s", response.status_code, model, method
             )
             return 0
+        fast = _int_response_fast(response.raw)
+        if fast is not None:
+            return fast
         data = response.data
         if data is None:
             return 0
@@ -572,10 +930,91 @@ class BlestaRequest:
         :raises ValueError: If *start_month* is after *end_month* or
             the format is invalid.
         """
-        rows: list[dict[str, str]] = []
-        for period, response in self.get_report_series_pages(
+        return list(
+            self.iter_report_series(report_type, start_month, end_month, extra_vars)
+        )
+
+    def iter_report_series(
+        self,
+        report_type: str,
+        start_month: str,
+        end_month: str,
+        extra_vars: dict[str, str] | None = None,
+    ) -> Iterator[dict[str, str]]:
+        """Yield report rows month by month.
+
+        Streaming form of :meth:`get_report_series`: each month is
+        fetched only when the previous month's rows have been consumed,
+        so at most one month's rows are held in memory. Rows carry the
+        same ``"_period"`` key, and failed or non-CSV months are skipped
+        with the same warnings.
+
+        :param report_type: Report type (e.g., ``"package_revenue"``).
+        :param start_month: Start month as ``"YYYY-MM"`` (inclusive).
+        :param end_month: End month as ``"YYYY-MM"`` (inclusive).
+        :param extra_vars: Additional ``vars[]`` parameters.
+        :return: Iterator of row dicts, in period order.
+        :raises ValueError: If *start_month* is after *end_month* or
+            the format is invalid.
+        """
+        pages = self.get_report_series_pages(
             report_type, start_month, end_month, extra_vars
-        ):
+        )
+        return self._iter_report_rows(report_type, pages)
+
+    def get_report_series_concurrent(
+        self,
+        report_type: str,
+        start_month: str,
+        end_month: str,
+        extra_vars: dict[str, str] | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[dict[str, str]]:
+        """Fetch monthly reports concurrently and return all rows.
+
+        Unlike :meth:`get_report_series`, which fetches months
+        sequentially, this method fetches them on a thread pool sharing
+        this client's session. Results are identical, in period order.
+
+        Each returned row dict has a ``"_period"`` key added with the
+        ``"YYYY-MM"`` value. Months that return errors or non-CSV
+        responses are skipped with a warning log.
+
+        :param report_type: Report type (e.g., ``"package_revenue"``).
+        :param start_month: Start month as ``"YYYY-MM"`` (inclusive).
+        :param end_month: End month as ``"YYYY-MM"`` (inclusive).
+        :param extra_vars: Additional ``vars[]`` parameters.
+        :param max_concurrency: Maximum concurrent requests. ``None``
+            uses the connection pool size (``pool_maxsize``) so no
+            request has to open a connection outside the pool.
+        :return: Flat list of row dicts from all months, ordered by period.
+        :raises ValueError: If *start_month* is after *end_month*, the
+            format is invalid, or *max_concurrency* is less than 1.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        boundaries = _month_boundaries(start_month, end_month)
+        workers = min(max_concurrency or self._pool_maxsize, len(boundaries))
+
+        def _fetch_month(boundary: tuple[str, str, str]) -> tuple[str, BlestaResponse]:
+            first_day, last_day, period = boundary
+            logger.debug("Fetching report %r for %s", report_type, period)
+            return (
+                period,
+                self.get_report(report_type, first_day, last_day, extra_vars),
+            )
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pages = list(pool.map(_fetch_month, boundaries))
+        return list(self._iter_report_rows(report_type, pages))
+
+    @staticmethod
+    def _iter_report_rows(
+        report_type: str, pages: Iterable[tuple[str, BlestaResponse]]
+    ) -> Iterator[dict[str, str]]:
+        """Flatten ``(period, response)`` pairs into rows tagged with ``_period``."""
+        fieldnames: list[str] | None = None
+        for period, response in pages:
             if response.status_code != 200:
                 logger.warning(
                     "Report %r for %s: HTTP %d, skipping",
@@ -584,17 +1023,15 @@ class BlestaRequest:
                     response.status_code,
                 )
                 continue
-            csv_rows = response.csv_data
-            if csv_rows is None:
+            if not response.is_csv:
                 logger.warning(
                     "Report %r for %s: no CSV data in response, skipping",
                     report_type,
                     period,
                 )
                 continue
-            for row in csv_rows:
-                rows.append({**row, "_period": period})
-        return rows
+            month_rows, fieldnames = response._tagged_csv_rows(period, fieldnames)
+            yield from month_rows
 
     def call(
         self,
@@ -4,16 +4,26 @@ from __future__ import annotations
 
 import calendar
 from datetime import date
+from functools import lru_cache
 
 
 def _month_boundaries(start_month: str, end_month: str) -> list[tuple[str, str, str]]:
     """Generate (first_day, last_day, period) for each month in range.
 
+    Ranges are computed once per ``(start_month, end_month)`` pair and
+    cached; each call returns a fresh list.
+
     :param start_month: Start month as "YYYY-MM" (e.g., "2020-01").
     :param end_month: End month as "YYYY-MM" (e.g., "2026-12"), inclusive.
     :return: List of tuples ("YYYY-MM-DD", "YYYY-MM-DD", "YYYY-MM").
     :raises ValueError: If start_month > end_month or format is invalid.
     """
+    return list(_month_range(start_month, end_month))
+
+
+@lru_cache(maxsize=64)
+def _month_range(start_month: str, end_month: str) -> tuple[tuple[str, str, str], ...]:
+    """Cached worker for :func:`_month_boundaries` (see there for details)."""
     try:
         start_year, start_mon = (int(x) for x in start_month.split("-"))
         end_year, end_mon = (int(x) for x in end_month.split("-"))
@@ -40,4 +50,4 @@ def _month_boundaries(start_month: str, end_month: str) -> list[tuple[str, str,
         period = f"{y:04d}-{m:02d}"
         result.append((first, last, period))
         current = date(y + 1, 1, 1) if m == 12 else date(y, m + 1, 1)
-    return result
+    return tuple(result)
@@ -0,0 +1,50 @@
+"""JSON encode/decode helpers shared by the SDK.
+
+This module is not part of the public API. When ``orjson`` is installed
+(``pip install blesta_sdk[fast]``) it is used for both directions;
+otherwise the stdlib :mod:`json` module is used. Both backends raise a
+:class:`ValueError` subclass on malformed input (``orjson.JSONDecodeError``
+subclasses :class:`json.JSONDecodeError`), so callers can catch
+:class:`json.JSONDecodeError` regardless of which backend is active.
+
+Decoding is always eager and returns plain ``dict``/``list`` objects.
+Lazy "on-demand" parsers such as ``pysimdjson`` are deliberately not used:
+their proxy objects would leak through :attr:`BlestaResponse.data`, and a
+reused ``simdjson.Parser`` invalidates documents it parsed earlier, which
+conflicts with :class:`~blesta_sdk.BlestaResponse` caching its parse result.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON document from *data*.
+
+    :param data: JSON text as ``str`` or UTF-8 ``bytes``.
+    :return: Decoded Python object.
+    :raises json.JSONDecodeError: If *data* is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize *obj* to a compact JSON ``str``.
+
+    :param obj: JSON-serializable object.
+    :return: JSON text.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
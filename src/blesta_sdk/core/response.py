@@ -10,14 +10,60 @@ import contextlib
 import csv
 import io
 import json
-from collections.abc import Mapping
+import re
+from collections.abc import Iterator, Mapping
 from typing import TYPE_CHECKING, Any
 
+from blesta_sdk.core import jsonutil
+
 if TYPE_CHECKING:
     import pandas
 
 
-_UNSET = object()
+class _Unset:
+    """Marker for a not-yet-computed cache slot."""
+
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        # Pickle by reference so copies keep ``is _UNSET`` checks working.
+        return "_UNSET"
+
+
+_UNSET = _Unset()
+
+# Line boundaries recognised by ``str.splitlines``.
+_LINE_BREAK_RE = re.compile("[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# First character that ``str.strip`` would keep (``\s`` and ``str.isspace``
+# agree on every code point).
+_NON_SPACE_RE = re.compile(r"\S")
+
+# Characters a JSON document can start with. ``N``/``I`` cover the ``NaN`` and
+# ``Infinity`` literals the stdlib decoder accepts.
+_JSON_START = frozenset('{["tfn-0123456789NI')
+
+# Matches a body that is exactly ``{"response": <int>}`` (the shape returned
+# by Blesta ``*Count`` methods), with the integer optionally quoted.
+_INT_RESPONSE_RE = re.compile(r'\s*\{\s*"response"\s*:\s*(?:(-?\d+)|"(-?\d+)")\s*\}\s*')
+
+
+def _int_response_fast(raw: str | None) -> int | None:
+    """Return the integer in a ``{"response": <int>}`` body without JSON decoding.
+
+    Count endpoints are called once per paginated fetch, and their bodies
+    are a single integer; a full-match regex skips building the dict.
+
+    :param raw: Raw response body.
+    :return: The integer, or ``None`` if *raw* has any other shape (the
+        caller should fall back to the regular JSON path).
+    """
+    if not raw:
+        return None
+    match = _INT_RESPONSE_RE.fullmatch(raw)
+    if match is None:
+        return None
+    return int(match.group(1) or match.group(2))
 
 
 class BlestaResponse:
@@ -31,6 +77,19 @@ class BlestaResponse:
     :param headers: HTTP response headers. Defaults to empty.
     """
 
+    # One instance is created per API call (a paginated fetch holds one per
+    # page), so skip the per-instance ``__dict__``.
+    __slots__ = (
+        "_raw",
+        "_status_code",
+        "_headers",
+        "_parsed",
+        "_json_valid",
+        "_is_csv",
+        "_csv_cache",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         response: str | None,
@@ -95,17 +154,29 @@ class BlestaResponse:
         return self._is_csv
 
     def _compute_is_csv(self) -> bool:
-        """Compute whether the raw response is CSV data (called at most once)."""
-        if self._status_code != 200:
+        """Compute whether the raw response is CSV data (called at most once).
+
+        Only bodies starting with ``{`` or ``[`` are tried as JSON (the
+        parse is cached for :attr:`data`). Any other valid JSON document is a
+        scalar, which fits on one line and so can never pass the two-line
+        CSV check, so ordinary CSV bodies are never run through the decoder.
+        """
+        raw = self._raw
+        if self._status_code != 200 or not raw:
             return False
-        if not self._raw or not self._raw.strip():
+        # Equivalent to checking ``raw.strip()``, without copying the body:
+        # the header runs from the first non-space character to the first
+        # line break, and something other than whitespace must follow it.
+        first = _NON_SPACE_RE.search(raw)
+        if first is None:
             return False
-        if self.is_json:
+        start = first.start()
+        match = _LINE_BREAK_RE.search(raw, start)
+        if match is None or raw.find(",", start, match.start()) < 0:
             return False
-        lines = self._raw.strip().splitlines()
-        if len(lines) < 2:
+        if _NON_SPACE_RE.search(raw, match.end()) is None:
             return False
-        return "," in lines[0]
+        return raw[start] not in "{[" or not self.is_json
 
     @property
     def csv_data(self) -> list[dict[str, str]] | None:
@@ -125,6 +196,79 @@ class BlestaResponse:
         self._csv_cache = list(reader)
         return self._csv_cache
 
+    def iter_csv_data(self) -> Iterator[dict[str, str]] | None:
+        """Iterate over CSV rows without building the full list.
+
+        Streaming counterpart of :attr:`csv_data`: rows are parsed one
+        at a time as the iterator is consumed and are not cached. If
+        :attr:`csv_data` has already been populated, its rows are
+        iterated instead of re-parsing.
+
+        :return: Iterator of dicts (one per row, keyed by header column),
+            or ``None`` if :attr:`is_csv` is ``False``.
+        """
+        if self._csv_cache is not _UNSET:
+            cached: list[dict[str, str]] | None = self._csv_cache  # type: ignore[assignment]
+            return None if cached is None else iter(cached)
+        if not self.is_csv:
+            return None
+        return iter(csv.DictReader(io.StringIO(self._raw)))
+
+    def _tagged_csv_rows(
+        self, period: str, fieldnames: list[str] | None = None
+    ) -> tuple[list[dict[str, str]], list[str] | None]:
+        """Parse CSV rows with a ``"_period"`` key added, for report series.
+
+        Rows are built straight from :func:`csv.reader` with ``"_period"``
+        appended as a final column, so each row dict is created once,
+        already tagged — no :class:`csv.DictReader` per-row bookkeeping
+        and no second pass to insert the key. :attr:`csv_data`'s cache is
+        never mutated (if it is already populated, its rows are copied
+        instead). When this response's header matches *fieldnames* — the
+        previous month's header — that list is reused as the key set, so
+        every month's rows share the same key strings. Headers with a
+        repeated column name or rows whose field count differs from the
+        header's fall back to :class:`csv.DictReader`, whose key handling
+        for those cases is preserved.
+
+        Callers must check :attr:`is_csv` first.
+
+        :param period: ``"YYYY-MM"`` value for the ``"_period"`` key.
+        :param fieldnames: Header returned by the previous call, if any.
+        :return: ``(rows, fieldnames)`` — pass *fieldnames* to the next call.
+        """
+        if self._csv_cache is not _UNSET and self._csv_cache is not None:
+            cached: list[dict[str, str]] = self._csv_cache  # type: ignore[assignment]
+            return [{**row, "_period": period} for row in cached], fieldnames
+        reader = csv.reader(io.StringIO(self._raw))
+        header = next(reader, None)
+        if header is None:
+            return [], None
+        if header == fieldnames:
+            header = fieldnames  # type: ignore[assignment]
+        width = len(header)
+        if len(set(header)) == width:
+            keys = (*header, "_period")
+            rows: list[dict[str, str]] = []
+            append = rows.append
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) != width:
+                    break
+                row.append(period)
+                append(dict(zip(keys, row)))
+            else:
+                return rows, header
+
+        dict_reader = csv.DictReader(io.StringIO(self._raw))
+        dict_reader.fieldnames = header
+        next(dict_reader.reader, None)  # header row, already read above
+        rows = list(dict_reader)
+        for tagged in rows:
+            tagged["_period"] = period
+        return rows, header
+
     def to_dataframe(self) -> pandas.DataFrame:
         """Convert the response to a :class:`pandas.DataFrame`.
 
@@ -146,6 +290,10 @@ class BlestaResponse:
             ) from err
 
         if self.is_csv:
+            if self._csv_cache is _UNSET:
+                frame = self._csv_frame(pd)
+                if frame is not None:
+                    return frame
             data = self.csv_data
             if not data:
                 return pd.DataFrame()
@@ -166,6 +314,27 @@ class BlestaResponse:
             "Response is neither CSV nor JSON; cannot convert to DataFrame"
         )
 
+    def _csv_frame(self, pd: Any) -> pandas.DataFrame | None:
+        """Build a DataFrame straight from ``csv.reader`` rows.
+
+        Skips the intermediate list of row dicts that :attr:`csv_data`
+        would build. Returns ``None`` — so the caller falls back to
+        :attr:`csv_data` — when the header repeats a column name or any
+        row's field count differs from the header's, where
+        :class:`csv.DictReader`'s key handling must be preserved.
+        """
+        reader = csv.reader(io.StringIO(self._raw))
+        header = next(reader, None)
+        if not header or len(set(header)) != len(header):
+            return None
+        rows = [row for row in reader if row]
+        width = len(header)
+        if any(len(row) != width for row in rows):
+            return None
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows, columns=header)
+
     def raise_for_status(self) -> None:
         """Raise an exception if the response indicates an error.
 
@@ -284,12 +453,19 @@ class BlestaResponse:
     def _format_response(self) -> dict[str, Any]:
         """Parse raw response as JSON, returning a fallback on failure."""
         if self._parsed is _UNSET:
-            if not self._raw or not self._raw.strip():
+            raw = self._raw
+            first = _NON_SPACE_RE.search(raw) if raw else None
+            if first is None:
                 self._parsed = {"error": "Empty response body"}
                 self._json_valid = False
             else:
+                if raw[first.start()] not in _JSON_START:
+                    # Cannot be JSON (CSV, HTML, ...). Decode only up to the
+                    # offending character: the decoder fails with the same
+                    # message and position without scanning the whole body.
+                    raw = raw[: first.end()]
                 try:
-                    result = json.loads(self._raw)
+                    result = jsonutil.loads(raw)
                     if isinstance(result, dict):
                         self._parsed = result
                     else:
@@ -3,6 +3,12 @@
 from __future__ import annotations
 
 import random
+from collections.abc import Mapping
+from typing import Literal
+
+RetryJitter = Literal["exponential", "decorrelated"]
+
+_RETRY_JITTERS = ("exponential", "decorrelated")
 
 
 def jitter_delay(attempt: int) -> float:
@@ -17,3 +23,69 @@ def jitter_delay(attempt: int) -> float:
     """
     base = 2**attempt
     return base * (0.5 + random.random() * 0.5)  # noqa: S311
+
+
+def decorrelated_delay(previous: float, base: float) -> float:
+    """Return a "decorrelated jitter" delay drawn from ``[base, 3 * previous]``.
+
+    Each delay depends on the previous one rather than on the attempt
+    number, so clients that failed at the same moment drift apart instead
+    of retrying on the same exponential boundaries.
+
+    :param previous: The previous delay (``base`` before the first retry).
+    :param base: Minimum delay in seconds.
+    :return: Sleep duration in seconds.
+    """
+    return base + random.random() * (previous * 3 - base)  # noqa: S311
+
+
+def backoff_delay(
+    attempt: int,
+    previous: float,
+    base: float,
+    cap: float | None,
+    jitter: RetryJitter,
+) -> float:
+    """Return the sleep before retry *attempt* for the configured strategy.
+
+    :param attempt: Zero-based attempt index (0 on the first retry).
+    :param previous: The previous delay, used by ``"decorrelated"``.
+    :param base: Base delay in seconds (scales ``"exponential"``).
+    :param cap: Upper bound in seconds, or ``None`` for no bound.
+    :param jitter: ``"exponential"`` or ``"decorrelated"``.
+    :return: Sleep duration in seconds.
+    """
+    if jitter == "decorrelated":
+        delay = decorrelated_delay(previous, base)
+    else:
+        delay = base * jitter_delay(attempt)
+    return delay if cap is None else min(cap, delay)
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> int:
+    """Parse an integer ``Retry-After`` header, returning ``0`` if absent/invalid.
+
+    :param headers: Response headers.
+    :return: Seconds to wait, or ``0``.
+    """
+    try:
+        return max(int(headers.get("Retry-After", "")), 0)
+    except (ValueError, TypeError):
+        return 0
+
+
+def validate_retry_options(
+    retry_base: float, retry_cap: float | None, retry_jitter: str
+) -> None:
+    """Validate the backoff constructor options shared by both clients.
+
+    :raises ValueError: If any option is out of range.
+    """
+    if retry_base <= 0:
+        raise ValueError("retry_base must be > 0")
+    if retry_cap is not None and retry_cap < retry_base:
+        raise ValueError("retry_cap must be >= retry_base")
+    if retry_jitter not in _RETRY_JITTERS:
+        raise ValueError(
+            f"retry_jitter must be one of {_RETRY_JITTERS}, got {retry_jitter!r}"
+        )
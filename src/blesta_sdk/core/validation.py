@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 
 def validate_segment(segment: str, name: str) -> None:
     """Validate a URL path segment (model or method name).
@@ -39,3 +41,21 @@ def validate_segment(segment: str, name: str) -> None:
             f"{name} cannot contain percent-encoded characters "
             "(e.g. %2F, %2e%2e, %00)"
         )
+
+
+@lru_cache(maxsize=512)
+def endpoint_path(model: str, method: str) -> str:
+    """Validate *model* and *method* and return ``"model/method.json"``.
+
+    Paginated and fan-out calls hit the same endpoint many times, so the
+    result is memoized; only pairs that pass validation are cached
+    (a :class:`ValueError` is raised again on every call).
+
+    :param model: API model (e.g., ``"clients"`` or ``"plugin.model"``).
+    :param method: API method (e.g., ``"getList"``).
+    :return: Endpoint path relative to the API base URL.
+    :raises ValueError: If either segment is unsafe.
+    """
+    validate_segment(model, "model")
+    validate_segment(method, "method")
+    return f"{model}/{method}.json"
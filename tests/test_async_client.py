@@ -2,7 +2,7 @@
 
 import asyncio
 import json
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock, PropertyMock, patch
 
 import pytest
 
@@ -47,6 +47,86 @@ async def test_async_header_auth_request_succeeds():
     assert response.status_code == 200
 
 
+async def test_async_custom_transport_handles_requests():
+    """A supplied transport receives the SDK's requests."""
+    import httpx
+
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"response": 3})
+
+    api = AsyncBlestaRequest(
+        "https://example.com/api",
+        "user",
+        "key",
+        transport=httpx.MockTransport(handler),
+    )
+    async with api:
+        assert await api.count("clients") == 3
+    assert seen[0].url.path == "/api/clients/getListCount.json"
+
+
+async def test_async_shared_http_client_sends_per_instance_credentials():
+    """Instances sharing an http_client keep their own auth and leave it open."""
+    import httpx
+
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"response": 1})
+
+    shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    basic = AsyncBlestaRequest(
+        "https://example.com/api", "alice", "k1", http_client=shared
+    )
+    header = AsyncBlestaRequest(
+        "https://example.com/api",
+        "bob",
+        "k2",
+        auth_method="header",
+        http_client=shared,
+    )
+    async with basic, header:
+        await basic.count("clients")
+        await header.count("clients")
+
+    assert (
+        seen[0].headers["Authorization"] == httpx.BasicAuth("alice", "k1")._auth_header
+    )
+    assert "BLESTA-API-USER" not in seen[0].headers
+    assert seen[1].headers["BLESTA-API-USER"] == "bob"
+    assert "Authorization" not in seen[1].headers
+    assert not shared.is_closed
+    await shared.aclose()
+
+
+def test_async_http2_passed_to_httpx():
+    """http2=True is forwarded to httpx.AsyncClient (off by default)."""
+    import httpx
+
+    with patch.object(httpx, "AsyncClient") as mock_client:
+        AsyncBlestaRequest("https://example.com/api", "user", "key")
+        AsyncBlestaRequest("https://example.com/api", "user", "key", http2=True)
+    assert mock_client.call_args_list[0].kwargs["http2"] is False
+    assert mock_client.call_args_list[1].kwargs["http2"] is True
+
+
+def test_async_keepalive_expiry_passed_to_limits():
+    """keepalive_expiry is forwarded to httpx.Limits (httpx default 5s)."""
+    import httpx
+
+    with patch.object(httpx, "AsyncClient") as mock_client:
+        AsyncBlestaRequest("https://example.com/api", "user", "key")
+        AsyncBlestaRequest(
+            "https://example.com/api", "user", "key", keepalive_expiry=60
+        )
+    assert mock_client.call_args_list[0].kwargs["limits"].keepalive_expiry == 5.0
+    assert mock_client.call_args_list[1].kwargs["limits"].keepalive_expiry == 60
+
+
 # --- Constructor / repr ---
 
 
@@ -181,6 +261,74 @@ async def test_async_retry_exhausted(mock_sleep, _mock_random):
     assert mock_sleep.call_count == 2
 
 
+@patch("blesta_sdk._retry.random.random", return_value=1.0)
+@patch("blesta_sdk._async_client.asyncio.sleep", new_callable=AsyncMock)
+async def test_async_retry_decorrelated_jitter(mock_sleep, _mock_random):
+    """retry_jitter="decorrelated" chains delays from the previous one."""
+    api = AsyncBlestaRequest(
+        "https://example.com/api",
+        "u",
+        "k",
+        max_retries=2,
+        retry_jitter="decorrelated",
+    )
+    with patch.object(
+        api.client,
+        "get",
+        new_callable=AsyncMock,
+        return_value=Mock(text="error", status_code=502, headers={}),
+    ):
+        await api.get("clients", "getList")
+    assert mock_sleep.call_args_list == [((3.0,),), ((9.0,),)]
+
+
+@patch("blesta_sdk._async_client.asyncio.sleep", new_callable=AsyncMock)
+async def test_async_retry_after_honoured_on_503(mock_sleep):
+    api = AsyncBlestaRequest("https://example.com/api", "u", "k", max_retries=1)
+    responses = [
+        Mock(text="busy", status_code=503, headers={"Retry-After": "7"}),
+        Mock(text='{"response": []}', status_code=200, headers={}),
+    ]
+    with patch.object(api.client, "get", new_callable=AsyncMock, side_effect=responses):
+        response = await api.get("clients", "getList")
+    assert response.status_code == 200
+    mock_sleep.assert_called_once_with(7)
+
+
+@patch("blesta_sdk._retry.random.random", return_value=1.0)
+@patch("blesta_sdk._async_client.asyncio.sleep", new_callable=AsyncMock)
+async def test_async_retried_response_body_not_decoded(mock_sleep, _mock_random):
+    """Only the returned attempt's body is read; retried ones are skipped."""
+    api = AsyncBlestaRequest("https://example.com/api", "u", "k", max_retries=1)
+    retried = Mock(status_code=503, headers={})
+    type(retried).text = PropertyMock(side_effect=AssertionError("body decoded"))
+    responses = [
+        retried,
+        Mock(text='{"response": []}', status_code=200, headers={}),
+    ]
+    with patch.object(api.client, "get", new_callable=AsyncMock, side_effect=responses):
+        response = await api.get("clients", "getList")
+    assert response.status_code == 200
+
+
+@patch("blesta_sdk._async_client.asyncio.sleep", new_callable=AsyncMock)
+async def test_async_no_retry_on_non_transient_error(mock_sleep):
+    """Non-transport httpx errors are returned without retrying."""
+    import httpx
+
+    api = AsyncBlestaRequest("https://example.com/api", "u", "k", max_retries=3)
+    with patch.object(
+        api.client,
+        "get",
+        new_callable=AsyncMock,
+        side_effect=httpx.TooManyRedirects("loop"),
+    ) as mock_get:
+        response = await api.get("clients", "getList")
+    assert response.status_code == 0
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
+
+
 async def test_async_no_retry_on_4xx(async_api):
     """4xx responses are not retried."""
     mock_response = Mock(text='{"errors": {"message": "not found"}}', status_code=404)
@@ -246,6 +394,117 @@ async def test_async_iter_all_single_object(async_api):
     assert result == [{"id": 1, "name": "test"}]
 
 
+def _counted_pages(total: int, pages: dict[int, object]):
+    """Fake ``client.get`` answering a count call and per-page lists."""
+    requested: list[int] = []
+
+    async def fake_get(url: str, **kwargs: object) -> object:
+        if "getListCount" in url:
+            return Mock(text=json.dumps({"response": total}), status_code=200)
+        page = kwargs["params"]["page"]
+        requested.append(page)
+        await asyncio.sleep(0.001 * (10 - page))  # later pages finish first
+        body = pages.get(page, [])
+        if isinstance(body, int):
+            return Mock(text="error", status_code=body)
+        return Mock(text=json.dumps({"response": body}), status_code=200)
+
+    return fake_get, requested
+
+
+async def test_async_iter_all_count_method_fetches_known_pages(async_api):
+    """iter_all(count_method=...) requests exactly the counted pages, in order."""
+    fake_get, requested = _counted_pages(
+        5, {1: [{"id": 1}, {"id": 2}], 2: [{"id": 3}, {"id": 4}], 3: [{"id": 5}]}
+    )
+    with patch.object(async_api.client, "get", side_effect=fake_get):
+        result = [
+            item
+            async for item in async_api.iter_all(
+                "clients", "getList", count_method="getListCount", page_size=2
+            )
+        ]
+    assert [item["id"] for item in result] == [1, 2, 3, 4, 5]
+    assert sorted(requested) == [1, 2, 3]  # no trailing empty-page probe
+
+
+async def test_async_iter_all_count_method_respects_start_and_max_pages(async_api):
+    """start_page and max_pages narrow the concurrently fetched range."""
+    fake_get, requested = _counted_pages(8, {p: [{"id": p}] for p in range(1, 9)})
+    with patch.object(async_api.client, "get", side_effect=fake_get):
+        result = [
+            item
+            async for item in async_api.iter_all(
+                "clients",
+                "getList",
+                start_page=3,
+                max_pages=4,
+                count_method="getListCount",
+                page_size=1,
+            )
+        ]
+    assert [item["id"] for item in result] == [3, 4, 5, 6]
+    assert sorted(requested) == [3, 4, 5, 6]
+
+
+async def test_async_iter_all_count_method_raise_keeps_partial_items(async_api):
+    """on_error='raise' reports the failing page and items before it."""
+    from blesta_sdk import PaginationError
+
+    fake_get, _ = _counted_pages(3, {1: [{"id": 1}], 2: 500, 3: [{"id": 3}]})
+    with (
+        patch.object(async_api.client, "get", side_effect=fake_get),
+        pytest.raises(PaginationError) as exc_info,
+    ):
+        _ = [
+            item
+            async for item in async_api.iter_all(
+                "clients",
+                "getList",
+                on_error="raise",
+                count_method="getListCount",
+                page_size=1,
+            )
+        ]
+    assert exc_info.value.page == 2
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.partial_items == [{"id": 1}]
+
+
+async def test_async_iter_all_count_method_falls_back_when_count_fails(async_api):
+    """A failed count call falls back to the sequential probe."""
+    responses = [
+        Mock(text="error", status_code=500),
+        Mock(text=json.dumps({"response": [{"id": 1}]}), status_code=200),
+        Mock(text=json.dumps({"response": []}), status_code=200),
+    ]
+    with patch.object(
+        async_api.client, "get", new_callable=AsyncMock, side_effect=responses
+    ):
+        result = [
+            item
+            async for item in async_api.iter_all(
+                "clients", "getList", count_method="getListCount"
+            )
+        ]
+    assert result == [{"id": 1}]
+
+
+async def test_async_iter_all_rejects_page_size_below_one(async_api):
+    """page_size < 1 raises ValueError before any request is sent."""
+    with (
+        patch.object(async_api.client, "get", new_callable=AsyncMock) as mock_get,
+        pytest.raises(ValueError, match="page_size must be >= 1"),
+    ):
+        _ = [
+            item
+            async for item in async_api.iter_all(
+                "clients", "getList", count_method="getListCount", page_size=0
+            )
+        ]
+    mock_get.assert_not_called()
+
+
 # --- count() ---
 
 
@@ -399,6 +658,21 @@ async def test_async_get_report_series_skips_non_csv(async_api):
     assert rows[0]["_period"] == "2025-02"
 
 
+async def test_async_iter_report_series_fetches_months_lazily(async_api):
+    """iter_report_series requests the next month only when it is needed."""
+    mock_response = Mock(text="Package,Revenue\nPkg1,100", status_code=200)
+    with patch.object(
+        async_api.client, "get", new_callable=AsyncMock, return_value=mock_response
+    ) as mock_get:
+        rows = async_api.iter_report_series("package_revenue", "2025-01", "2025-03")
+        first = await rows.__anext__()
+        assert first["_period"] == "2025-01"
+        assert mock_get.call_count == 1
+        rest = [row["_period"] async for row in rows]
+    assert rest == ["2025-02", "2025-03"]
+    assert mock_get.call_count == 3
+
+
 # --- get_report_series_concurrent() ---
 
 
@@ -471,7 +745,7 @@ async def test_async_get_all_fast(async_api):
         async_api.client,
         "get",
         new_callable=AsyncMock,
-        side_effect=[count_resp, page1_resp, page2_resp],
+        side_effect=[page1_resp, count_resp, page2_resp],
     ):
         result = await async_api.get_all_fast("transactions", "getList", page_size=25)
 
@@ -491,7 +765,7 @@ async def test_async_get_all_fast_fallback_on_zero_count(async_api):
         async_api.client,
         "get",
         new_callable=AsyncMock,
-        side_effect=[count_resp, page1_resp, empty_resp],
+        side_effect=[page1_resp, count_resp, empty_resp],
     ):
         result = await async_api.get_all_fast("transactions", "getList")
 
@@ -510,7 +784,7 @@ async def test_async_get_all_fast_fallback_on_count_error(async_api):
         async_api.client,
         "get",
         new_callable=AsyncMock,
-        side_effect=[count_resp, page1_resp, empty_resp],
+        side_effect=[page1_resp, count_resp, empty_resp],
     ):
         result = await async_api.get_all_fast("transactions", "getList")
 
@@ -530,7 +804,7 @@ async def test_async_get_all_fast_batch_size(async_api):
         async_api.client,
         "get",
         new_callable=AsyncMock,
-        side_effect=[count_resp] + pages,
+        side_effect=[pages[0], count_resp, *pages[1:]],
     ):
         result = await async_api.get_all_fast(
             "transactions", "getList", page_size=25, batch_size=2
@@ -543,7 +817,7 @@ async def test_async_get_all_fast_concurrency_not_capped_by_batch_size():
     """Concurrency is bounded by max_concurrency, not batch_size (#102).
 
     With batch_size(2) < max_concurrency(5), the old per-batch code capped
-    parallelism at 2; now all pages launch under the semaphore, so peak
+    parallelism at 2; now max_concurrency workers share the pages, so peak
     in-flight requests reach max_concurrency.
     """
     api = AsyncBlestaRequest(
@@ -561,7 +835,9 @@ async def test_async_get_all_fast_concurrency_not_capped_by_batch_size():
         await asyncio.sleep(0.01)
         concurrent -= 1
         return Mock(
-            text=json.dumps({"response": [{"id": 1}]}), status_code=200, headers={}
+            text=json.dumps({"response": [{"id": 1}] * 25}),
+            status_code=200,
+            headers={},
         )
 
     with patch.object(api.client, "get", side_effect=fake_get):
@@ -570,11 +846,167 @@ async def test_async_get_all_fast_concurrency_not_capped_by_batch_size():
         )
     await api.close()
 
-    assert len(result) == 10  # 250 / 25 = 10 pages, one item each
+    assert len(result) == 250  # 250 / 25 = 10 full pages
     assert peak > 2  # exceeded batch_size -> not batch-capped
     assert peak <= 5  # bounded by max_concurrency
 
 
+async def test_async_get_all_fast_bounded_tasks_keep_page_order():
+    """Only max_concurrency tasks are spawned; out-of-order pages stay ordered."""
+    api = AsyncBlestaRequest(
+        "https://example.com/api", "user", "key", max_concurrency=3
+    )
+    tasks_seen: set[asyncio.Task] = set()
+
+    async def fake_get(url: str, **kwargs: object) -> object:
+        if "getListCount" in url:
+            return Mock(text=json.dumps({"response": 40}), status_code=200, headers={})
+        tasks_seen.add(asyncio.current_task())
+        page = kwargs["params"]["page"]
+        # Later pages finish first.
+        await asyncio.sleep(0.001 * (40 - page))
+        return Mock(
+            text=json.dumps({"response": [{"id": page}]}), status_code=200, headers={}
+        )
+
+    with patch.object(api.client, "get", side_effect=fake_get):
+        result = await api.get_all_fast("transactions", "getList", page_size=1)
+    await api.close()
+
+    assert [item["id"] for item in result] == list(range(1, 41))
+    # max_concurrency workers, plus the task that fetched page 1 alongside count.
+    assert len(tasks_seen) == 4
+
+
+async def test_async_get_all_fast_short_first_page_skips_count_wait():
+    """A short page 1 returns immediately and cancels the in-flight count."""
+    api = AsyncBlestaRequest("https://example.com/api", "user", "key")
+    count_cancelled = False
+
+    async def fake_get(url: str, **kwargs: object) -> object:
+        nonlocal count_cancelled
+        if "getListCount" in url:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                count_cancelled = True
+                raise
+        await asyncio.sleep(0.01)
+        return Mock(text=json.dumps({"response": [{"id": 1}]}), status_code=200)
+
+    with patch.object(api.client, "get", side_effect=fake_get):
+        result = await asyncio.wait_for(
+            api.get_all_fast("transactions", "getList"), timeout=1
+        )
+    await api.close()
+
+    assert result == [{"id": 1}]
+    assert count_cancelled
+
+
+async def test_async_get_all_fast_full_first_page_not_refetched_on_count_error(
+    async_api,
+):
+    """If count fails after a full page 1, paging resumes sequentially at 2."""
+    requested: list[int] = []
+
+    async def fake_get(url: str, **kwargs: object) -> object:
+        if "getListCount" in url:
+            return Mock(text="error", status_code=500)
+        page = kwargs["params"]["page"]
+        requested.append(page)
+        body = [{"id": page}] * 2 if page <= 2 else []
+        return Mock(text=json.dumps({"response": body}), status_code=200)
+
+    with patch.object(async_api.client, "get", side_effect=fake_get):
+        result = await async_api.get_all_fast("transactions", "getList", page_size=2)
+
+    assert [item["id"] for item in result] == [1, 1, 2, 2]
+    assert requested == [1, 2, 3]
+
+
+async def test_async_aiter_all_fast_streams_within_window():
+    """aiter_all_fast yields page 1 before the last pages are requested."""
+    api = AsyncBlestaRequest(
+        "https://example.com/api", "user", "key", max_concurrency=2
+    )
+    requested: list[int] = []
+
+    async def fake_get(url: str, **kwargs: object) -> object:
+        if "getListCount" in url:
+            return Mock(text=json.dumps({"response": 20}), status_code=200, headers={})
+        page = kwargs["params"]["page"]
+        requested.append(page)
+        await asyncio.sleep(0)
+        return Mock(
+            text=json.dumps({"response": [{"id": page}]}), status_code=200, headers={}
+        )
+
+    seen: list[int] = []
+    with patch.object(api.client, "get", side_effect=fake_get):
+        async for item in api.aiter_all_fast("transactions", "getList", page_size=1):
+            if not seen:
+                # Workers may run at most 2 * max_concurrency pages ahead.
+                assert max(requested) <= 4
+            seen.append(item["id"])
+    await api.close()
+
+    assert seen == list(range(1, 21))
+
+
+async def test_async_aiter_all_fast_break_cancels_workers():
+    """Leaving the loop early stops fetching the remaining pages."""
+    api = AsyncBlestaRequest(
+        "https://example.com/api", "user", "key", max_concurrency=2
+    )
+    requested: list[int] = []
+
+    async def fake_get(url: str, **kwargs: object) -> object:
+        if "getListCount" in url:
+            return Mock(text=json.dumps({"response": 50}), status_code=200, headers={})
+        requested.append(kwargs["params"]["page"])
+        await asyncio.sleep(0)
+        return Mock(
+            text=json.dumps({"response": [{"id": 1}]}), status_code=200, headers={}
+        )
+
+    with patch.object(api.client, "get", side_effect=fake_get):
+        stream = api.aiter_all_fast("transactions", "getList", page_size=1)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        await asyncio.sleep(0.01)
+    await api.close()
+
+    assert len(requested) < 50
+
+
+async def test_async_aiter_all_fast_page_error_propagates():
+    """An exception fetching a page is raised when the consumer reaches it."""
+    api = AsyncBlestaRequest("https://example.com/api", "user", "key")
+
+    async def fake_get(url: str, **kwargs: object) -> object:
+        if "getListCount" in url:
+            return Mock(text=json.dumps({"response": 3}), status_code=200, headers={})
+        page = kwargs["params"]["page"]
+        if page == 2:
+            raise RuntimeError("boom")
+        return Mock(
+            text=json.dumps({"response": [{"id": page}]}), status_code=200, headers={}
+        )
+
+    seen: list[int] = []
+    with (
+        patch.object(api.client, "get", side_effect=fake_get),
+        pytest.raises(RuntimeError, match="boom"),
+    ):
+        async for item in api.aiter_all_fast("transactions", "getList", page_size=1):
+            seen.append(item["id"])
+    await api.close()
+
+    assert seen == [1]
+
+
 # --- discovery parse offload (#103) ---
 
 
@@ -760,6 +1192,19 @@ async def test_async_count_returns_zero_for_zero(async_api):
         assert await async_api.count("transactions") == 0
 
 
+async def test_async_count_fast_path_skips_json_decode(async_api):
+    """count() reads a bare integer body without decoding JSON."""
+    mock_response = Mock(text='{"response": 22376}', status_code=200)
+    with (
+        patch.object(
+            async_api.client, "get", new_callable=AsyncMock, return_value=mock_response
+        ),
+        patch("blesta_sdk.core.response.jsonutil.loads") as mock_loads,
+    ):
+        assert await async_api.count("transactions") == 22376
+    mock_loads.assert_not_called()
+
+
 # --- get_report_series_pages ---
 
 
@@ -1326,6 +1771,98 @@ async def test_async_retry_mutations_retries_on_429(mock_sleep, _mock_random):
     assert response.status_code == 200
 
 
+async def test_async_extract_max_concurrency_caps_requests():
+    """extract(max_concurrency=N) bounds in-flight requests across targets."""
+    api = AsyncBlestaRequest(
+        "https://example.com/api", "user", "key", max_concurrency=10
+    )
+    concurrent = 0
+    peak = 0
+
+    async def fake_get(url: str, **kwargs: object) -> object:
+        nonlocal concurrent, peak
+        concurrent += 1
+        peak = max(peak, concurrent)
+        await asyncio.sleep(0.005)
+        concurrent -= 1
+        body = [{"id": 1}] if kwargs["params"]["page"] == 1 else []
+        return Mock(text=json.dumps({"response": body}), status_code=200, headers={})
+
+    targets = [(f"model{i}", "getList") for i in range(6)]
+    with patch.object(api.client, "get", side_effect=fake_get):
+        result = await api.extract(targets, max_concurrency=2)
+    await api.close()
+
+    assert all(len(items) == 1 for items in result.values())
+    assert peak == 2
+
+
+async def test_async_extract_count_method_fetches_pages_concurrently():
+    """extract(count_method=...) fans out over each target's pages."""
+    api = AsyncBlestaRequest(
+        "https://example.com/api", "user", "key", max_concurrency=4
+    )
+    concurrent = 0
+    peak = 0
+    requested: list[tuple[str, int]] = []
+
+    async def fake_get(url: str, **kwargs: object) -> object:
+        nonlocal concurrent, peak
+        model = url.rsplit("/", 2)[-2]
+        if "getListCount" in url:
+            total = 3 if model == "clients" else 0
+            return Mock(text=json.dumps({"response": total}), status_code=200)
+        page = kwargs["params"]["page"]
+        requested.append((model, page))
+        concurrent += 1
+        peak = max(peak, concurrent)
+        await asyncio.sleep(0.001 * (5 - page))
+        concurrent -= 1
+        body = [{"id": page}] if model == "clients" or page == 1 else []
+        return Mock(text=json.dumps({"response": body}), status_code=200)
+
+    with patch.object(api.client, "get", side_effect=fake_get):
+        result = await api.extract(
+            [("clients", "getList"), ("invoices", "getList")],
+            count_method="getListCount",
+            page_size=1,
+        )
+    await api.close()
+
+    assert [item["id"] for item in result["clients.getList"]] == [1, 2, 3]
+    # invoices counted 0, so it was paged sequentially until empty.
+    assert result["invoices.getList"] == [{"id": 1}]
+    assert ("clients", 4) not in requested  # no empty-page probe
+    assert peak > 1
+
+
+async def test_async_extract_rejects_page_size_below_one(async_api):
+    """extract() validates page_size before dispatching any target."""
+    with (
+        patch.object(async_api.client, "get", new_callable=AsyncMock) as mock_get,
+        pytest.raises(ValueError, match="page_size must be >= 1"),
+    ):
+        await async_api.extract(
+            [("clients", "getList")], count_method="getListCount", page_size=0
+        )
+    mock_get.assert_not_called()
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+async def test_async_extract_rejects_max_concurrency_below_one(
+    async_api, max_concurrency
+):
+    """extract() rejects max_concurrency < 1 like the other fan-out methods."""
+    with (
+        patch.object(async_api.client, "get", new_callable=AsyncMock) as mock_get,
+        pytest.raises(ValueError, match="max_concurrency must be >= 1"),
+    ):
+        await async_api.extract(
+            [("clients", "getList")], max_concurrency=max_concurrency
+        )
+    mock_get.assert_not_called()
+
+
 # --- get_all_fast verify ---
 
 
@@ -1340,7 +1877,7 @@ async def test_async_get_all_fast_verify_detects_change(async_api):
         async_api.client,
         "get",
         new_callable=AsyncMock,
-        side_effect=[count_resp1, page1_resp, count_resp2],
+        side_effect=[page1_resp, count_resp1, count_resp2],
     ):
         result = await async_api.get_all_fast(
             "transactions", "getList", page_size=25, verify=True
@@ -1358,7 +1895,7 @@ async def test_async_get_all_fast_verify_no_warning_on_match(async_api):
         async_api.client,
         "get",
         new_callable=AsyncMock,
-        side_effect=[count_resp, page1_resp, count_resp],
+        side_effect=[page1_resp, count_resp, count_resp],
     ):
         result = await async_api.get_all_fast(
             "transactions", "getList", page_size=25, verify=True
@@ -1847,7 +2384,7 @@ async def test_get_all_fast_verify_count_mismatch_logs_warning(caplog, async_api
             async_api.client,
             "get",
             new_callable=AsyncMock,
-            side_effect=[count1, page_resp, count2],
+            side_effect=[page_resp, count1, count2],
         ),
         caplog.at_level(logging.WARNING),
     ):
@@ -1888,7 +2425,7 @@ async def test_async_get_all_fast_non_200_page_excluded(async_api):
         async_api.client,
         "get",
         new_callable=AsyncMock,
-        side_effect=[count_resp, page1_resp, page2_err],
+        side_effect=[page1_resp, count_resp, page2_err],
     ):
         result = await async_api.get_all_fast("transactions", "getList", page_size=25)
 
@@ -1910,7 +2447,7 @@ async def test_async_get_all_fast_null_data_page_excluded(async_api):
         async_api.client,
         "get",
         new_callable=AsyncMock,
-        side_effect=[count_resp, page1_resp],
+        side_effect=[page1_resp, count_resp],
     ):
         result = await async_api.get_all_fast("transactions", "getList", page_size=25)
 
@@ -1930,7 +2467,7 @@ async def test_async_get_all_fast_explicit_null_data(async_api):
         async_api.client,
         "get",
         new_callable=AsyncMock,
-        side_effect=[count_resp, null_data_resp],
+        side_effect=[null_data_resp, count_resp],
     ):
         result = await async_api.get_all_fast("transactions", "getList", page_size=25)
 
@@ -1,7 +1,8 @@
 import json
 import os
 import sys
-from unittest.mock import MagicMock, Mock, patch
+import threading
+from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import pytest
 import requests
@@ -40,6 +41,20 @@ def test_all_exports():
     }
 
 
+def test_import_does_not_load_requests():
+    """BlestaRequest/BlestaResponse are resolved lazily on first access."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, blesta_sdk; "
+        "assert 'requests' not in sys.modules; "
+        "blesta_sdk.BlestaRequest; "
+        "assert 'requests' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_version():
     assert blesta_sdk.__version__ != "unknown"
     assert isinstance(blesta_sdk.__version__, str)
@@ -104,6 +119,16 @@ def test_submit_invalid_action(blesta_request):
         blesta_request.submit("clients", "getList", {}, "INVALID")  # type: ignore[arg-type]
 
 
+def test_submit_invalid_action_sends_nothing(blesta_request):
+    """An unknown action is rejected before any session method is called."""
+    with (
+        patch.object(blesta_request, "session") as mock_session,
+        pytest.raises(ValueError, match="Invalid HTTP action"),
+    ):
+        blesta_request.submit("clients", "getList", {}, "PATCH")  # type: ignore[arg-type]
+    assert mock_session.method_calls == []
+
+
 def test_request_exception(blesta_request):
     with patch.object(
         blesta_request.session, "get", side_effect=requests.RequestException("Error")
@@ -190,6 +215,18 @@ def test_custom_pool_settings():
     assert adapter._pool_maxsize == 20
 
 
+def test_trust_env_defaults_to_true():
+    """Session honours proxy env vars and netrc unless disabled."""
+    api = BlestaRequest("https://example.com/api", "user", "key")
+    assert api.session.trust_env is True
+
+
+def test_trust_env_disabled():
+    """trust_env=False is passed through to the session."""
+    api = BlestaRequest("https://example.com/api", "user", "key", trust_env=False)
+    assert api.session.trust_env is False
+
+
 def test_http_adapter_mounted():
     """Both http:// and https:// have the custom adapter."""
     api = BlestaRequest("https://example.com/api", "user", "key")
@@ -220,6 +257,37 @@ def test_header_auth_default_is_basic():
     assert api.session.auth is not None
 
 
+def test_basic_auth_header_matches_requests():
+    """The prebuilt Basic auth header is byte-identical to HTTPBasicAuth's."""
+    from requests.auth import HTTPBasicAuth
+
+    api = BlestaRequest("https://example.com/api", "user", "kéy")
+    ours = api.session.prepare_request(requests.Request("GET", api.base_url))
+    stock = requests.Request(
+        "GET", api.base_url, auth=HTTPBasicAuth("user", "kéy")
+    ).prepare()
+    assert isinstance(api.session.auth, HTTPBasicAuth)
+    assert ours.headers["Authorization"] == stock.headers["Authorization"]
+
+
+@pytest.mark.parametrize(
+    ("username", "password"), [("user", "key"), ("api-user", "kéy:with:colons")]
+)
+def test_basic_auth_builds_same_header_as_requests(username, password):
+    """_BasicAuth encodes credentials exactly like HTTPBasicAuth."""
+    from requests.auth import HTTPBasicAuth
+
+    from blesta_sdk.core.client import _BasicAuth
+
+    ours = _BasicAuth(username, password)(
+        requests.Request("GET", "https://x").prepare()
+    )
+    stock = HTTPBasicAuth(username, password)(
+        requests.Request("GET", "https://x").prepare()
+    )
+    assert ours.headers["Authorization"] == stock.headers["Authorization"]
+
+
 def test_header_auth_request_succeeds():
     """Header auth sends requests successfully."""
     api = BlestaRequest("https://example.com/api", "user", "key", auth_method="header")
@@ -374,6 +442,21 @@ def test_csv_data_caches_none_for_non_csv():
     assert response.csv_data is None
 
 
+def test_iter_csv_data_streams_without_caching():
+    csv_text = '"id","name"\n"1","John"\n"2","Jane"\n'
+    response = BlestaResponse(csv_text, 200)
+    rows = response.iter_csv_data()
+    assert next(rows) == {"id": "1", "name": "John"}
+    assert list(rows) == [{"id": "2", "name": "Jane"}]
+    assert response.iter_csv_data() is not None  # fresh iterator each call
+    assert list(response.iter_csv_data()) == response.csv_data
+
+
+def test_iter_csv_data_returns_none_for_json():
+    response = BlestaResponse('{"response": {"id": 1}}', 200)
+    assert response.iter_csv_data() is None
+
+
 def test_csv_response_no_errors():
     csv_text = '"id","name"\n"1","John"\n'
     response = BlestaResponse(csv_text, 200)
@@ -502,6 +585,14 @@ def test_iter_all_start_page(blesta_request):
     mock_get.assert_called_once_with("invoices", "getList", {"page": 5})
 
 
+def test_page_args_copies_base_args():
+    from blesta_sdk.core.pagination import page_args
+
+    base = {"status": "active", "page": 1}
+    assert page_args(base, 3) == {"status": "active", "page": 3}
+    assert base == {"status": "active", "page": 1}
+
+
 def test_iter_all_single_object_response(blesta_request):
     responses = [
         BlestaResponse(json.dumps({"response": {"id": 1, "name": "John"}}), 200),
@@ -638,6 +729,12 @@ def test_month_boundaries_december_last_day():
     assert result == [("2025-12-01", "2025-12-31", "2025-12")]
 
 
+def test_month_boundaries_cached_returns_fresh_list():
+    first = _month_boundaries("2023-01", "2023-06")
+    first.clear()
+    assert len(_month_boundaries("2023-01", "2023-06")) == 6
+
+
 # --- get_report_series_pages tests ---
 
 
@@ -850,6 +947,137 @@ def test_get_report_series_passes_extra_vars(blesta_request):
     )
 
 
+def test_get_report_series_shares_header_keys(blesta_request):
+    """Months with identical headers share one fieldnames key set."""
+    csv1 = '"Package","Revenue"\n"Hosting","100"\n'
+    csv2 = '"Package","Revenue"\n"Hosting","110"\n'
+
+    with patch.object(
+        blesta_request,
+        "get_report",
+        side_effect=[_make_csv_response(csv1), _make_csv_response(csv2)],
+    ):
+        result = blesta_request.get_report_series(
+            "package_revenue", "2025-01", "2025-02"
+        )
+
+    keys = [next(iter(row)) for row in result]
+    assert keys[0] is keys[1]
+
+
+def test_get_report_series_handles_changed_header(blesta_request):
+    csv1 = '"Package","Revenue"\n"Hosting","100"\n'
+    csv2 = '"Package","Revenue","Tax"\n"Hosting","110","5"\n'
+
+    with patch.object(
+        blesta_request,
+        "get_report",
+        side_effect=[_make_csv_response(csv1), _make_csv_response(csv2)],
+    ):
+        result = blesta_request.get_report_series(
+            "package_revenue", "2025-01", "2025-02"
+        )
+
+    assert result[0] == {"Package": "Hosting", "Revenue": "100", "_period": "2025-01"}
+    assert result[1] == {
+        "Package": "Hosting",
+        "Revenue": "110",
+        "Tax": "5",
+        "_period": "2025-02",
+    }
+
+
+def test_get_report_series_copies_cached_csv_rows(blesta_request):
+    """Rows already parsed via csv_data are copied, not tagged in place."""
+    response = _make_csv_response('"Package","Revenue"\n"Hosting","100"\n')
+    cached = response.csv_data
+
+    with patch.object(blesta_request, "get_report", return_value=response):
+        result = blesta_request.get_report_series(
+            "package_revenue", "2025-01", "2025-01"
+        )
+
+    assert result == [{"Package": "Hosting", "Revenue": "100", "_period": "2025-01"}]
+    assert "_period" not in cached[0]
+
+
+def test_iter_report_series_fetches_months_lazily(blesta_request):
+    """iter_report_series requests the next month only when it is needed."""
+    responses = [
+        _make_csv_response('"Package","Revenue"\n"Hosting","100"\n'),
+        _make_csv_response('"Package","Revenue"\n"Hosting","110"\n'),
+    ]
+    with patch.object(
+        blesta_request, "get_report", side_effect=responses
+    ) as mock_report:
+        rows = blesta_request.iter_report_series(
+            "package_revenue", "2025-01", "2025-02"
+        )
+        assert mock_report.call_count == 0
+        assert next(rows)["_period"] == "2025-01"
+        assert mock_report.call_count == 1
+        assert [r["Revenue"] for r in rows] == ["110"]
+    assert mock_report.call_count == 2
+
+
+# --- get_report_series_concurrent tests ---
+
+
+def _report_by_start_date(responses):
+    """get_report side effect keyed on start date (call order is not fixed)."""
+
+    def side_effect(report_type, start_date, end_date, extra_vars=None):
+        return responses[start_date]
+
+    return side_effect
+
+
+def test_get_report_series_concurrent_orders_by_period(blesta_request):
+    responses = {
+        "2025-01-01": _make_csv_response('"Package","Revenue"\n"Hosting","100"\n'),
+        "2025-02-01": _make_csv_response('"Package","Revenue"\n"Hosting","110"\n'),
+        "2025-03-01": _make_csv_response('"Package","Revenue"\n"Hosting","120"\n'),
+    }
+    with patch.object(
+        blesta_request, "get_report", side_effect=_report_by_start_date(responses)
+    ):
+        result = blesta_request.get_report_series_concurrent(
+            "package_revenue", "2025-01", "2025-03"
+        )
+
+    assert [r["_period"] for r in result] == ["2025-01", "2025-02", "2025-03"]
+    assert [r["Revenue"] for r in result] == ["100", "110", "120"]
+
+
+def test_get_report_series_concurrent_skips_errors(blesta_request):
+    csv_ok = _make_csv_response('"Package","Revenue"\n"Hosting","100"\n')
+    csv_err = BlestaResponse('{"errors": {"message": "fail"}}', 500)
+    responses = {"2025-01-01": csv_err, "2025-02-01": csv_ok}
+    with patch.object(
+        blesta_request, "get_report", side_effect=_report_by_start_date(responses)
+    ):
+        result = blesta_request.get_report_series_concurrent(
+            "package_revenue", "2025-01", "2025-02", max_concurrency=1
+        )
+
+    assert len(result) == 1
+    assert result[0]["_period"] == "2025-02"
+
+
+def test_get_report_series_concurrent_invalid_concurrency(blesta_request):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        blesta_request.get_report_series_concurrent(
+            "package_revenue", "2025-01", "2025-02", max_concurrency=0
+        )
+
+
+def test_get_report_series_concurrent_invalid_range(blesta_request):
+    with pytest.raises(ValueError):
+        blesta_request.get_report_series_concurrent(
+            "package_revenue", "2025-06", "2025-01"
+        )
+
+
 # --- to_dataframe tests ---
 
 
@@ -862,6 +1090,30 @@ def test_to_dataframe_csv_response():
     assert df.iloc[0]["name"] == "John"
 
 
+def test_to_dataframe_csv_matches_csv_data_path():
+    """Direct csv.reader frame equals the frame built from csv_data."""
+    csv_text = '"id","name"\n"1","John"\n\n"2","Jane, Jr."\n'
+    direct = BlestaResponse(csv_text, 200).to_dataframe()
+    cached = BlestaResponse(csv_text, 200)
+    _ = cached.csv_data
+    assert direct.equals(cached.to_dataframe())
+    assert direct.iloc[1]["name"] == "Jane, Jr."
+
+
+def test_to_dataframe_csv_ragged_rows_fall_back():
+    """Short rows keep DictReader semantics (missing fields are null)."""
+    df = BlestaResponse("id,name\n1,John\n2\n", 200).to_dataframe()
+    assert len(df) == 2
+    assert df.isna().iloc[1]["name"]
+
+
+def test_to_dataframe_csv_duplicate_header_falls_back():
+    """Repeated column names collapse as in csv_data (last value wins)."""
+    df = BlestaResponse("id,id\n1,2\n3,4\n", 200).to_dataframe()
+    assert list(df.columns) == ["id"]
+    assert list(df["id"]) == ["2", "4"]
+
+
 def test_to_dataframe_json_list_response():
     json_text = json.dumps(
         {"response": [{"id": 1, "name": "John"}, {"id": 2, "name": "Jane"}]}
@@ -1473,6 +1725,67 @@ def test_submit_retry_backoff_timing(mock_sleep, _mock_random):
     ]
 
 
+@patch("blesta_sdk._retry.random.random", return_value=1.0)
+@patch("blesta_sdk._client.time.sleep")
+def test_submit_retry_decorrelated_jitter(mock_sleep, _mock_random):
+    api = BlestaRequest(
+        "https://test.example.com/api",
+        "u",
+        "k",
+        max_retries=3,
+        retry_jitter="decorrelated",
+        retry_cap=20.0,
+    )
+    with patch.object(api.session, "get") as mock_get:
+        mock_get.side_effect = requests.Timeout("timed out")
+        api.get("clients", "getList")
+
+    # Each delay is drawn from [base, 3 * previous], capped at 20.
+    assert mock_sleep.call_args_list == [((3.0,),), ((9.0,),), ((20.0,),)]
+
+
+@patch("blesta_sdk._client.time.sleep")
+def test_submit_retry_after_honoured_on_503(mock_sleep):
+    api = BlestaRequest("https://test.example.com/api", "u", "k", max_retries=1)
+    with patch.object(api.session, "get") as mock_get:
+        mock_get.side_effect = [
+            Mock(text="busy", status_code=503, headers={"Retry-After": "7"}),
+            Mock(text='{"response": []}', status_code=200, headers={}),
+        ]
+        response = api.get("clients", "getList")
+
+    assert response.status_code == 200
+    mock_sleep.assert_called_once_with(7)
+
+
+@patch("blesta_sdk._retry.random.random", return_value=1.0)
+@patch("blesta_sdk._client.time.sleep")
+def test_submit_retried_response_body_not_decoded(mock_sleep, _mock_random):
+    api = BlestaRequest("https://test.example.com/api", "u", "k", max_retries=1)
+    retried = Mock(status_code=503, headers={})
+    type(retried).text = PropertyMock(side_effect=AssertionError("body decoded"))
+    with patch.object(api.session, "get") as mock_get:
+        mock_get.side_effect = [
+            retried,
+            Mock(text='{"response": []}', status_code=200, headers={}),
+        ]
+        response = api.get("clients", "getList")
+
+    assert response.status_code == 200
+
+
+@patch("blesta_sdk._client.time.sleep")
+def test_submit_no_retry_on_non_transient_error(mock_sleep):
+    api = BlestaRequest("https://test.example.com/api", "u", "k", max_retries=3)
+    with patch.object(api.session, "get") as mock_get:
+        mock_get.side_effect = requests.TooManyRedirects("loop")
+        response = api.get("clients", "getList")
+
+    assert response.status_code == 0
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
+
+
 # --- Extract tests ---
 
 
@@ -1586,6 +1899,24 @@ def test_count_returns_zero_for_zero(blesta_request):
         assert blesta_request.count("transactions") == 0
 
 
+def test_count_fast_path_skips_json_decode(blesta_request):
+    """count() reads a bare integer body without decoding JSON."""
+    response = BlestaResponse('{"response": 22376}', 200)
+    with (
+        patch.object(blesta_request, "get", return_value=response),
+        patch("blesta_sdk.core.response.jsonutil.loads") as mock_loads,
+    ):
+        assert blesta_request.count("transactions") == 22376
+    mock_loads.assert_not_called()
+
+
+def test_count_falls_back_when_body_has_extra_keys(blesta_request):
+    """count() uses the JSON path when the body is not a bare integer."""
+    response = BlestaResponse('{"response": 7, "errors": null}', 200)
+    with patch.object(blesta_request, "get", return_value=response):
+        assert blesta_request.count("transactions") == 7
+
+
 # --- Integration test (requires valid .env credentials) ---
 
 
@@ -1991,6 +2322,199 @@ def test_iter_pages_on_error_raise_page1(blesta_request):
     assert exc_info.value.partial_items == []
 
 
+# --- prefetch ---
+
+
+def _paged_get(pages, requested, started=None):
+    """Return a session.get side effect serving *pages* (1-based)."""
+
+    def fake_get(url, **kwargs):
+        page = kwargs["params"]["page"]
+        requested.append(page)
+        if started is not None:
+            started[page].set()
+        body = pages[page - 1] if page <= len(pages) else []
+        return Mock(text=json.dumps({"response": body}), status_code=200)
+
+    return fake_get
+
+
+def test_iter_all_prefetch_requests_next_page_while_consuming(blesta_request):
+    """With prefetch, page 2 is requested before page 1 is fully consumed."""
+    requested = []
+    started = {page: threading.Event() for page in range(1, 5)}
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+    with patch.object(
+        blesta_request.session,
+        "get",
+        side_effect=_paged_get(pages, requested, started),
+    ):
+        items = blesta_request.iter_all("clients", "getList", prefetch=True)
+        assert next(items) == {"id": 1}
+        assert started[2].wait(timeout=1)
+        assert list(items) == [{"id": 2}, {"id": 3}]
+    assert requested == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    ("max_pages", "expected_pages"), [(None, [1, 2, 3, 4]), (2, [1, 2])]
+)
+def test_get_all_prefetch_matches_sequential_requests(
+    blesta_request, max_pages, expected_pages
+):
+    """Prefetching requests the same pages and respects max_pages."""
+    requested = []
+    pages = [[{"id": 1}], [{"id": 2}], [{"id": 3}]]
+    with patch.object(
+        blesta_request.session, "get", side_effect=_paged_get(pages, requested)
+    ):
+        result = blesta_request.get_all(
+            "clients", "getList", max_pages=max_pages, prefetch=True
+        )
+    assert result == [{"id": page} for page in expected_pages if page <= 3]
+    assert requested == expected_pages
+
+
+def test_iter_pages_prefetch_early_break_discards_pending(blesta_request):
+    """Breaking out early drops the prefetched page without re-raising."""
+    requested = []
+    pages = [[{"id": 1}], [{"id": 2}]]
+    with patch.object(
+        blesta_request.session, "get", side_effect=_paged_get(pages, requested)
+    ):
+        for page in blesta_request.iter_pages("clients", "getList", prefetch=True):
+            assert page == [{"id": 1}]
+            break
+    assert requested[0] == 1
+    assert set(requested) <= {1, 2}
+
+
+# --- page_size (short-page stop) ---
+
+
+@pytest.mark.parametrize(
+    ("pages", "expected_requests"),
+    [
+        ([[{"id": 1}, {"id": 2}], [{"id": 3}]], [1, 2]),
+        ([[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}]], [1, 2, 3]),
+    ],
+)
+def test_iter_all_page_size_skips_terminal_empty_page(
+    blesta_request, pages, expected_requests
+):
+    """A short page ends iteration; a full last page still probes one more."""
+    requested = []
+    with patch.object(
+        blesta_request.session, "get", side_effect=_paged_get(pages, requested)
+    ):
+        result = list(blesta_request.iter_all("clients", "getList", page_size=2))
+    assert result == [item for page in pages for item in page]
+    assert requested == expected_requests
+
+
+def test_get_all_page_size_with_prefetch_does_not_prefetch_past_short_page(
+    blesta_request,
+):
+    requested = []
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+    with patch.object(
+        blesta_request.session, "get", side_effect=_paged_get(pages, requested)
+    ):
+        result = blesta_request.get_all(
+            "clients", "getList", page_size=2, prefetch=True
+        )
+    assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert requested == [1, 2]
+
+
+def test_get_all_invalid_page_size_raises(blesta_request):
+    with pytest.raises(ValueError, match="page_size"):
+        blesta_request.get_all("clients", "getList", page_size=0)
+
+
+# --- get_all_fast / iter_all_fast ---
+
+
+def _counted_get(count, pages, requested):
+    """session.get side effect: a count endpoint plus 1-based *pages*."""
+    lock = threading.Lock()
+
+    def fake_get(url, **kwargs):
+        if url.endswith("getListCount.json"):
+            return Mock(text=json.dumps({"response": count}), status_code=200)
+        page = kwargs["params"]["page"]
+        with lock:
+            requested.append(page)
+        body = pages[page - 1] if page <= len(pages) else []
+        return Mock(text=json.dumps({"response": body}), status_code=200)
+
+    return fake_get
+
+
+def test_get_all_fast_fetches_counted_pages_in_order(blesta_request):
+    requested = []
+    pages = [[{"id": i}, {"id": i + 1}] for i in range(1, 20, 2)]
+    with patch.object(
+        blesta_request.session, "get", side_effect=_counted_get(20, pages, requested)
+    ):
+        result = blesta_request.get_all_fast(
+            "clients", "getList", page_size=2, max_concurrency=3
+        )
+    assert result == [{"id": i} for i in range(1, 21)]
+    assert sorted(requested) == list(range(1, 11))
+
+
+def test_get_all_fast_short_first_page_is_whole_result(blesta_request):
+    requested = []
+    with patch.object(
+        blesta_request.session,
+        "get",
+        side_effect=_counted_get(99, [[{"id": 1}]], requested),
+    ):
+        result = blesta_request.get_all_fast("clients", "getList", page_size=2)
+    assert result == [{"id": 1}]
+    assert requested == [1]
+
+
+def test_get_all_fast_zero_count_walks_from_page_two(blesta_request):
+    requested = []
+    pages = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+    with patch.object(
+        blesta_request.session, "get", side_effect=_counted_get(0, pages, requested)
+    ):
+        result = blesta_request.get_all_fast("clients", "getList", page_size=2)
+    assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert requested == [1, 2, 3]
+
+
+def test_iter_all_fast_early_break(blesta_request):
+    requested = []
+    pages = [[{"id": i}] for i in range(1, 51)]
+    with patch.object(
+        blesta_request.session, "get", side_effect=_counted_get(50, pages, requested)
+    ):
+        items = blesta_request.iter_all_fast(
+            "clients", "getList", page_size=1, max_concurrency=2
+        )
+        assert [next(items) for _ in range(3)] == [{"id": 1}, {"id": 2}, {"id": 3}]
+        items.close()
+    assert len(requested) < 50
+
+
+def test_get_all_fast_invalid_concurrency(blesta_request):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        blesta_request.get_all_fast("clients", "getList", max_concurrency=0)
+
+
+def test_get_all_fast_invalid_page_size(blesta_request):
+    with (
+        patch.object(blesta_request.session, "get") as mock_get,
+        pytest.raises(ValueError, match="page_size must be >= 1"),
+    ):
+        blesta_request.get_all_fast("clients", "getList", page_size=0)
+    mock_get.assert_not_called()
+
+
 def test_iter_all_warn_does_not_accumulate(blesta_request):
     """iter_all with on_error='warn' does not accumulate a collected list."""
     responses = [
@@ -2300,6 +2824,18 @@ def test_url_construction_plugin_model():
     )
 
 
+def test_endpoint_path_memoizes_valid_pairs_only():
+    from blesta_sdk.core.validation import endpoint_path
+
+    assert endpoint_path("clients", "getList") == "clients/getList.json"
+    hits = endpoint_path.cache_info().hits
+    endpoint_path("clients", "getList")
+    assert endpoint_path.cache_info().hits == hits + 1
+    for _ in range(2):
+        with pytest.raises(ValueError, match="cannot contain '..'"):
+            endpoint_path("../admin", "getList")
+
+
 # --- Response headers plumbing ---
 
 
@@ -0,0 +1,170 @@
+"""Tests for core/cache.py and the clients' opt-in GET response cache."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from blesta_sdk import (
+    AsyncBlestaRequest,
+    BlestaAPIError,
+    BlestaRequest,
+    BlestaResponse,
+)
+from blesta_sdk.core import cache as cache_mod
+from blesta_sdk.core.cache import ResponseCache, cache_key
+
+
+def _ok(body: object = None) -> BlestaResponse:
+    return BlestaResponse(json.dumps({"response": body}), 200)
+
+
+def test_cache_key_ignores_arg_order():
+    a = cache_key("u", {"b": 1, "a": {"y": 2, "x": [1]}})
+    b = cache_key("u", {"a": {"x": [1], "y": 2}, "b": 1})
+    assert a == b
+    assert a != cache_key("u", {"b": 2})
+
+
+def test_cache_key_returns_none_for_unsortable_args():
+    assert cache_key("u", {1: "a", "b": 2}) is None
+
+
+def test_get_returns_stored_response():
+    cache = ResponseCache(60)
+    response = _ok(1)
+    cache.put(("u", "{}"), response)
+    assert cache.get(("u", "{}")) is response
+    assert cache.get(("other", "{}")) is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(5)
+    cache.put(("u", "{}"), _ok())
+    now[0] = 104.9
+    assert cache.get(("u", "{}")) is not None
+    now[0] = 105.0
+    assert cache.get(("u", "{}")) is None
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used():
+    cache = ResponseCache(60, maxsize=2)
+    cache.put(("a", ""), _ok("a"))
+    cache.put(("b", ""), _ok("b"))
+    cache.get(("a", ""))  # "b" is now least recently used
+    cache.put(("c", ""), _ok("c"))
+    assert cache.get(("b", "")) is None
+    assert cache.get(("a", "")) is not None
+    assert cache.get(("c", "")) is not None
+
+
+@pytest.mark.parametrize("kwargs", [{"ttl": 0}, {"ttl": 1, "maxsize": 0}])
+def test_invalid_options_raise(kwargs):
+    with pytest.raises(ValueError):
+        ResponseCache(**kwargs)
+
+
+def test_sync_client_caches_successful_gets_only():
+    api = BlestaRequest("https://example.com/api", "u", "k", cache_ttl=60)
+    with patch.object(api.session, "get") as mock_get:
+        mock_get.side_effect = [
+            Mock(text='{"response": 42}', status_code=200, headers={}),
+            Mock(text="error", status_code=500, headers={}),
+            Mock(text="error", status_code=500, headers={}),
+        ]
+        assert api.count("clients") == 42
+        assert api.count("clients") == 42
+        assert mock_get.call_count == 1
+
+        # Errors are not cached.
+        api.get("clients", "getList", {"page": 1})
+        api.get("clients", "getList", {"page": 1})
+        assert mock_get.call_count == 3
+
+
+def test_sync_client_does_not_cache_blesta_errors():
+    api = BlestaRequest(
+        "https://example.com/api", "u", "k", cache_ttl=60, raise_on_error=True
+    )
+    errors = Mock(
+        text='{"errors": {"client_id": {"missing": "Invalid"}}}',
+        status_code=200,
+        headers={},
+    )
+    with patch.object(api.session, "get", return_value=errors) as mock_get:
+        for _ in range(2):
+            with pytest.raises(BlestaAPIError):
+                api.get("clients", "get", {"client_id": 1})
+    assert mock_get.call_count == 2
+
+
+def test_sync_client_skips_cache_for_unsortable_args():
+    api = BlestaRequest("https://example.com/api", "u", "k", cache_ttl=60)
+    ok = Mock(text='{"response": []}', status_code=200, headers={})
+    with patch.object(api.session, "get", return_value=ok) as mock_get:
+        api.get("clients", "getList", {1: "a", "b": 2})
+        api.get("clients", "getList", {1: "a", "b": 2})
+    assert mock_get.call_count == 2
+
+
+def test_sync_client_does_not_cache_mutations_and_can_clear():
+    api = BlestaRequest("https://example.com/api", "u", "k", cache_ttl=60)
+    ok = Mock(text='{"response": []}', status_code=200, headers={})
+    with (
+        patch.object(api.session, "get", return_value=ok) as mock_get,
+        patch.object(api.session, "post", return_value=ok) as mock_post,
+    ):
+        api.post("clients", "create", {"a": 1})
+        api.post("clients", "create", {"a": 1})
+        assert mock_post.call_count == 2
+
+        api.get("clients", "getList")
+        api.clear_cache()
+        api.get("clients", "getList")
+        assert mock_get.call_count == 2
+
+
+def test_sync_client_cache_disabled_by_default():
+    api = BlestaRequest("https://example.com/api", "u", "k")
+    ok = Mock(text='{"response": []}', status_code=200, headers={})
+    with patch.object(api.session, "get", return_value=ok) as mock_get:
+        api.get("clients", "getList")
+        api.get("clients", "getList")
+    assert mock_get.call_count == 2
+
+
+async def test_async_client_caches_count():
+    api = AsyncBlestaRequest("https://example.com/api", "u", "k", cache_ttl=60)
+    ok = Mock(text='{"response": 7}', status_code=200, headers={})
+    with patch.object(
+        api.client, "get", new_callable=AsyncMock, return_value=ok
+    ) as mock_get:
+        assert await api.count("clients") == 7
+        assert await api.count("clients") == 7
+        assert await api.count("invoices") == 7
+    await api.close()
+    assert mock_get.call_count == 2
+
+
+async def test_async_client_does_not_cache_blesta_errors():
+    api = AsyncBlestaRequest(
+        "https://example.com/api", "u", "k", cache_ttl=60, raise_on_error=True
+    )
+    errors = Mock(
+        text='{"errors": {"client_id": {"missing": "Invalid"}}}',
+        status_code=200,
+        headers={},
+    )
+    with patch.object(
+        api.client, "get", new_callable=AsyncMock, return_value=errors
+    ) as mock_get:
+        for _ in range(2):
+            with pytest.raises(BlestaAPIError):
+                await api.get("clients", "get", {"client_id": 1})
+    await api.close()
+    assert mock_get.call_count == 2
@@ -561,6 +561,146 @@ def test_discover_spec_unknown_method():
         discover.run(args)
 
 
+# ---------------------------------------------------------------------------
+# blesta batch
+# ---------------------------------------------------------------------------
+
+
+def _batch_client(handler):
+    import httpx
+
+    from blesta_sdk import AsyncBlestaRequest
+
+    return AsyncBlestaRequest(
+        "https://example.com/api",
+        "user",
+        "key",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def _run_batch(stdin: str, handler, argv=()):
+    import io
+
+    from blesta_sdk.cli.app import _build_parser
+    from blesta_sdk.cli.commands import batch
+
+    built = []
+
+    def build(**kwargs):
+        built.append(kwargs)
+        return _batch_client(handler)
+
+    args = _build_parser().parse_args(["batch", *argv])
+    with (
+        patch("sys.stdin", io.StringIO(stdin)),
+        patch("blesta_sdk.cli.commands.batch._build_cli_async_client", build),
+    ):
+        batch.run(args)
+    return built
+
+
+def test_batch_run_outputs_results_in_input_order(capsys):
+    import httpx
+
+    def handler(request):
+        client_id = int(request.url.params["client_id"])
+        return httpx.Response(200, json={"response": {"id": client_id}})
+
+    stdin = "\n".join(
+        json.dumps(
+            {
+                "model": "clients",
+                "method": "get",
+                "action": "get",
+                "params": {"client_id": i},
+            }
+        )
+        for i in range(1, 6)
+    )
+    built = _run_batch(stdin + "\n\n", handler, ["--concurrency", "3"])
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["response"]["id"] for line in lines] == [1, 2, 3, 4, 5]
+    assert all(line["status_code"] == 200 for line in lines)
+    assert built == [
+        {"max_concurrency": 3, "max_connections": 3, "max_keepalive_connections": 3}
+    ]
+
+
+def test_batch_run_reports_bad_lines_and_errors_then_exits_1(capsys):
+    import httpx
+
+    def handler(request):
+        return httpx.Response(500, json={"message": "boom"})
+
+    stdin = "\n".join(
+        [
+            "not json",
+            json.dumps({"model": "clients"}),
+            json.dumps({"model": "clients", "method": "get", "action": "GET"}),
+        ]
+    )
+    with pytest.raises(SystemExit) as exc_info:
+        _run_batch(stdin, handler)
+
+    assert exc_info.value.code == 1
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert lines[0]["error"].startswith("Invalid request")
+    assert "'model' and 'method'" in lines[1]["error"]
+    assert lines[2]["status_code"] == 500
+
+
+def test_batch_run_bounds_in_flight_requests_by_concurrency(capsys):
+    import asyncio
+
+    import httpx
+
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"response": {"ok": True}})
+
+    stdin = "\n".join(
+        json.dumps({"model": "clients", "method": "get", "params": {"client_id": i}})
+        for i in range(8)
+    )
+    _run_batch(stdin, handler, ["--concurrency", "2"])
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(lines) == 8
+    assert all(line["status_code"] == 200 for line in lines)
+    assert peak == 2
+
+
+def test_batch_run_reports_missing_httpx(capsys):
+    import io
+
+    from blesta_sdk.cli.app import _build_parser
+    from blesta_sdk.cli.commands import batch
+
+    args = _build_parser().parse_args(["batch"])
+    with (
+        patch("sys.stdin", io.StringIO("{}")),
+        patch(
+            "blesta_sdk.cli.commands.batch._build_cli_async_client",
+            side_effect=ImportError("No module named 'httpx'"),
+        ),
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        batch.run(args)
+
+    assert exc_info.value.code == 1
+    error = json.loads(capsys.readouterr().out)["error"]
+    assert "pip install blesta_sdk[async]" in error
+
+
 # ---------------------------------------------------------------------------
 # blesta app legacy mode
 # ---------------------------------------------------------------------------
@@ -619,6 +759,20 @@ def test_app_main_subcommand_dispatch(capsys):
     assert isinstance(models, list)
 
 
+def test_app_help_skips_dotenv():
+    import sys
+
+    from blesta_sdk.cli.app import main
+
+    with (
+        patch("dotenv.load_dotenv") as mock_load,
+        patch.object(sys, "argv", ["blesta", "--help"]),
+        pytest.raises(SystemExit),
+    ):
+        main()
+    mock_load.assert_not_called()
+
+
 def test_app_legacy_missing_creds():
     import sys
 
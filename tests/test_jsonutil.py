@@ -0,0 +1,44 @@
+"""Tests for core/jsonutil.py — orjson fast path with stdlib fallback."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from blesta_sdk.core import jsonutil
+
+
+@pytest.fixture
+def stdlib_only(monkeypatch):
+    """Force the stdlib backend regardless of whether orjson is installed."""
+    monkeypatch.setattr(jsonutil, "orjson", None)
+
+
+def test_loads_str():
+    assert jsonutil.loads('{"response": [1, 2]}') == {"response": [1, 2]}
+
+
+def test_loads_bytes():
+    assert jsonutil.loads(b'{"response": 22376}') == {"response": 22376}
+
+
+def test_loads_invalid_raises_json_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        jsonutil.loads("not json")
+
+
+def test_dumps_returns_compact_str():
+    out = jsonutil.dumps({"response": [1, 2]})
+    assert isinstance(out, str)
+    assert out == '{"response":[1,2]}'
+
+
+def test_stdlib_loads(stdlib_only):
+    assert jsonutil.loads(b'{"a": "b"}') == {"a": "b"}
+    with pytest.raises(json.JSONDecodeError):
+        jsonutil.loads("{")
+
+
+def test_stdlib_dumps_matches_orjson_format(stdlib_only):
+    assert jsonutil.dumps({"a": [1, "x"]}) == '{"a":[1,"x"]}'
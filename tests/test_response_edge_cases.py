@@ -6,12 +6,16 @@ TypeError, or silent misclassification.
 
 from __future__ import annotations
 
+import copy
+import json
+import pickle
 from unittest.mock import patch
 
 import pytest
 
 from blesta_sdk import BlestaResponse
 from blesta_sdk._response import _UNSET
+from blesta_sdk.core import jsonutil
 
 
 def make_response(body: str | None, status: int) -> BlestaResponse:
@@ -129,6 +133,26 @@ class TestMalformedJson200:
         _ = r.is_csv
 
 
+class TestNonJsonPrefilter:
+    """Bodies that cannot start a JSON value skip decoding the whole text."""
+
+    def test_only_leading_prefix_is_decoded(self):
+        r = make_response("\n  <html>" + "x" * 10_000, 200)
+        with patch(
+            "blesta_sdk.core.response.jsonutil.loads",
+            side_effect=json.JSONDecodeError("bad", "", 0),
+        ) as mock_loads:
+            assert r.is_json is False
+        mock_loads.assert_called_once_with("\n  <")
+
+    def test_error_message_matches_full_decode(self):
+        body = "\n\n <html>\n<body>Maintenance</body>\n</html>"
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            jsonutil.loads(body)
+        err = make_response(body, 200).errors()
+        assert err == {"error": f"Invalid JSON response: {exc_info.value}"}
+
+
 # --- Case 5: JSON string containing commas with 200 ---
 
 
@@ -239,14 +263,14 @@ class TestNullBody200:
         assert r.is_json is True
 
     def test_caching_does_not_reparse(self):
-        """Accessing data multiple times must not re-invoke json.loads."""
+        """Accessing data multiple times must not re-invoke the JSON loader."""
         r = make_response(self.BODY, 200)
         # Prime the cache.
         _ = r.data
         # Confirm _parsed is no longer the sentinel.
         assert r._parsed is not _UNSET
-        # Patch json.loads to detect any further calls.
-        with patch("blesta_sdk._response.json.loads") as mock_loads:
+        # Patch the JSON loader to detect any further calls.
+        with patch("blesta_sdk.core.response.jsonutil.loads") as mock_loads:
             _ = r.data
             _ = r.data
             mock_loads.assert_not_called()
@@ -458,7 +482,10 @@ class TestIsCsvCaching:
         assert result1 is True
         # Patch _compute_is_csv to detect any further calls.
         with patch.object(
-            r, "_compute_is_csv", wraps=r._compute_is_csv
+            BlestaResponse,
+            "_compute_is_csv",
+            autospec=True,
+            side_effect=BlestaResponse._compute_is_csv,
         ) as mock_compute:
             result2 = r.is_csv
             result3 = r.is_csv
@@ -473,11 +500,21 @@ class TestIsCsvCaching:
         assert r.is_csv is False
         assert r._is_csv is False
         with patch.object(
-            r, "_compute_is_csv", wraps=r._compute_is_csv
+            BlestaResponse,
+            "_compute_is_csv",
+            autospec=True,
+            side_effect=BlestaResponse._compute_is_csv,
         ) as mock_compute:
             assert r.is_csv is False
             mock_compute.assert_not_called()
 
+    def test_instances_have_no_dict(self):
+        """BlestaResponse uses __slots__; arbitrary attributes are rejected."""
+        r = make_response(self.CSV_BODY, 200)
+        assert not hasattr(r, "__dict__")
+        with pytest.raises(AttributeError):
+            r.extra = 1  # type: ignore[attr-defined]
+
     def test_free_raw_does_not_break_is_csv(self):
         """is_csv must return the correct value after free_raw() clears the body."""
         r = make_response(self.CSV_BODY, 200)
@@ -497,3 +534,94 @@ class TestIsCsvCaching:
         assert r._is_csv is True
         # And is_csv still works after raw is gone.
         assert r.is_csv is True
+
+    def test_is_csv_does_not_parse_csv_as_json(self):
+        """Detection must not run the JSON decoder on a plain CSV body."""
+        r = make_response(self.CSV_BODY, 200)
+        with patch("blesta_sdk.core.response.jsonutil.loads") as mock_loads:
+            assert r.is_csv is True
+            mock_loads.assert_not_called()
+
+    def test_is_csv_handles_carriage_return_line_breaks(self):
+        """Line detection matches str.splitlines for bare-CR bodies."""
+        r = make_response("id,name\r1,Alice", 200)
+        assert r.is_csv is True
+
+    @pytest.mark.parametrize(
+        ("body", "expected"),
+        [
+            ("\n\n  id,name\n1,Alice\n\n", True),
+            ("id,name\n \t\r\n", False),
+            ("   \n\t ", False),
+            ("\nid\nname,1\n", False),
+        ],
+    )
+    def test_is_csv_ignores_surrounding_whitespace(self, body, expected):
+        """Leading/trailing whitespace is skipped as if the body were stripped."""
+        assert make_response(body, 200).is_csv is expected
+
+
+class TestTaggedCsvRows:
+    """_tagged_csv_rows matches csv.DictReader plus a ``_period`` key."""
+
+    @staticmethod
+    def expected(body: str, period: str) -> list[dict]:
+        import csv
+        import io
+
+        return [{**row, "_period": period} for row in csv.DictReader(io.StringIO(body))]
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "id,name\n1,Alice\n\n2,Bob\n",
+            "id,name\n1,Alice\n2\n3,Carol,extra\n",  # ragged rows
+            "id,id,name\n1,2,Alice\n",  # duplicate header
+            "id,_period\n1,stale\n",  # column named _period is overwritten
+            "",
+        ],
+    )
+    def test_matches_dict_reader(self, body):
+        rows, _ = make_response(body, 200)._tagged_csv_rows("2025-01")
+        assert rows == self.expected(body, "2025-01")
+
+    def test_reuses_previous_header(self):
+        first, fieldnames = make_response("id,name\n1,A\n", 200)._tagged_csv_rows(
+            "2025-01"
+        )
+        second, again = make_response("id,name\n2,B\n", 200)._tagged_csv_rows(
+            "2025-02", fieldnames
+        )
+        assert again is fieldnames
+        assert next(iter(second[0])) is next(iter(first[0]))  # shared key str
+        assert second == [{"id": "2", "name": "B", "_period": "2025-02"}]
+
+
+# ---------------------------------------------------------------------------
+# Pickling and copying
+# ---------------------------------------------------------------------------
+
+
+class TestPickleAndCopy:
+    """Responses survive pickle and deepcopy, parsed or not."""
+
+    @pytest.mark.parametrize(
+        "copier",
+        [lambda r: pickle.loads(pickle.dumps(r)), copy.deepcopy],
+        ids=["pickle", "deepcopy"],
+    )
+    @pytest.mark.parametrize("parse_first", [False, True])
+    def test_round_trip(self, copier, parse_first):
+        r = make_response('{"response": 1}', 200)
+        if parse_first:
+            assert r.data == 1
+        clone = copier(r)
+        assert clone.raw == r.raw
+        assert clone.status_code == 200
+        assert clone.headers == {}
+        assert clone.data == 1
+
+    def test_network_error_response_pickles(self):
+        clone = pickle.loads(pickle.dumps(BlestaResponse("Connection refused", 0)))
+        assert clone.status_code == 0
+        assert clone.raw == "Connection refused"
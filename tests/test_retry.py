@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
+import pytest
+
 from blesta_sdk._retry import jitter_delay
 
 
@@ -46,3 +48,61 @@ def test_jitter_delay_max_at_random_one():
 
 def test_jitter_delay_returns_float():
     assert isinstance(jitter_delay(0), float)
+
+
+# --- backoff strategies ---
+
+
+def test_decorrelated_delay_bounds():
+    """Delay is drawn from [base, 3 * previous]."""
+    from blesta_sdk.core.retry import decorrelated_delay
+
+    with patch("blesta_sdk._retry.random.random", return_value=0.0):
+        assert decorrelated_delay(4.0, 1.0) == 1.0
+    with patch("blesta_sdk._retry.random.random", return_value=1.0):
+        assert decorrelated_delay(4.0, 1.0) == 12.0
+
+
+def test_backoff_delay_exponential_scales_by_base_and_caps():
+    from blesta_sdk.core.retry import backoff_delay
+
+    with patch("blesta_sdk._retry.random.random", return_value=1.0):
+        assert backoff_delay(2, 0.0, 0.5, None, "exponential") == 2.0
+        assert backoff_delay(10, 0.0, 1.0, 30.0, "exponential") == 30.0
+
+
+def test_backoff_delay_decorrelated_chains_previous():
+    from blesta_sdk.core.retry import backoff_delay
+
+    delay = 1.0
+    seen = []
+    with patch("blesta_sdk._retry.random.random", return_value=1.0):
+        for attempt in range(4):
+            delay = backoff_delay(attempt, delay, 1.0, 20.0, "decorrelated")
+            seen.append(delay)
+    assert seen == [3.0, 9.0, 20.0, 20.0]
+
+
+def test_retry_after_seconds_parsing():
+    from blesta_sdk.core.retry import retry_after_seconds
+
+    assert retry_after_seconds({"Retry-After": "7"}) == 7
+    assert retry_after_seconds({"Retry-After": "-3"}) == 0
+    assert retry_after_seconds({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+    assert retry_after_seconds({}) == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"retry_base": 0},
+        {"retry_base": 2.0, "retry_cap": 1.0},
+        {"retry_jitter": "full"},
+    ],
+)
+def test_clients_reject_invalid_retry_options(kwargs):
+    from blesta_sdk import AsyncBlestaRequest, BlestaRequest
+
+    for cls in (BlestaRequest, AsyncBlestaRequest):
+        with pytest.raises(ValueError):
+            cls("https://example.com/api", "u", "k", **kwargs)